@@ -18,15 +18,39 @@ Learn OS concepts through gaming mechanics!
 """
 
 import tkinter as tk
+import asyncio
 from tkinter import ttk, messagebox, scrolledtext, simpledialog
 import json
+import getpass
+import queue
+import socket
+import sqlite3
 import random
 import time
 import threading
-from datetime import datetime, timedelta
+import itertools
+import weakref
+from array import array
+from collections import deque, OrderedDict
+from datetime import date, datetime, timedelta
 from typing import Dict, List, Optional
 import math
+import bisect
+import heapq
+import mmap
 import os
+import tempfile
+import zlib
+import sys
+
+try:
+    import numpy as np
+except ImportError:  # Paging and other vectorized simulators are unavailable without NumPy
+    np = None
+
+PAGE_KB = 4
+PAGE_SIZE = PAGE_KB * 1024
+PAGE_SHIFT = 12
 
 class Achievement:
     def __init__(self, id: str, name: str, description: str, icon: str, xp_reward: int):
@@ -38,8 +62,317 @@ class Achievement:
         self.unlocked = False
         self.unlock_time = None
 
+class SlidingWindowCounter:
+    """Sum of the increments added during the last `window` seconds of monotonic time.
+
+    Increments less than `resolution` apart share one deque slot. The
+    deque therefore holds at most window / resolution slots however fast
+    events arrive, and add() and total() are O(1) amortized however long
+    the session runs. A slot expires as a whole, so an increment can leave
+    the window up to `resolution` seconds early.
+    """
+    def __init__(self, window: float, resolution: Optional[float] = None):
+        self.window = window
+        self.resolution = resolution if resolution is not None else window / 120
+        self.slots = deque()  # [slot start time, amount], oldest first
+        self.sum = 0
+
+    def _expire(self, now: float):
+        slots = self.slots
+        horizon = now - self.window
+        while slots and slots[0][0] <= horizon:
+            self.sum -= slots.popleft()[1]
+
+    def add(self, amount: int = 1, now: Optional[float] = None) -> int:
+        """Add an increment and return the window's total"""
+        now = time.monotonic() if now is None else now
+        if self.slots and now - self.slots[-1][0] < self.resolution:
+            self.slots[-1][1] += amount
+        else:
+            self.slots.append([now, amount])
+        self.sum += amount
+        self._expire(now)
+        return self.sum
+
+    def total(self, now: Optional[float] = None) -> int:
+        self._expire(time.monotonic() if now is None else now)
+        return self.sum
+
+    def clear(self):
+        self.slots.clear()
+        self.sum = 0
+
+class AchievementRule:
+    """Unlock condition: an achievement unlocks once `counter` reaches `threshold`.
+
+    With a `window` (seconds) the counter's increments over that trailing
+    window are summed instead of using its value; with `at_most` the
+    counter has to be at or below the threshold.
+    """
+    def __init__(self, achievement_id: str, counter: str, threshold: int, window: Optional[float] = None,
+                 at_most: bool = False):
+        self.achievement_id = achievement_id
+        self.counter = counter
+        self.threshold = threshold
+        self.window = window
+        self.at_most = at_most
+
+    def is_met(self, value) -> bool:
+        return value <= self.threshold if self.at_most else value >= self.threshold
+
+class RuleIndex:
+    """Pending rules on one counter (and window), sorted by threshold so a
+    counter change only bisects to the rules it satisfies"""
+    def __init__(self, window: Optional[float] = None, at_most: bool = False,
+                 rate: Optional[SlidingWindowCounter] = None):
+        self.window = window
+        self.at_most = at_most
+        self.rate = rate  # The counter's increments over `window`, for windowed rules
+        self.thresholds = []
+        self.rules = []
+
+    def add(self, rule: AchievementRule):
+        i = bisect.bisect_right(self.thresholds, rule.threshold)
+        self.thresholds.insert(i, rule.threshold)
+        self.rules.insert(i, rule)
+
+    def pop_met(self, value) -> List[AchievementRule]:
+        """Remove and return the rules that `value` satisfies"""
+        if self.at_most:
+            i = bisect.bisect_left(self.thresholds, value)
+            met = self.rules[i:]
+            del self.thresholds[i:], self.rules[i:]
+        else:
+            i = bisect.bisect_right(self.thresholds, value)
+            met = self.rules[:i]
+            del self.thresholds[:i], self.rules[:i]
+        return met
+
+class EventBus:
+    """Publish/subscribe hub with dirty flags.
+
+    publish() only marks a topic dirty. flush() then calls each subscriber
+    of the dirty topics once, no matter how often or under how many of its
+    topics data changed since the previous flush.
+
+    Every change to game or kernel state is published here, so publish()
+    also enforces that state is only changed on the thread that created the
+    bus (the Tk thread); see WorkerPool for how jobs hand changes back.
+    """
+    def __init__(self):
+        self.owner = threading.get_ident()
+        self.subscribers = {}  # topic -> [callback]
+        self.dirty = {}  # Topics published since the last flush, in publish order
+        self.on_dirty = None  # Called when the first topic after a flush is published
+        self.flushes = 0
+        self.renders = 0
+
+    def subscribe(self, topics, callback):
+        """Call `callback` on flush whenever one of `topics` (a name or names) was published"""
+        for topic in ([topics] if isinstance(topics, str) else topics):
+            self.subscribers.setdefault(topic, []).append(callback)
+
+    def unsubscribe(self, callback):
+        for callbacks in self.subscribers.values():
+            while callback in callbacks:
+                callbacks.remove(callback)
+
+    def publish(self, topic: str):
+        if threading.get_ident() != self.owner:
+            raise RuntimeError(f"'{topic}' changed off the Tk thread; worker jobs must use job.apply()")
+        if topic in self.dirty:
+            return
+        self.dirty[topic] = True
+        if len(self.dirty) == 1 and self.on_dirty is not None:
+            self.on_dirty()
+
+    def flush(self) -> int:
+        """Run the subscribers of every dirty topic once; returns how many ran"""
+        dirty, self.dirty = self.dirty, {}
+        callbacks = {}
+        for topic in dirty:
+            for callback in self.subscribers.get(topic, ()):
+                callbacks[callback] = None
+        for callback in callbacks:
+            callback()
+        self.flushes += 1
+        self.renders += len(callbacks)
+        return len(callbacks)
+
+class NotificationCenter:
+    """Bounded notification history.
+
+    Notifications live in a deque that drops the oldest entry once `capacity`
+    is reached, so posting is O(1). IDs come from a counter and never repeat,
+    even after old entries are dropped. Listeners are called with each new
+    notification as it is posted.
+    """
+    SEVERITIES = ("info", "success", "warning", "error")
+    ICONS = {"info": "ℹ️", "success": "✅", "warning": "⚠️", "error": "❌"}
+
+    def __init__(self, capacity: int = 200):
+        self.items = deque(maxlen=capacity)
+        self.listeners = []
+        self.last_read = 0  # Highest ID the player has seen
+        self._ids = itertools.count(1)
+
+    def post(self, message: str, severity: str = "success") -> Dict:
+        if severity not in self.SEVERITIES:
+            raise ValueError(f"Unknown severity: {severity}")
+        notification = {
+            "message": message,
+            "type": severity,
+            "time": datetime.now(),
+            "id": next(self._ids)
+        }
+        self.items.append(notification)
+        for listener in list(self.listeners):
+            listener(notification)
+        return notification
+
+    def subscribe(self, listener):
+        self.listeners.append(listener)
+
+    def unsubscribe(self, listener):
+        if listener in self.listeners:
+            self.listeners.remove(listener)
+
+    def latest(self) -> Optional[Dict]:
+        return self.items[-1] if self.items else None
+
+    def since(self, notification_id: int) -> List[Dict]:
+        """Notifications posted after `notification_id`, oldest first"""
+        newer = []
+        for notification in reversed(self.items):
+            if notification["id"] <= notification_id:
+                break
+            newer.append(notification)
+        newer.reverse()
+        return newer
+
+    def history(self, min_severity: str = "info", limit: Optional[int] = None) -> List[Dict]:
+        """Notifications at or above `min_severity`, newest first"""
+        floor = self.SEVERITIES.index(min_severity)
+        allowed = set(self.SEVERITIES[floor:])
+        matches = (n for n in reversed(self.items) if n["type"] in allowed)
+        return list(itertools.islice(matches, limit))
+
+    def unread(self) -> int:
+        return len(self.since(self.last_read))
+
+    def mark_read(self):
+        latest = self.latest()
+        if latest is not None:
+            self.last_read = latest["id"]
+
+    def __len__(self):
+        return len(self.items)
+
+    def __iter__(self):
+        return iter(self.items)
+
+class ActivityLog:
+    """Every game action as a typed event, stored column by column.
+
+    Each column is a typed array (timestamp, action code, XP delta,
+    subject), so an event costs 21 bytes. record() clamps timestamps so they
+    never decrease (a wall clock can step back), so time ranges are found
+    by binary search. Per-action totals use bincount over
+    zero-copy NumPy views, or plain loops without NumPy. The
+    subject is a path ID for file system actions (see path()), a PID for
+    process actions and -1 otherwise.
+    """
+    ACTIONS = ("file_create", "dir_create", "file_delete", "explore", "process_create", "process_kill",
+               "command", "game", "achievement", "mission", "level_up")
+    LABELS = {"file_create": "📄 Files created", "dir_create": "📁 Folders created", "file_delete": "🗑️ Items deleted",
+              "explore": "🧭 Exploring", "process_create": "⚙️ Processes started", "process_kill": "💀 Processes killed",
+              "command": "💻 Terminal commands", "game": "🎮 Mini-games", "achievement": "🏆 Achievements",
+              "mission": "🎯 Missions", "level_up": "🎉 Level ups"}
+    PATH_ACTIONS = frozenset({"file_create", "dir_create", "file_delete", "explore"})
+
+    def __init__(self):
+        self.times = array("d")
+        self.actions = array("B")
+        self.xp = array("i")
+        self.subjects = array("q")
+        self.paths = []  # Path ID -> path
+        self._path_ids = {}
+        self._codes = {action: code for code, action in enumerate(self.ACTIONS)}
+
+    def __len__(self):
+        return len(self.times)
+
+    def record(self, action: str, xp: int = 0, subject=None, when: Optional[float] = None):
+        if action in self.PATH_ACTIONS and subject is not None:
+            path_id = self._path_ids.get(subject)
+            if path_id is None:
+                path_id = self._path_ids[subject] = len(self.paths)
+                self.paths.append(subject)
+            subject = path_id
+        when = time.time() if when is None else when
+        if self.times and when < self.times[-1]:
+            when = self.times[-1]
+        self.times.append(when)
+        self.actions.append(self._codes[action])
+        self.xp.append(xp)
+        self.subjects.append(-1 if subject is None else subject)
+
+    def path(self, subject: int) -> str:
+        return self.paths[subject]
+
+    def breakdown(self, since: float = 0.0) -> Dict[str, Dict[str, int]]:
+        """Events and XP per action since a timestamp"""
+        kinds = len(self.ACTIONS)
+        if np is not None:
+            times = np.frombuffer(self.times, dtype=np.float64)
+            start = int(np.searchsorted(times, since))  # Timestamps only grow
+            codes = np.frombuffer(self.actions, dtype=np.uint8)[start:]
+            xp = np.frombuffer(self.xp, dtype=np.int32)[start:]
+            counts = np.bincount(codes, minlength=kinds).tolist()
+            totals = np.bincount(codes, weights=xp, minlength=kinds).astype(np.int64).tolist()
+        else:
+            start = bisect.bisect_left(self.times, since)
+            counts, totals = [0] * kinds, [0] * kinds
+            for code, xp in zip(self.actions[start:], self.xp[start:]):
+                counts[code] += 1
+                totals[code] += xp
+        return {action: {"events": counts[code], "xp": totals[code]}
+                for code, action in enumerate(self.ACTIONS) if counts[code]}
+
+    def hourly(self) -> List[int]:
+        """Events per local hour of day (24 bins)"""
+        offset = time.localtime().tm_gmtoff
+        histogram = [0] * 24
+        start = 0
+        while start < len(self.times):
+            # Bisect to the end of this event's hour; costs O(log n) per hour with activity
+            hour = int((self.times[start] + offset) // 3600)
+            end = bisect.bisect_left(self.times, (hour + 1) * 3600 - offset, start)
+            histogram[hour % 24] += end - start
+            start = end
+        return histogram
+
+    def trend(self, bucket_seconds: int = 3600, buckets: int = 12, now: Optional[float] = None) -> List[int]:
+        """XP earned per bucket over the last `buckets` buckets, oldest first"""
+        now = time.time() if now is None else now
+        since = now - bucket_seconds * buckets
+        if np is not None:
+            times = np.frombuffer(self.times, dtype=np.float64)
+            start = int(np.searchsorted(times, since))
+            index = ((times[start:] - since) // bucket_seconds).astype(np.intp)
+            xp = np.frombuffer(self.xp, dtype=np.int32)[start:]
+            keep = index < buckets
+            return np.bincount(index[keep], weights=xp[keep], minlength=buckets).astype(np.int64).tolist()
+        totals = [0] * buckets
+        for i in range(bisect.bisect_left(self.times, since), len(self.times)):
+            bucket = int((self.times[i] - since) // bucket_seconds)
+            if bucket < buckets:
+                totals[bucket] += self.xp[i]
+        return totals
+
 class Mission:
-    def __init__(self, id: str, name: str, description: str, xp_reward: int, difficulty: str, target: int = 1):
+    def __init__(self, id: str, name: str, description: str, xp_reward: int, difficulty: str, target: int = 1,
+                 counter: Optional[str] = None, window: Optional[float] = None):
         self.id = id
         self.name = name
         self.description = description
@@ -48,6 +381,9 @@ class Mission:
         self.completed = False
         self.progress = 0
         self.target = target
+        # Rate missions: progress is `counter`'s increments over the last `window` seconds
+        self.counter = counter
+        self.window = window
 
 class GameStats:
     def __init__(self):
@@ -67,6 +403,13 @@ class GameStats:
         self.time_played = 0
         self.directories_explored = set()
         self.challenge_streak = 0
+        self.highest_memory_usage = 0
+        self.actions = 0  # Player actions, for rate-based achievements
+        self.processes_running = 0
+        self.perfect_days = 0  # Days on which every daily mission was completed
+        self.play_days = []  # Sorted ISO dates the game was played on; the login streak is computed from them
+        self.mission_day = None  # ISO date the active missions were drawn for
+        self.listener = None  # Called with the name of each counter add_xp changes
 
     def add_xp(self, amount: int):
         self.xp += amount
@@ -76,52 +419,115 @@ class GameStats:
         old_level = self.level
         self.level = int(math.sqrt(self.total_xp / 100)) + 1
 
+        if self.listener is not None:
+            self.listener("total_xp")
+            if self.level > old_level:
+                self.listener("level")
         return self.level > old_level
 
 class GameManager:
+    # Counters whose increments count as player actions
+    ACTION_COUNTERS = frozenset({"files_created", "files_deleted", "directories_created",
+                                 "processes_created", "processes_killed", "commands_executed"})
+    DAILY_MISSIONS = 3
+    MISSION_WEIGHTS = {"Easy": 3, "Medium": 2, "Hard": 1}  # Relative odds of a mission being drawn
+
     def __init__(self):
         self.stats = GameStats()
+        self.stats.listener = self.counter_changed
         self.achievements = {}
+        self.rules = {}  # achievement id -> AchievementRule
+        self._rule_index = {}  # counter -> {(window, at_most): RuleIndex}
+        self.gauges = {}  # Counters that are not game stats, such as the hour of day
+        self._rates = {}  # (counter, window) -> shared SlidingWindowCounter
+        self._rate_feeds = {}  # counter -> [SlidingWindowCounter] fed by bump()
+        self.on_action = None  # Called with (action, subject) for every awarded game action
+        self.events = EventBus()  # Topics: stats, missions, achievements, notifications, processes, memory, files
+        self.activity = ActivityLog()
         self.missions = []
         self.active_missions = []
-        self.notifications = []
+        self._missions_by_id = {}  # mission id -> active Mission
+        self.mission_rerolls = 0  # Redraws requested today
+        self.notifications = NotificationCenter()
+        self.notifications.subscribe(lambda notification: self.events.publish("notifications"))
         self.game_start_time = datetime.now()
         self.last_activity = datetime.now()
 
         self._initialize_achievements()
-        self._generate_daily_missions()
+        self.start_day(date.today())
 
     def _initialize_achievements(self):
         """Initialize all achievements"""
+        # (id, name, description, icon, xp, counter, threshold[, window seconds[, at_most]])
         achievements_list = [
-            ("first_steps", "First Steps", "Create your first file", "📄", 50),
-            ("builder", "Builder", "Create your first directory", "📁", 50),
-            ("taskmaster", "Taskmaster", "Create your first process", "⚙️", 75),
-            ("productive", "Productive", "Create 10 files", "📚", 200),
-            ("architect", "Architect", "Create 5 directories", "🏗️", 150),
-            ("terminal_rookie", "Terminal Rookie", "Execute 25 commands", "💻", 200),
-            ("terminal_expert", "Terminal Expert", "Execute 100 commands", "🖥️", 500),
-            ("cleaner", "Cleaner", "Delete 10 files", "🧹", 150),
-            ("explorer", "Explorer", "Visit 10 different directories", "🗺️", 200),
-            ("speed_demon", "Speed Demon", "Complete 5 actions in 1 minute", "⚡", 300),
-            ("night_owl", "Night Owl", "Use system after 11 PM", "🦉", 100),
-            ("early_bird", "Early Bird", "Use system before 7 AM", "🐦", 100),
-            ("dedication", "Dedication", "Login for 5 consecutive days", "🔥", 500),
-            ("multitasker", "Multitasker", "Have 8 processes running", "🔀", 400),
-            ("system_admin", "System Admin", "Reach level 5", "👑", 1000),
-            ("master_admin", "Master Admin", "Reach level 10", "💎", 2000),
-            ("completionist", "Completionist", "Complete 20 missions", "✅", 800),
-            ("gamer", "Gamer", "Play 5 mini-games", "🎮", 300),
-            ("efficiency", "Efficiency Expert", "Complete mission with 100% accuracy", "🎯", 400),
-            ("legendary", "Legendary User", "Unlock 15 achievements", "🌟", 1500),
+            ("first_steps", "First Steps", "Create your first file", "📄", 50, "files_created", 1),
+            ("builder", "Builder", "Create your first directory", "📁", 50, "directories_created", 1),
+            ("taskmaster", "Taskmaster", "Create your first process", "⚙️", 75, "processes_created", 1),
+            ("productive", "Productive", "Create 10 files", "📚", 200, "files_created", 10),
+            ("architect", "Architect", "Create 5 directories", "🏗️", 150, "directories_created", 5),
+            ("terminal_rookie", "Terminal Rookie", "Execute 25 commands", "💻", 200, "commands_executed", 25),
+            ("terminal_expert", "Terminal Expert", "Execute 100 commands", "🖥️", 500, "commands_executed", 100),
+            ("cleaner", "Cleaner", "Delete 10 files", "🧹", 150, "files_deleted", 10),
+            ("explorer", "Explorer", "Visit 10 different directories", "🗺️", 200, "directories_explored", 10),
+            ("speed_demon", "Speed Demon", "Complete 5 actions in 1 minute", "⚡", 300, "actions", 5, 60),
+            ("night_owl", "Night Owl", "Use system after 11 PM", "🦉", 100, "hour", 23),
+            ("early_bird", "Early Bird", "Use system before 7 AM", "🐦", 100, "hour", 7, None, True),
+            ("dedication", "Dedication", "Login for 5 consecutive days", "🔥", 500, "login_streak", 5),
+            ("multitasker", "Multitasker", "Have 8 processes running", "🔀", 400, "processes_running", 8),
+            ("system_admin", "System Admin", "Reach level 5", "👑", 1000, "level", 5),
+            ("master_admin", "Master Admin", "Reach level 10", "💎", 2000, "level", 10),
+            ("completionist", "Completionist", "Complete 20 missions", "✅", 800, "missions_completed", 20),
+            ("gamer", "Gamer", "Play 5 mini-games", "🎮", 300, "games_played", 5),
+            ("efficiency", "Efficiency Expert", "Complete every daily mission", "🎯", 400, "perfect_days", 1),
+            ("legendary", "Legendary User", "Unlock 15 achievements", "🌟", 1500, "achievements_unlocked", 15),
         ]
 
         for data in achievements_list:
-            achievement = Achievement(*data)
-            self.achievements[achievement.id] = achievement
+            self.add_achievement(Achievement(*data[:5]), AchievementRule(data[0], *data[5:]))
+
+    def add_achievement(self, achievement: Achievement, rule: AchievementRule):
+        """Register an achievement and index its rule under the counter it watches"""
+        self.achievements[achievement.id] = achievement
+        self.rules[achievement.id] = rule
+        indexes = self._rule_index.setdefault(rule.counter, {})
+        key = (rule.window, rule.at_most)
+        if key not in indexes:
+            rate = self.rate(rule.counter, rule.window) if rule.window is not None else None
+            indexes[key] = RuleIndex(rule.window, rule.at_most, rate)
+        indexes[key].add(rule)
+
+    def start_day(self, day: date) -> bool:
+        """Record a session on `day`, update the login streak and draw the day's missions;
+        returns True if the missions rotated"""
+        stats = self.stats
+        key = day.isoformat()
+        position = bisect.bisect_left(stats.play_days, key)
+        if position == len(stats.play_days) or stats.play_days[position] != key:
+            stats.play_days = stats.play_days[:position] + [key] + stats.play_days[position:]
+            self.events.publish("stats")
+
+        streak = 0
+        expected = day
+        for played in reversed(stats.play_days[:position + 1]):
+            if played != expected.isoformat():
+                break
+            streak += 1
+            expected -= timedelta(days=1)
+        self.set_counter("login_streak", streak)
+
+        if stats.mission_day == key:
+            return False
+        self.mission_rerolls = 0
+        self._generate_daily_missions(day)
+        return True
+
+    def reroll_missions(self):
+        """Draw a different set of missions for today"""
+        self.mission_rerolls += 1
+        self._generate_daily_missions(date.today(), self.mission_rerolls)
 
-    def _generate_daily_missions(self):
-        """Generate daily missions"""
+    def _generate_daily_missions(self, day: date, reroll: int = 0):
+        """Generate daily missions: a weighted draw seeded by the day, so a day always gets the same set"""
         mission_templates = [
             ("create_files", "File Creator", "Create 5 new files", 150, "Easy", 5),
             ("organize_files", "Organizer", "Create 3 directories and organize files", 200, "Medium", 3),
@@ -130,80 +536,131 @@ class GameManager:
             ("terminal_warrior", "Terminal Warrior", "Execute 20 terminal commands", 300, "Medium", 20),
             ("cleanup_mission", "Cleanup Crew", "Delete 8 old files", 120, "Easy", 8),
             ("system_monitor", "System Monitor", "Check system stats 5 times", 100, "Easy", 5),
-            ("efficiency_test", "Efficiency Test", "Complete 10 tasks in 3 minutes", 400, "Hard", 10),
-            ("memory_manager", "Memory Manager", "Monitor memory usage for 5 minutes", 200, "Medium", 1),
+            ("efficiency_test", "Efficiency Test", "Complete 10 tasks in 3 minutes", 400, "Hard", 10, "actions", 180),
+            ("memory_manager", "Memory Manager", "Compare page replacement in the Page Lab 3 times", 200, "Medium", 3),
             ("backup_task", "Backup Task", "Copy 6 files to backup folder", 250, "Medium", 6),
         ]
 
-        # Select 3 random missions for the day
-        selected = random.sample(mission_templates, 3)
+        # Weighted sampling without replacement: keep the largest random() ** (1 / weight)
+        rng = random.Random(f"{day.isoformat()}/{reroll}")
+        selected = sorted(mission_templates, reverse=True,
+                          key=lambda data: rng.random() ** (1 / self.MISSION_WEIGHTS[data[4]]))
+        self.clear_missions()
+        for data in selected[:self.DAILY_MISSIONS]:
+            self.add_mission(Mission(*data))
+        self.stats.mission_day = day.isoformat()
+        self.events.publish("missions")
+
+    def clear_missions(self):
         self.active_missions = []
+        self._missions_by_id = {}
 
-        for data in selected:
-            mission = Mission(*data)
-            self.active_missions.append(mission)
+    def add_mission(self, mission: Mission):
+        """Make a mission active, starting its rate window if it has one"""
+        if mission.window is not None:
+            self.rate(mission.counter, mission.window)
+        self.active_missions.append(mission)
+        self._missions_by_id[mission.id] = mission
 
     def add_notification(self, message: str, type: str = "success"):
         """Add a notification"""
-        notification = {
-            "message": message,
-            "type": type,
-            "time": datetime.now(),
-            "id": len(self.notifications)
-        }
-        self.notifications.append(notification)
+        return self.notifications.post(message, type)
+
+    def award(self, action: str, xp: int, subject=None) -> bool:
+        """Give XP for a game action and record it in the activity log; returns True on level up"""
+        self.activity.record(action, xp, subject)
+        if self.on_action is not None:
+            self.on_action(action, subject)
+        leveled_up = self.stats.add_xp(xp)
+        if leveled_up:
+            self.activity.record("level_up")
+        return leveled_up
+
+    def counter_value(self, counter: str):
+        """Current value of a game stat or gauge (sets count their members)"""
+        value = getattr(self.stats, counter, None)
+        if value is None:
+            value = self.gauges.get(counter)
+        return len(value) if isinstance(value, set) else value
+
+    def rate(self, counter: str, window: float) -> SlidingWindowCounter:
+        """The shared sliding-window total of a counter's increments"""
+        rate = self._rates.get((counter, window))
+        if rate is None:
+            rate = self._rates[(counter, window)] = self.track(counter, window)
+        return rate
+
+    def track(self, counter: str, window: float) -> SlidingWindowCounter:
+        """A private sliding-window total of a counter's increments from now on"""
+        rate = SlidingWindowCounter(window)
+        self._rate_feeds.setdefault(counter, []).append(rate)
+        return rate
+
+    def bump(self, counter: str, amount: int = 1):
+        """Add to a counter and evaluate the rules watching it"""
+        if hasattr(self.stats, counter):
+            setattr(self.stats, counter, getattr(self.stats, counter) + amount)
+        else:
+            self.gauges[counter] = self.gauges.get(counter, 0) + amount
+        self.events.publish("stats")
+        if amount > 0 and counter in self._rate_feeds:
+            now = time.monotonic()
+            for rate in self._rate_feeds[counter]:
+                rate.add(amount, now)
+            self.update_rate_missions(counter, now)
+        self._evaluate_rules(counter, amount)
+        if amount > 0 and counter in self.ACTION_COUNTERS:
+            self.bump("actions", amount)
+
+    def set_counter(self, counter: str, value):
+        """Set a gauge-like counter (level, hour of day...) and evaluate its rules"""
+        if self.counter_value(counter) == value:
+            return
+        if hasattr(self.stats, counter):
+            setattr(self.stats, counter, value)
+        else:
+            self.gauges[counter] = value
+        self.events.publish("stats")
+        self._evaluate_rules(counter)
+
+    def counter_changed(self, counter: str):
+        """Evaluate the rules on a counter the caller changed in place"""
+        self.events.publish("stats")
+        self._evaluate_rules(counter)
+
+    def _evaluate_rules(self, counter: str, amount: int = 0):
+        indexes = self._rule_index.get(counter)
+        if not indexes:
+            return
 
-        # Keep only last 10 notifications
-        if len(self.notifications) > 10:
-            self.notifications.pop(0)
+        value = self.counter_value(counter)
+        now = time.monotonic()
+        met = []
+        for key, index in list(indexes.items()):
+            if index.window is None:
+                met.extend(index.pop_met(value))
+            elif amount > 0:
+                met.extend(index.pop_met(index.rate.total(now)))
+            if not index.rules:
+                del indexes[key]
+        if not indexes:
+            del self._rule_index[counter]
+
+        for rule in met:
+            if not self.achievements[rule.achievement_id].unlocked:
+                self.unlock_achievement(rule.achievement_id)
 
     def check_achievement(self, achievement_id: str):
         """Check and unlock achievement if conditions are met"""
-        if achievement_id not in self.achievements or self.achievements[achievement_id].unlocked:
+        rule = self.rules.get(achievement_id)
+        if rule is None or self.achievements[achievement_id].unlocked:
             return
 
-        achievement = self.achievements[achievement_id]
-        should_unlock = False
-
-        # Check conditions
-        if achievement_id == "first_steps" and self.stats.files_created >= 1:
-            should_unlock = True
-        elif achievement_id == "builder" and self.stats.directories_created >= 1:
-            should_unlock = True
-        elif achievement_id == "taskmaster" and self.stats.processes_created >= 1:
-            should_unlock = True
-        elif achievement_id == "productive" and self.stats.files_created >= 10:
-            should_unlock = True
-        elif achievement_id == "architect" and self.stats.directories_created >= 5:
-            should_unlock = True
-        elif achievement_id == "terminal_rookie" and self.stats.commands_executed >= 25:
-            should_unlock = True
-        elif achievement_id == "terminal_expert" and self.stats.commands_executed >= 100:
-            should_unlock = True
-        elif achievement_id == "cleaner" and self.stats.files_deleted >= 10:
-            should_unlock = True
-        elif achievement_id == "explorer" and len(self.stats.directories_explored) >= 10:
-            should_unlock = True
-        elif achievement_id == "system_admin" and self.stats.level >= 5:
-            should_unlock = True
-        elif achievement_id == "master_admin" and self.stats.level >= 10:
-            should_unlock = True
-        elif achievement_id == "completionist" and self.stats.missions_completed >= 20:
-            should_unlock = True
-        elif achievement_id == "gamer" and self.stats.games_played >= 5:
-            should_unlock = True
-        elif achievement_id == "legendary" and self.stats.achievements_unlocked >= 15:
-            should_unlock = True
-        elif achievement_id == "dedication" and self.stats.login_streak >= 5:
-            should_unlock = True
-        elif achievement_id == "night_owl":
-            hour = datetime.now().hour
-            should_unlock = hour >= 23
-        elif achievement_id == "early_bird":
-            hour = datetime.now().hour
-            should_unlock = hour <= 7
-
-        if should_unlock:
+        if rule.window is None:
+            value = self.counter_value(rule.counter)
+        else:
+            value = self.rate(rule.counter, rule.window).total()
+        if value is not None and rule.is_met(value):
             self.unlock_achievement(achievement_id)
 
     def unlock_achievement(self, achievement_id: str):
@@ -211,10 +668,10 @@ class GameManager:
         achievement = self.achievements[achievement_id]
         achievement.unlocked = True
         achievement.unlock_time = datetime.now()
+        self.events.publish("achievements")
 
         # Award XP
-        leveled_up = self.stats.add_xp(achievement.xp_reward)
-        self.stats.achievements_unlocked += 1
+        leveled_up = self.award("achievement", achievement.xp_reward)
 
         # Notification
         message = f"🏆 Achievement Unlocked: {achievement.name} (+{achievement.xp_reward} XP)"
@@ -224,21 +681,34 @@ class GameManager:
         self.add_notification(message)
 
         # Check for more achievements
-        self.check_achievement("legendary")
+        self.bump("achievements_unlocked")
 
     def update_mission_progress(self, mission_type: str, amount: int = 1):
         """Update mission progress"""
+        mission = self._missions_by_id.get(mission_type)
+        if mission is None or mission.completed:
+            return
+        mission.progress = min(mission.progress + amount, mission.target)
+        self.events.publish("missions")
+        if mission.progress >= mission.target:
+            self.complete_mission(mission)
+
+    def update_rate_missions(self, counter: Optional[str] = None, now: Optional[float] = None):
+        """Set rate missions' progress to their current window totals (all of them without `counter`)"""
         for mission in self.active_missions:
-            if not mission.completed and mission.id == mission_type:
-                mission.progress = min(mission.progress + amount, mission.target)
-                if mission.progress >= mission.target:
-                    self.complete_mission(mission)
+            if mission.completed or mission.window is None or counter not in (None, mission.counter):
+                continue
+            progress = min(self.rate(mission.counter, mission.window).total(now), mission.target)
+            if progress != mission.progress:
+                mission.progress = progress
+                self.events.publish("missions")
+            if progress >= mission.target:
+                self.complete_mission(mission)
 
     def complete_mission(self, mission: Mission):
         """Complete a mission"""
         mission.completed = True
-        leveled_up = self.stats.add_xp(mission.xp_reward)
-        self.stats.missions_completed += 1
+        leveled_up = self.award("mission", mission.xp_reward)
 
         message = f"✅ Mission Complete: {mission.name} (+{mission.xp_reward} XP)"
         if leveled_up:
@@ -247,7 +717,9 @@ class GameManager:
         self.add_notification(message)
 
         # Check achievements
-        self.check_achievement("completionist")
+        self.bump("missions_completed")
+        if all(m.completed for m in self.active_missions):
+            self.bump("perfect_days")
 
     def get_level_progress(self):
         """Get current level progress"""
@@ -263,11 +735,18 @@ class GameManager:
         }
 
 class GameFileSystem:
-    def __init__(self, game_manager):
+    def __init__(self, game_manager, memory_manager=None, disk=None):
         self.game_manager = game_manager
+        self.memory_manager = memory_manager  # Backs inodes with the kernel slab cache when set
+        self.disk = disk  # Block reads and writes go through its I/O queue when set
+        self.journal = None  # Called with a record of every mkdir, file write and rm
+        self.generation = 0  # Bumped on every change to the tree, to invalidate cached listings
+        self._listing = (None, [])  # (key, sorted and filtered names) of the last paged listing
         self.root = {
             "type": "directory",
             "contents": {},
+            "inode": self._alloc_inode(),
+            "blocks": self._alloc_blocks("/", 1),
             "created": datetime.now().isoformat(),
             "modified": datetime.now().isoformat()
         }
@@ -407,6 +886,32 @@ Ready to start your gaming adventure!"""
                 return None
         return current
 
+    def _alloc_inode(self) -> Optional[int]:
+        if self.memory_manager is None:
+            return None
+        return self.memory_manager.alloc_object("inode")
+
+    def _alloc_blocks(self, parent_path: str, count: int) -> List[int]:
+        """Disk blocks for a new node, placed in its parent directory's cylinder group"""
+        if self.disk is None:
+            return []
+        return self.disk.allocate_blocks(count, self.disk.group_start(parent_path)) or []
+
+    def _disk_io(self, item: Dict, write: bool = False):
+        if self.disk is not None and item.get("blocks"):
+            self.disk.submit(item["blocks"], write)
+
+    def _release(self, item: Dict):
+        """Release the inodes and disk blocks of an item and everything below it"""
+        stack = [item]
+        while stack:
+            node = stack.pop()
+            if self.memory_manager is not None and node.get("inode") is not None:
+                self.memory_manager.free_object("inode", node["inode"])
+            if self.disk is not None and node.get("blocks"):
+                self.disk.free_blocks(node["blocks"])
+            stack.extend(node.get("contents", {}).values())
+
     def mkdir(self, path: str, game_action: bool = True) -> bool:
         """Create directory with game mechanics"""
         try:
@@ -420,24 +925,35 @@ Ready to start your gaming adventure!"""
             if "contents" not in parent:
                 parent["contents"] = {}
 
+            inode = self._alloc_inode()
+            if inode is None and self.memory_manager is not None:
+                return False  # Out of inodes
+            if dir_name in parent["contents"]:
+                self._release(parent["contents"][dir_name])
+
             parent["contents"][dir_name] = {
                 "type": "directory", 
                 "contents": {},
+                "inode": inode,
+                "blocks": self._alloc_blocks(parent_path, 1),
                 "created": datetime.now().isoformat(),
                 "modified": datetime.now().isoformat()
             }
+            self._disk_io(parent["contents"][dir_name], write=True)
+            self.generation += 1
+            self.game_manager.events.publish("files")
+            if self.journal is not None:
+                self.journal({"op": "mkdir", "path": path})
 
             if game_action:
                 # Game mechanics
-                self.game_manager.stats.directories_created += 1
-                leveled_up = self.game_manager.stats.add_xp(25)
+                leveled_up = self.game_manager.award("dir_create", 25, path)
 
                 if leveled_up:
                     self.game_manager.add_notification(f"🎉 LEVEL UP! Now Level {self.game_manager.stats.level}!")
 
                 # Check achievements
-                self.game_manager.check_achievement("builder")
-                self.game_manager.check_achievement("architect")
+                self.game_manager.bump("directories_created")
 
                 # Update missions
                 self.game_manager.update_mission_progress("organize_files")
@@ -459,25 +975,37 @@ Ready to start your gaming adventure!"""
             if "contents" not in parent:
                 parent["contents"] = {}
 
+            inode = self._alloc_inode()
+            if inode is None and self.memory_manager is not None:
+                return False  # Out of inodes
+            if file_name in parent["contents"]:
+                self._release(parent["contents"][file_name])
+
+            block_count = max(1, -(-len(content) // Disk.BLOCK_SIZE))
             parent["contents"][file_name] = {
                 "type": "file",
                 "content": content,
+                "inode": inode,
+                "blocks": self._alloc_blocks(parent_path, block_count),
                 "size": len(content),
                 "created": datetime.now().isoformat(),
                 "modified": datetime.now().isoformat()
             }
+            self._disk_io(parent["contents"][file_name], write=True)
+            self.generation += 1
+            self.game_manager.events.publish("files")
+            if self.journal is not None:
+                self.journal({"op": "write", "path": path, "content": content})
 
             if game_action:
                 # Game mechanics
-                self.game_manager.stats.files_created += 1
-                leveled_up = self.game_manager.stats.add_xp(10)
+                leveled_up = self.game_manager.award("file_create", 10, path)
 
                 if leveled_up:
                     self.game_manager.add_notification(f"🎉 LEVEL UP! Now Level {self.game_manager.stats.level}!")
 
                 # Check achievements
-                self.game_manager.check_achievement("first_steps")
-                self.game_manager.check_achievement("productive")
+                self.game_manager.bump("files_created")
 
                 # Update missions
                 self.game_manager.update_mission_progress("create_files")
@@ -487,7 +1015,7 @@ Ready to start your gaming adventure!"""
         except Exception as e:
             return False
 
-    def rm(self, path: str) -> bool:
+    def rm(self, path: str, game_action: bool = True) -> bool:
         """Remove with game mechanics"""
         try:
             parent_path = "/".join(path.split("/")[:-1]) or "/"
@@ -497,17 +1025,22 @@ Ready to start your gaming adventure!"""
             if parent and item_name in parent.get("contents", {}):
                 item = parent["contents"][item_name]
                 del parent["contents"][item_name]
+                self._release(item)
+                self._disk_io(parent, write=True)  # Directory entry update
+                self.generation += 1
+                self.game_manager.events.publish("files")
+                if self.journal is not None:
+                    self.journal({"op": "rm", "path": path})
 
                 # Game mechanics
-                if item["type"] == "file":
-                    self.game_manager.stats.files_deleted += 1
-                    leveled_up = self.game_manager.stats.add_xp(5)
+                if game_action and item["type"] == "file":
+                    leveled_up = self.game_manager.award("file_delete", 5, path)
 
                     if leveled_up:
                         self.game_manager.add_notification(f"🎉 LEVEL UP! Now Level {self.game_manager.stats.level}!")
 
                     # Check achievements
-                    self.game_manager.check_achievement("cleaner")
+                    self.game_manager.bump("files_deleted")
 
                     # Update missions
                     self.game_manager.update_mission_progress("cleanup_mission")
@@ -539,12 +1072,14 @@ Ready to start your gaming adventure!"""
                     success = False
 
             if success and old_path != self.current_path:
+                self.game_manager.events.publish("files")
+
                 # Track exploration
                 self.game_manager.stats.directories_explored.add(self.current_path)
-                self.game_manager.stats.add_xp(2)
+                self.game_manager.award("explore", 2, self.current_path)
 
                 # Check achievements
-                self.game_manager.check_achievement("explorer")
+                self.game_manager.counter_changed("directories_explored")
 
                 # Update missions
                 self.game_manager.update_mission_progress("explorer_mission")
@@ -553,6 +1088,30 @@ Ready to start your gaming adventure!"""
         except:
             return False
 
+    def create_files(self, files: List[tuple]) -> int:
+        """Create a batch of (path, content) files without game mechanics; returns how many were created"""
+        return sum(self.create_file(path, content, game_action=False) for path, content in files)
+
+    def walk(self):
+        """Yield (path, node) for every node below the root, parents before children"""
+        stack = [("", self.root)]
+        while stack:
+            prefix, node = stack.pop()
+            for name, child in reversed(list(node.get("contents", {}).items())):
+                path = f"{prefix}/{name}"
+                yield path, child
+                if child["type"] == "directory":
+                    stack.append((path, child))
+
+    def clear(self):
+        """Remove everything below the root without game mechanics"""
+        for item in self.root["contents"].values():
+            self._release(item)
+        self.root["contents"] = {}
+        self.current_path = "/"
+        self.generation += 1
+        self.game_manager.events.publish("files")
+
     def ls(self, path: str = None) -> List[Dict]:
         """List directory contents"""
         try:
@@ -575,6 +1134,58 @@ Ready to start your gaming adventure!"""
         except:
             return []
 
+    # Sort orders for ls_page: entry -> sort key
+    LISTING_SORTS = {
+        "name": lambda name, item: name,
+        "type": lambda name, item: (item["type"] != "directory", name),
+        "size": lambda name, item: item.get("size", len(item.get("contents", {}))),
+        "modified": lambda name, item: item.get("modified", ""),
+    }
+
+    def ls_page(self, path: str = None, offset: int = 0, limit: int = 100, sort: str = "name",
+                descending: bool = False, pattern: str = "") -> tuple:
+        """One page of a sorted, filtered directory listing: (matching entries, [entry])
+
+        The sorted names are cached until the tree changes, so paging through
+        a large directory only builds the entries on the requested page.
+        """
+        target = self._navigate_to_path(self.current_path if path is None else path)
+        if target is None or target.get("type") != "directory":
+            return 0, []
+        contents = target.get("contents", {})
+        names = self._sorted_names(target, sort, descending, pattern)
+
+        page = []
+        for name in names[offset:offset + limit]:
+            item = contents[name]
+            page.append({
+                "name": name,
+                "type": item["type"],
+                "size": item.get("size", len(item.get("contents", {}))),
+                "modified": item.get("modified", "")[:16]
+            })
+        return len(names), page
+
+    def ls_snapshot(self, path: str = None, sort: str = "name") -> Optional[tuple]:
+        """(contents, sorted names) of a directory as of now, for listings consumed over time"""
+        target = self._navigate_to_path(self.current_path if path is None else path)
+        if target is None or target.get("type") != "directory":
+            return None
+        return target.get("contents", {}), list(self._sorted_names(target, sort))
+
+    def _sorted_names(self, target: Dict, sort: str = "name", descending: bool = False,
+                      pattern: str = "") -> List[str]:
+        """Sorted, filtered names of a directory node, cached until the tree changes"""
+        key = (id(target), self.generation, sort, descending, pattern)
+        if self._listing[0] != key:
+            contents = target.get("contents", {})
+            sort_key = self.LISTING_SORTS[sort]
+            needle = pattern.lower()
+            names = [name for name in contents if needle in name.lower()] if needle else list(contents)
+            names.sort(key=lambda name: sort_key(name, contents[name]), reverse=descending)
+            self._listing = (key, names)
+        return self._listing[1]
+
     def cat(self, path: str) -> Optional[str]:
         """Read file content"""
         try:
@@ -588,6 +1199,7 @@ Ready to start your gaming adventure!"""
             if parent and file_name in parent.get("contents", {}):
                 item = parent["contents"][file_name]
                 if item["type"] == "file":
+                    self._disk_io(item)
                     return item.get("content", "")
             return None
         except:
@@ -1003,69 +1615,489 @@ print("✅ Part 2 complete - Game GUI framework created!")# Part 2: GameOS GUI w
 owner - Samruddha Belsare
 Github - https://github.com/samruddhabelsare
 """
+# Simulated signals (Linux numbering)
+SIGINT = 2
+SIGKILL = 9
+SIGTERM = 15
+SIGCHLD = 17
+SIGCONT = 18
+SIGSTOP = 19
+
+SIGNAL_NAMES = {SIGINT: "SIGINT", SIGKILL: "SIGKILL", SIGTERM: "SIGTERM",
+                SIGCHLD: "SIGCHLD", SIGCONT: "SIGCONT", SIGSTOP: "SIGSTOP"}
+SIGNAL_DEFAULT_ACTIONS = {SIGINT: "term", SIGKILL: "term", SIGTERM: "term",
+                          SIGCHLD: "ignore", SIGCONT: "cont", SIGSTOP: "stop"}
+UNBLOCKABLE_SIGNALS = (1 << SIGKILL) | (1 << SIGSTOP)
+
+def parse_signal(text: str) -> Optional[int]:
+    """Parse '9', 'KILL' or 'SIGKILL' into a signal number"""
+    text = text.upper().lstrip("-")
+    if text.isdigit():
+        return int(text) if int(text) in SIGNAL_NAMES else None
+    if not text.startswith("SIG"):
+        text = "SIG" + text
+    for number, name in SIGNAL_NAMES.items():
+        if name == text:
+            return number
+    return None
+
 class GameProcess:
-    def __init__(self, pid: int, name: str, command: str, game_manager):
+    def __init__(self, pid: int, name: str, command: str, game_manager, task=None, ppid: int = 1,
+                 memory_usage: Optional[int] = None):
         self.pid = pid
+        self.ppid = ppid
         self.name = name
         self.command = command
         self.state = "ready"
-        self.memory_usage = random.randint(100, 500)
+        self.memory_usage = memory_usage if memory_usage is not None else random.randint(100, 500)
         self.cpu_time = 0
         self.created = datetime.now()
         self.game_manager = game_manager
+        self.task = task  # Generator of syscalls run by the scheduler, None for idle processes
+
+        # Signal state: bitmasks indexed by signal number plus a handler table
+        self.pending_signals = 0
+        self.blocked_signals = 0
+        self.signal_handlers = {}  # signal -> "default", "ignore" or callable(process, signal)
+        self.resume_state = None  # State to return to on SIGCONT
+        self.exit_signal = None
+
+class SimMutex:
+    """Simulated mutex with a FIFO wait queue and direct hand-off to waiters"""
+    def __init__(self, name: str = "mutex"):
+        self.name = name
+        self.owner = None
+        self.waiters = deque()
+        self.contentions = 0
+
+    def acquire(self, pid: int) -> bool:
+        """Take the lock, or queue the caller and report that it must block"""
+        if self.owner is None:
+            self.owner = pid
+            return True
+        self.contentions += 1
+        self.waiters.append(pid)
+        return False
+
+    def release(self, pid: int) -> Optional[int]:
+        """Release the lock, handing it to the next waiter (whose pid is returned)"""
+        if self.owner != pid:
+            return None
+        self.owner = self.waiters.popleft() if self.waiters else None
+        return self.owner
+
+    def cancel(self, pid: int) -> List[int]:
+        """Forget a process that exited, releasing the lock if it held it"""
+        if pid in self.waiters:
+            self.waiters.remove(pid)
+        if self.owner == pid:
+            woken = self.release(pid)
+            return [woken] if woken is not None else []
+        return []
+
+class SimSemaphore:
+    """Simulated counting semaphore"""
+    def __init__(self, value: int = 1, name: str = "semaphore"):
+        self.name = name
+        self.value = value
+        self.waiters = deque()
+
+    def wait(self, pid: int) -> bool:
+        """P(): take a unit, or queue the caller and report that it must block"""
+        if self.value > 0:
+            self.value -= 1
+            return True
+        self.waiters.append(pid)
+        return False
+
+    def signal(self) -> Optional[int]:
+        """V(): hand the unit to the first waiter (returned), or bank it"""
+        if self.waiters:
+            return self.waiters.popleft()
+        self.value += 1
+        return None
+
+    def cancel(self, pid: int) -> List[int]:
+        """Forget a process that exited"""
+        if pid in self.waiters:
+            self.waiters.remove(pid)
+        return []
+
+class SimCondition:
+    """Simulated condition variable (Mesa semantics)"""
+    def __init__(self, name: str = "condition"):
+        self.name = name
+        self.waiters = deque()
+
+    def wait(self, pid: int, mutex: SimMutex) -> List[int]:
+        """Atomically release the mutex and sleep; returns pids woken by the release"""
+        self.waiters.append((pid, mutex))
+        woken = mutex.release(pid)
+        return [woken] if woken is not None else []
+
+    def signal(self) -> List[int]:
+        """Wake one waiter; it becomes runnable once it re-acquires its mutex"""
+        if not self.waiters:
+            return []
+        pid, mutex = self.waiters.popleft()
+        return [pid] if mutex.acquire(pid) else []
+
+    def broadcast(self) -> List[int]:
+        """Wake every waiter"""
+        woken = []
+        while self.waiters:
+            woken.extend(self.signal())
+        return woken
+
+    def cancel(self, pid: int) -> List[int]:
+        """Forget a process that exited"""
+        self.waiters = deque(w for w in self.waiters if w[0] != pid)
+        return []
+
+class GameScheduler:
+    """Round-robin CPU scheduler driven by a virtual clock.
+
+    Processes with a task are generators that yield syscalls such as
+    ("lock", mutex) or ("wait", semaphore); a syscall that cannot complete
+    blocks the process until the primitive hands it ownership.
+    """
+    def __init__(self, process_manager):
+        self.process_manager = process_manager
+        self.clock = 0
+        self.ready_queue = deque()
+        self.queued = set()  # Pids in ready_queue, possibly as stale entries _pick_next skips
+        self.current_pid = None
+        self.context_switches = 0
+        self.idle_ticks = 0
+        self.sync_objects = weakref.WeakSet()
+        self.signal_pending_pids = set()
+        self.signals_delivered = 0
+
+    def mutex(self, name: str = "mutex") -> SimMutex:
+        mutex = SimMutex(name)
+        self.sync_objects.add(mutex)
+        return mutex
+
+    def semaphore(self, value: int = 1, name: str = "semaphore") -> SimSemaphore:
+        semaphore = SimSemaphore(value, name)
+        self.sync_objects.add(semaphore)
+        return semaphore
+
+    def condition(self, name: str = "condition") -> SimCondition:
+        condition = SimCondition(name)
+        self.sync_objects.add(condition)
+        return condition
+
+    def admit(self, pid: int):
+        """Put a new process on the ready queue"""
+        self.process_manager.processes[pid].state = "ready"
+        self._enqueue(pid)
+
+    def wake(self, pids):
+        """Move blocked processes back to the ready queue"""
+        processes = self.process_manager.processes
+        for pid in pids:
+            proc = processes.get(pid)
+            if proc is None:
+                continue
+            if proc.state == "blocked":
+                proc.state = "ready"
+                self._enqueue(pid)
+            elif proc.state == "stopped" and proc.resume_state == "blocked":
+                proc.resume_state = "ready"
+
+    def exit(self, pid: int):
+        """Release everything a finished process held or waited on"""
+        for sync_object in list(self.sync_objects):
+            self.wake(sync_object.cancel(pid))
+        if self.current_pid == pid:
+            self.current_pid = None
+
+    def tick(self) -> Optional[int]:
+        """Advance the virtual clock by one time slice and return the pid that ran"""
+        self.clock += 1
+        if self.signal_pending_pids:
+            self.deliver_signals()
+
+        proc = self._pick_next()
+        if proc is None:
+            self.idle_ticks += 1
+            return None
+
+        if proc.pid != self.current_pid:
+            self.context_switches += 1
+            self.current_pid = proc.pid
+
+        proc.state = "running"
+        proc.cpu_time += 1
+        if proc.task is not None:
+            self._step(proc)
+
+        if proc.state == "running":
+            proc.state = "ready"
+            self._enqueue(proc.pid)
+        return proc.pid
+
+    def run(self, ticks: int):
+        """Run the scheduler for a number of ticks"""
+        for _ in range(ticks):
+            self.tick()
+        self.process_manager.game_manager.events.publish("processes")
+
+    def post_signal(self, proc, sig: int):
+        """Mark a signal pending; it is acted on at the next schedule point"""
+        proc.pending_signals |= 1 << sig
+        self.signal_pending_pids.add(proc.pid)
+
+    def deliver_signals(self) -> int:
+        """Schedule point: act on every pending, unblocked signal in one pass"""
+        pending_pids, self.signal_pending_pids = self.signal_pending_pids, set()
+        processes = self.process_manager.processes
+        delivered = 0
+        for pid in pending_pids:
+            proc = processes.get(pid)
+            if proc is not None and proc.state != "terminated":
+                delivered += self._deliver(proc)
+        self.signals_delivered += delivered
+        if delivered:
+            self.process_manager.game_manager.events.publish("processes")
+        return delivered
+
+    def _deliver(self, proc) -> int:
+        deliverable = proc.pending_signals & ~(proc.blocked_signals & ~UNBLOCKABLE_SIGNALS)
+        proc.pending_signals &= ~deliverable
+        delivered = 0
+        while deliverable and proc.state != "terminated":
+            sig = (deliverable & -deliverable).bit_length() - 1  # Lowest signal first
+            deliverable &= deliverable - 1
+            delivered += 1
+
+            handler = "default" if (1 << sig) & UNBLOCKABLE_SIGNALS else proc.signal_handlers.get(sig, "default")
+            if callable(handler):
+                handler(proc, sig)
+                continue
+            action = "ignore" if handler == "ignore" else SIGNAL_DEFAULT_ACTIONS.get(sig, "term")
+            if action == "term":
+                self.process_manager.exit_process(proc.pid, sig)
+            elif action == "stop" and proc.state != "stopped":
+                proc.resume_state = proc.state
+                proc.state = "stopped"  # Its ready-queue entry, if any, is skipped by _pick_next
+            elif action == "cont" and proc.state == "stopped":
+                proc.state = proc.resume_state or "ready"
+                proc.resume_state = None
+                if proc.state in ("ready", "running"):
+                    proc.state = "ready"
+                    self._enqueue(proc.pid)
+        return delivered
+
+    def detect_deadlock(self, pids: List[int]) -> bool:
+        """True when every live process in the group is blocked"""
+        live = [self.process_manager.processes[pid] for pid in pids
+                if pid in self.process_manager.processes
+                and self.process_manager.processes[pid].state != "terminated"]
+        return bool(live) and all(p.state == "blocked" for p in live)
+
+    def _enqueue(self, pid: int):
+        if pid not in self.queued:
+            self.queued.add(pid)
+            self.ready_queue.append(pid)
+
+    def _pick_next(self):
+        processes = self.process_manager.processes
+        while self.ready_queue:
+            pid = self.ready_queue.popleft()
+            self.queued.discard(pid)
+            proc = processes.get(pid)
+            if proc is not None and proc.state == "ready":
+                return proc
+        return None
+
+    def _step(self, proc):
+        """Run a task until its next syscall and carry the syscall out"""
+        try:
+            request = next(proc.task)
+        except StopIteration:
+            self.process_manager.exit_process(proc.pid)
+            return
+
+        if request is None:  # Plain computation
+            return
+
+        op, *args = request
+        granted = True
+        if op == "lock":
+            granted = args[0].acquire(proc.pid)
+        elif op == "unlock":
+            self.wake([args[0].release(proc.pid)])
+        elif op == "wait":
+            granted = args[0].wait(proc.pid)
+        elif op == "signal":
+            self.wake([args[0].signal()])
+        elif op == "cond_wait":
+            self.wake(args[0].wait(proc.pid, args[1]))
+            granted = False
+        elif op == "cond_signal":
+            self.wake(args[0].signal())
+        elif op == "cond_broadcast":
+            self.wake(args[0].broadcast())
+        else:
+            raise ValueError(f"Unknown syscall: {op}")
+
+        if not granted:
+            proc.state = "blocked"
 
 class GameProcessManager:
-    def __init__(self, game_manager):
+    PROTECTED_PIDS = frozenset({1, 2, 3, 4})
+
+    def __init__(self, game_manager, memory_manager):
         self.game_manager = game_manager
+        self.memory_manager = memory_manager
         self.processes = {}
         self.next_pid = 1
+        self.killed_count = 0  # Processes terminated by a signal
+        self.oom_kills = 0
+        self.journal = None  # Called with a record of every player process started or ended
+        self.scheduler = GameScheduler(self)
+        memory_manager.oom_handler = self.oom_kill
         self._create_initial_processes()
 
     def _create_initial_processes(self):
         """Create initial system processes"""
-        self.create_process("init", "/sbin/init", game_action=False)
-        self.create_process("kernel", "/kernel/main", game_action=False)
+        self.create_process("init", "/sbin/init", game_action=False, ppid=0)
+        self.create_process("kernel", "/kernel/main", game_action=False, ppid=0)
         self.create_process("gamemaster", "/usr/bin/gamemaster", game_action=False)
         self.create_process("desktop", "/usr/bin/desktop", game_action=False)
 
-    def create_process(self, name: str, command: str, game_action: bool = True) -> int:
+    def create_process(self, name: str, command: str, game_action: bool = True, task=None, ppid: int = 1,
+                       memory: Optional[int] = None) -> Optional[int]:
+        """Create a process; returns None when its image cannot be allocated"""
+        memory = memory if memory is not None else random.randint(100, 500)
         pid = self.next_pid
+        if not self.memory_manager.allocate_process(pid, memory):
+            self.game_manager.add_notification(f"❌ Out of memory: cannot start '{name}' ({memory} KB)", "error")
+            return None
+
         self.next_pid += 1
-        self.processes[pid] = GameProcess(pid, name, command, self.game_manager)
+        self.processes[pid] = GameProcess(pid, name, command, self.game_manager, task, ppid, memory)
+        self.scheduler.admit(pid)
+        if self.is_player_process(self.processes[pid]):
+            self.game_manager.bump("processes_running")
+        self.game_manager.events.publish("processes")
+        if self.journal is not None and task is None:
+            self.journal({"op": "spawn", "pid": pid, "name": name, "command": command, "memory": memory})
 
         if game_action:
             # Game mechanics
-            self.game_manager.stats.processes_created += 1
-            leveled_up = self.game_manager.stats.add_xp(30)
+            leveled_up = self.game_manager.award("process_create", 30, pid)
 
             if leveled_up:
                 self.game_manager.add_notification(f"🎉 LEVEL UP! Now Level {self.game_manager.stats.level}!")
 
             # Check achievements
-            self.game_manager.check_achievement("taskmaster")
-            self.game_manager.check_achievement("multitasker")
+            self.game_manager.bump("processes_created")
 
             # Update missions
             self.game_manager.update_mission_progress("process_master")
 
         return pid
 
-    def kill_process(self, pid: int) -> bool:
-        if pid in self.processes and pid > 4:  # Protect system processes
-            self.processes[pid].state = "terminated"
+    def can_signal(self, pid: int, sig: int) -> bool:
+        """Check that the player may send a signal to a process"""
+        proc = self.processes.get(pid)
+        if proc is None or proc.state == "terminated":
+            return False
+        # Protect system processes from anything but harmless signals
+        return pid not in self.PROTECTED_PIDS or sig in (SIGCHLD, SIGCONT)
 
-            # Game mechanics
-            self.game_manager.stats.processes_killed += 1
-            leveled_up = self.game_manager.stats.add_xp(20)
+    def send_signal(self, pid: int, sig: int) -> bool:
+        """Post a signal to one process; it is delivered at the next schedule point"""
+        if not self.can_signal(pid, sig):
+            return False
+        self.scheduler.post_signal(self.processes[pid], sig)
+        return True
+
+    def broadcast_signal(self, sig: int, pids: Optional[List[int]] = None) -> int:
+        """Post a signal to many processes (all signalable ones by default) in one batch"""
+        if pids is None:
+            targets = [p for p in self.processes.values()
+                       if p.state != "terminated" and p.pid not in self.PROTECTED_PIDS]
+        else:
+            targets = [self.processes[pid] for pid in pids if self.can_signal(pid, sig)]
 
-            if leveled_up:
-                self.game_manager.add_notification(f"🎉 LEVEL UP! Now Level {self.game_manager.stats.level}!")
+        bit = 1 << sig
+        for proc in targets:
+            proc.pending_signals |= bit
+        self.scheduler.signal_pending_pids.update(p.pid for p in targets)
 
-            # Update missions
-            self.game_manager.update_mission_progress("process_master")
+        killed_before = self.killed_count
+        self.scheduler.deliver_signals()
+        self._reward_kills(self.killed_count - killed_before)
+        return len(targets)
 
-            return True
-        return False
+    def kill_process(self, pid: int, sig: int = SIGTERM) -> bool:
+        """kill(2): send a signal and run the schedule point on return"""
+        if not self.send_signal(pid, sig):
+            return False
+
+        killed_before = self.killed_count
+        self.scheduler.deliver_signals()
+        self._reward_kills(self.killed_count - killed_before)
+        return True
+
+    def _reward_kills(self, count: int):
+        """Game mechanics for processes the player terminated"""
+        if count <= 0:
+            return
+
+        self.game_manager.bump("processes_killed", count)
+        leveled_up = self.game_manager.award("process_kill", 20 * count)
+
+        if leveled_up:
+            self.game_manager.add_notification(f"🎉 LEVEL UP! Now Level {self.game_manager.stats.level}!")
+
+        # Update missions
+        self.game_manager.update_mission_progress("process_master", count)
+
+    def oom_kill(self, requester: Optional[int] = None) -> bool:
+        """OOM killer: SIGKILL the process with the worst badness score"""
+        victim = self.memory_manager.select_victim(exclude=self.PROTECTED_PIDS | {requester})
+        if victim is None:
+            return False
+
+        freed = self.memory_manager.footprint(victim)
+        self.exit_process(victim, SIGKILL)
+        self.oom_kills += 1
+        self.game_manager.add_notification(
+            f"💀 OOM killer: killed {victim} ({self.processes[victim].name}), freeing {freed:,} KB", "error")
+        return True
+
+    def is_player_process(self, proc) -> bool:
+        """Counted in processes_running: not a protected system process or a mini-game task"""
+        return proc.pid not in self.PROTECTED_PIDS and proc.task is None
+
+    def exit_process(self, pid: int, sig: Optional[int] = None):
+        """Terminate a process, by normal exit or by a fatal signal, and notify its parent"""
+        proc = self.processes.get(pid)
+        if proc is None or proc.state == "terminated":
+            return
+
+        if self.is_player_process(proc):
+            self.game_manager.bump("processes_running", -1)
+        proc.state = "terminated"
+        proc.task = None
+        proc.exit_signal = sig
+        proc.pending_signals = 0
+        self.scheduler.exit(pid)
+        self.memory_manager.free_process(pid)
+        self.game_manager.events.publish("processes")
+        if self.journal is not None:
+            self.journal({"op": "exit", "pid": pid})
+        if sig is not None:
+            self.killed_count += 1
+
+        parent = self.processes.get(proc.ppid)
+        if parent is not None and parent.state != "terminated":
+            self.scheduler.post_signal(parent, SIGCHLD)
 
     def list_processes(self) -> List[Dict]:
         return [
@@ -1080,12 +2112,1250 @@ class GameProcessManager:
             for p in self.processes.values()
         ]
 
+class _MaxTree:
+    """Max segment tree over the indexes 0..n-1"""
+    def __init__(self, n: int):
+        self.leaves = 1 << max(n - 1, 1).bit_length()
+        self.tree = [0] * (2 * self.leaves)
+
+    @property
+    def max(self) -> int:
+        return self.tree[1]
+
+    def set(self, index: int, value: int):
+        tree = self.tree
+        i = index + self.leaves
+        tree[i] = value
+        while i > 1:
+            sibling = tree[i ^ 1]
+            best = value if value > sibling else sibling
+            i >>= 1
+            if tree[i] == best:
+                break
+            tree[i] = value = best
+
+    def find(self, value: int, lowest: int = 0) -> Optional[int]:
+        """Lowest index at or after `lowest` whose value is at least `value`"""
+        tree = self.tree
+        if tree[1] < value or lowest >= self.leaves:
+            return None
+
+        i = lowest + self.leaves
+        if tree[i] < value:
+            # Climb until a right sibling subtree has a big enough value
+            while i > 1:
+                if not i & 1 and tree[i + 1] >= value:
+                    i += 1
+                    break
+                i >>= 1
+            else:
+                return None
+            while i < self.leaves:
+                i = 2 * i if tree[2 * i] >= value else 2 * i + 1
+        return i - self.leaves
+
+class ContiguousAllocator:
+    """Variable-partition allocator over a fixed arena.
+
+    Free blocks are indexed three ways so allocation, free and coalescing
+    stay O(log n): a max segment tree keyed by start address (first-fit,
+    next-fit), a second one keyed by block size, with the free starts of
+    each size alongside (best-fit, worst-fit), and start/end dictionaries
+    (neighbour lookup on free).
+    """
+    POLICIES = ("first-fit", "best-fit", "worst-fit", "next-fit")
+
+    def __init__(self, size: int, policy: str = "first-fit"):
+        if policy not in self.POLICIES:
+            raise ValueError(f"Unknown allocation policy: {policy}")
+        self.size = size
+        self.policy = policy
+        self.used = 0
+        self.rover = 0  # Next-fit resume address
+        self.failed_allocations = 0
+        self.allocations = {}  # start -> (size, owner)
+
+        self._by_start = _MaxTree(size)  # Largest free block starting in each address range
+        self._by_size = _MaxTree(size + 1)  # Leaf s is s while some free block has size s
+        self._starts = {}  # size -> {start: None} of the free blocks that size
+        self._free = {}  # start -> size
+        self._free_end = {}  # end -> start
+        self._insert_free(0, size)
+
+    def allocate(self, size: int, owner=None) -> Optional[int]:
+        """Allocate a block and return its start address, or None if nothing fits"""
+        start = self._find(size) if 0 < size <= self.size else None
+        if start is None:
+            self.failed_allocations += 1
+            return None
+
+        block = self._free[start]
+        self._remove_free(start)
+        if block > size:
+            self._insert_free(start + size, block - size)
+
+        self.allocations[start] = (size, owner)
+        self.used += size
+        self.rover = (start + size) % self.size
+        return start
+
+    def free(self, start: int) -> int:
+        """Free a block, coalescing it with free neighbours; returns the size freed"""
+        size, _ = self.allocations.pop(start)
+        self.used -= size
+        freed = size
+
+        right = start + size
+        if right in self._free:
+            size += self._remove_free(right)
+
+        left = self._free_end.get(start)
+        if left is not None:
+            size += self._remove_free(left)
+            start = left
+
+        self._insert_free(start, size)
+        return freed
+
+    @property
+    def free_memory(self) -> int:
+        return self.size - self.used
+
+    @property
+    def largest_free_block(self) -> int:
+        return self._by_start.max
+
+    def block_size(self, start: int) -> int:
+        return self.allocations[start][0]
+
+    def free_blocks(self) -> List[tuple]:
+        """Free blocks as (start, size), sorted by address"""
+        return sorted(self._free.items())
+
+    def fragmentation(self) -> float:
+        """External fragmentation: share of free memory outside the largest free block"""
+        if self.free_memory == 0:
+            return 0.0
+        return 1 - self.largest_free_block / self.free_memory
+
+    def internal_fragmentation(self) -> float:
+        """Variable partitions are cut to size, so nothing is lost inside blocks"""
+        return 0.0
+
+    def _find(self, size: int) -> Optional[int]:
+        if self.policy == "first-fit":
+            return self._by_start.find(size)
+        if self.policy == "next-fit":
+            start = self._by_start.find(size, self.rover)
+            return start if start is not None else self._by_start.find(size)
+        fit = self._by_size.find(size, size) if self.policy == "best-fit" else self._by_size.max
+        if fit is None or fit < size:
+            return None
+        return next(iter(self._starts[fit]))
+
+    def _insert_free(self, start: int, size: int):
+        self._free[start] = size
+        self._free_end[start + size] = start
+        self._by_start.set(start, size)
+        starts = self._starts.setdefault(size, {})
+        if not starts:
+            self._by_size.set(size, size)
+        starts[start] = None
+
+    def _remove_free(self, start: int) -> int:
+        size = self._free.pop(start)
+        del self._free_end[start + size]
+        self._by_start.set(start, 0)
+        starts = self._starts[size]
+        del starts[start]
+        if not starts:
+            self._by_size.set(size, 0)
+        return size
+
+class BuddyAllocator:
+    """Binary buddy allocator with per-order free lists and free bitmaps.
+
+    Each free list is an insertion-ordered dict used as a set, so a buddy
+    absorbed by a merge leaves its list in O(1) and the lists never hold
+    more than the free blocks; the bitmaps answer "is my buddy free".
+    """
+    def __init__(self, size: int, min_block: int = 4):
+        if size & (size - 1) or min_block & (min_block - 1):
+            raise ValueError("Buddy allocator sizes must be powers of two")
+        self.size = size
+        self.min_block = min_block
+        self.max_order = (size // min_block).bit_length() - 1
+        self.policy = "buddy"
+        self.used = 0  # Whole blocks handed out
+        self.requested = 0  # What callers asked for
+        self.failed_allocations = 0
+        self.allocations = {}  # start -> (requested size, owner)
+
+        self._orders = {}  # start -> order of allocated block
+        self.free_lists = [{} for _ in range(self.max_order + 1)]  # order -> {start: None}
+        self.bitmaps = [bytearray(size // (min_block << order)) for order in range(self.max_order + 1)]
+        self.free_counts = [0] * (self.max_order + 1)
+        self._push(0, self.max_order)
+
+    def order_for(self, size: int) -> int:
+        """Smallest order whose block holds size units"""
+        blocks = -(-size // self.min_block)
+        return (blocks - 1).bit_length()
+
+    def allocate(self, size: int, owner=None) -> Optional[int]:
+        """Allocate a power-of-two block and return its start address, or None"""
+        if not 0 < size <= self.size:
+            self.failed_allocations += 1
+            return None
+
+        order = self.order_for(size)
+        for k in range(order, self.max_order + 1):
+            if self.free_counts[k]:
+                start = self._pop(k)
+                break
+        else:
+            self.failed_allocations += 1
+            return None
+
+        # Split down, returning the upper halves to the free lists
+        while k > order:
+            k -= 1
+            self._push(start + (self.min_block << k), k)
+
+        self.allocations[start] = (size, owner)
+        self._orders[start] = order
+        self.used += self.min_block << order
+        self.requested += size
+        return start
+
+    def free(self, start: int) -> int:
+        """Free a block, merging with free buddies; returns the requested size freed"""
+        size, _ = self.allocations.pop(start)
+        order = self._orders.pop(start)
+        self.used -= self.min_block << order
+        self.requested -= size
+
+        while order < self.max_order:
+            block = self.min_block << order
+            buddy = start ^ block
+            bitmap = self.bitmaps[order]
+            if not bitmap[buddy // block]:
+                break
+            bitmap[buddy // block] = 0
+            del self.free_lists[order][buddy]
+            self.free_counts[order] -= 1
+            start = min(start, buddy)
+            order += 1
+
+        self._push(start, order)
+        return size
+
+    def block_size(self, start: int) -> int:
+        return self.min_block << self._orders[start]
+
+    @property
+    def free_memory(self) -> int:
+        return self.size - self.used
+
+    @property
+    def largest_free_block(self) -> int:
+        for order in range(self.max_order, -1, -1):
+            if self.free_counts[order]:
+                return self.min_block << order
+        return 0
+
+    def free_blocks(self) -> List[tuple]:
+        """Free blocks as (start, size), sorted by address"""
+        blocks = []
+        for order, bitmap in enumerate(self.bitmaps):
+            block = self.min_block << order
+            blocks.extend((i * block, block) for i, free in enumerate(bitmap) if free)
+        return sorted(blocks)
+
+    def fragmentation(self) -> float:
+        """External fragmentation: share of free memory outside the largest free block"""
+        if self.free_memory == 0:
+            return 0.0
+        return 1 - self.largest_free_block / self.free_memory
+
+    def internal_fragmentation(self) -> float:
+        """Share of allocated memory lost to power-of-two rounding"""
+        return 1 - self.requested / self.used if self.used else 0.0
+
+    def _push(self, start: int, order: int):
+        self.bitmaps[order][start // (self.min_block << order)] = 1
+        self.free_counts[order] += 1
+        self.free_lists[order][start] = None
+
+    def _pop(self, order: int) -> int:
+        start, _ = self.free_lists[order].popitem()
+        self.bitmaps[order][start // (self.min_block << order)] = 0
+        self.free_counts[order] -= 1
+        return start
+
+class SlabCache:
+    """Object cache that carves fixed-size kernel objects out of slabs.
+
+    Objects are identified by handle (slab id * objects per slab + slot).
+    One empty slab is kept cached; further empty slabs go back to the
+    backing allocator.
+    """
+    def __init__(self, name: str, object_size: int, allocator, slab_units: int = 4):
+        self.name = name
+        self.object_size = object_size  # Bytes
+        self.allocator = allocator
+        self.slab_units = slab_units  # KB taken from the backing allocator per slab
+        self.objects_per_slab = slab_units * 1024 // object_size
+        self.slabs = {}  # slab id -> [start address, free slots]
+        self.partial = set()  # Slabs with at least one free slot
+        self.next_slab_id = 0
+        self.active_objects = 0
+        self.failed_allocations = 0
+
+    def alloc(self) -> Optional[int]:
+        """Allocate an object and return its handle, or None if no slab can be added"""
+        if not self.partial and not self._grow():
+            self.failed_allocations += 1
+            return None
+
+        slab_id = next(iter(self.partial))
+        free_slots = self.slabs[slab_id][1]
+        slot = free_slots.pop()
+        if not free_slots:
+            self.partial.discard(slab_id)
+        self.active_objects += 1
+        return slab_id * self.objects_per_slab + slot
+
+    def free(self, handle: int):
+        """Return an object to its slab"""
+        slab_id, slot = divmod(handle, self.objects_per_slab)
+        slab = self.slabs[slab_id]
+        slab[1].append(slot)
+        self.partial.add(slab_id)
+        self.active_objects -= 1
+
+        if len(slab[1]) == self.objects_per_slab and len(self.partial) > 1:
+            self.allocator.free(slab[0])
+            del self.slabs[slab_id]
+            self.partial.discard(slab_id)
+
+    def shrink(self) -> int:
+        """Give cached empty slabs back to the allocator; returns KB freed"""
+        empty = [slab_id for slab_id in self.partial if len(self.slabs[slab_id][1]) == self.objects_per_slab]
+        for slab_id in empty:
+            self.allocator.free(self.slabs.pop(slab_id)[0])
+            self.partial.discard(slab_id)
+        return len(empty) * self.slab_units
+
+    def stats(self) -> Dict:
+        total = len(self.slabs) * self.objects_per_slab
+        slab_bytes = len(self.slabs) * self.slab_units * 1024
+        return {
+            "slabs": len(self.slabs),
+            "active": self.active_objects,
+            "total": total,
+            "object_size": self.object_size,
+            "waste": 1 - self.active_objects * self.object_size / slab_bytes if slab_bytes else 0.0
+        }
+
+    def _grow(self) -> bool:
+        start = self.allocator.allocate(self.slab_units, owner=f"slab:{self.name}")
+        if start is None:
+            return False
+        slab_id = self.next_slab_id
+        self.next_slab_id += 1
+        self.slabs[slab_id] = [start, list(range(self.objects_per_slab - 1, -1, -1))]
+        self.partial.add(slab_id)
+        return True
+
+class PageTable:
+    """Per-process page table with one or more levels, walked in NumPy batches.
+
+    Each level is a 2-D array of nodes (one row per node). Inner levels hold
+    child node ids and the last level holds frame addresses; -1 marks an
+    empty entry. Nodes below the root are only created when first mapped,
+    which is what makes multi-level tables small for sparse address spaces.
+    """
+    def __init__(self, levels: int = 2, vpn_bits: int = 20):
+        if np is None:
+            raise RuntimeError("NumPy is required for the paging simulator")
+        base, extra = divmod(vpn_bits, levels)
+        self.levels = levels
+        self.vpn_bits = vpn_bits
+        self.bits = [base + (1 if level < extra else 0) for level in range(levels)]
+        self.nodes = [np.full((1, 1 << bits), -1, dtype=np.int32) for bits in self.bits]
+        self.counts = [1] + [0] * (levels - 1)
+
+    def lookup(self, vpns) -> "np.ndarray":
+        """Frame address for each virtual page number (-1 if unmapped)"""
+        ids = np.zeros(len(vpns), dtype=np.int32)
+        shift = self.vpn_bits
+        for level, bits in enumerate(self.bits):
+            shift -= bits
+            index = (vpns >> shift) & ((1 << bits) - 1)
+            present = ids >= 0
+            child = np.full(len(vpns), -1, dtype=np.int32)
+            child[present] = self.nodes[level][ids[present], index[present]]
+            ids = child
+        return ids
+
+    def map(self, vpns, frames):
+        """Map pages to frames, creating intermediate nodes as needed"""
+        ids = np.zeros(len(vpns), dtype=np.int32)
+        shift = self.vpn_bits
+        for level, bits in enumerate(self.bits):
+            shift -= bits
+            index = (vpns >> shift) & ((1 << bits) - 1)
+            table = self.nodes[level]
+            if level == self.levels - 1:
+                table[ids, index] = frames
+                return
+
+            child = table[ids, index]
+            missing = child < 0
+            if missing.any():
+                keys = np.unique(ids[missing].astype(np.int64) << bits | index[missing])
+                table = self.nodes[level]
+                table[keys >> bits, keys & ((1 << bits) - 1)] = self._new_nodes(level + 1, len(keys))
+                child = table[ids, index]
+            ids = child
+
+    def unmap(self, vpns):
+        """Clear mappings (intermediate nodes are kept)"""
+        ids = np.zeros(len(vpns), dtype=np.int32)
+        shift = self.vpn_bits
+        for level, bits in enumerate(self.bits):
+            shift -= bits
+            index = (vpns >> shift) & ((1 << bits) - 1)
+            present = ids >= 0
+            if level == self.levels - 1:
+                self.nodes[level][ids[present], index[present]] = -1
+                return
+            child = np.full(len(vpns), -1, dtype=np.int32)
+            child[present] = self.nodes[level][ids[present], index[present]]
+            ids = child
+
+    def memory_bytes(self) -> int:
+        """Memory taken by the table itself"""
+        return sum(count * (1 << bits) * 4 for count, bits in zip(self.counts, self.bits))
+
+    @staticmethod
+    def single_level_bytes(vpn_bits: int = 20) -> int:
+        """Size of a flat table over the whole address space, without building one"""
+        return (1 << vpn_bits) * 4
+
+    def _new_nodes(self, level: int, count: int) -> "np.ndarray":
+        table = self.nodes[level]
+        first = self.counts[level]
+        if first + count > len(table):
+            grown = np.full((max(2 * len(table), first + count), table.shape[1]), -1, dtype=np.int32)
+            grown[:first] = table[:first]
+            self.nodes[level] = grown
+        self.counts[level] += count
+        return np.arange(first, first + count, dtype=np.int32)
+
+class TLB:
+    """Set-associative, ASID-tagged TLB with LRU replacement"""
+    def __init__(self, entries: int = 64, ways: int = 4):
+        self.entries = entries
+        self.ways = ways
+        self.set_count = entries // ways
+        self.sets = [[] for _ in range(self.set_count)]  # Each set is ordered LRU -> MRU
+        self.hits = 0
+        self.misses = 0
+
+    def access(self, keys) -> "np.ndarray":
+        """Look up a batch of (ASID << 32 | VPN) keys; returns a hit mask.
+
+        Runs of the same page always hit without touching LRU order, so only
+        page transitions go through the per-set simulation.
+        """
+        count = len(keys)
+        if count == 0:
+            return np.zeros(0, dtype=bool)
+        heads = np.empty(count, dtype=bool)
+        heads[0] = True
+        np.not_equal(keys[1:], keys[:-1], out=heads[1:])
+
+        head_keys = keys[heads].tolist()
+        head_hits = np.empty(len(head_keys), dtype=bool)
+        sets, ways, set_count = self.sets, self.ways, self.set_count
+        for i, key in enumerate(head_keys):
+            tlb_set = sets[key % set_count]
+            if key in tlb_set:
+                head_hits[i] = True
+                if tlb_set[-1] != key:
+                    tlb_set.remove(key)
+                    tlb_set.append(key)
+            else:
+                head_hits[i] = False
+                if len(tlb_set) >= ways:
+                    del tlb_set[0]
+                tlb_set.append(key)
+
+        hit_mask = np.ones(count, dtype=bool)
+        hit_mask[heads] = head_hits
+        misses = len(head_keys) - int(head_hits.sum())
+        self.misses += misses
+        self.hits += count - misses
+        return hit_mask
+
+    def invalidate(self, asid: Optional[int] = None):
+        """Flush one address space, or everything"""
+        if asid is None:
+            self.sets = [[] for _ in range(self.set_count)]
+        else:
+            self.sets = [[key for key in tlb_set if key >> 32 != asid] for tlb_set in self.sets]
+
+    def flush(self, keys):
+        """Drop the entries for specific (ASID << 32 | VPN) keys"""
+        for key in keys:
+            tlb_set = self.sets[key % self.set_count]
+            if key in tlb_set:
+                tlb_set.remove(key)
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+def generate_reference_stream(count: int, pages: int = 256, run_length: int = 64,
+                              seed: Optional[int] = None) -> "np.ndarray":
+    """Synthetic virtual address trace with spatial and temporal locality.
+
+    The trace is a series of runs; each run picks a page (skewed towards a
+    hot subset that drifts over time) and walks through it word by word.
+    """
+    if np is None:
+        raise RuntimeError("NumPy is required for the paging simulator")
+    rng = np.random.default_rng(seed)
+    runs = max(count // run_length, 1)
+    lengths = rng.geometric(1 / run_length, size=runs)
+    lengths = lengths[:np.searchsorted(np.cumsum(lengths), count) + 1]
+    lengths[-1] -= lengths.sum() - count
+
+    hot = np.minimum(rng.zipf(1.3, size=len(lengths)) - 1, pages - 1)
+    drift = (np.arange(len(lengths)) * pages // max(len(lengths), 1)) // 8
+    run_pages = (hot + drift) % pages + 16  # Leave page 0 unmapped like a real process
+    run_offsets = rng.integers(0, PAGE_SIZE // 4, size=len(lengths)) * 4
+
+    starts = np.repeat(np.cumsum(lengths) - lengths, lengths)
+    step = (np.arange(count) - starts) * 4
+    return (np.repeat(run_pages, lengths).astype(np.int64) << PAGE_SHIFT) | \
+           ((np.repeat(run_offsets, lengths) + step) % PAGE_SIZE)
+
+class SwapSpace:
+    """Swap area of page-sized slots kept in a memory-mapped host file.
+
+    Page contents live in the file rather than the Python heap. Dirty pages
+    are queued and written back in batches, with runs of adjacent slots
+    coalesced into a single copy into the mapping.
+    """
+    WRITEBACK_BATCH = 32  # Pages per writeback, like Linux's SWAP_CLUSTER_MAX
+
+    def __init__(self, size_kb: int = 16384, path: Optional[str] = None):
+        self.size = size_kb
+        self.slots = size_kb // PAGE_KB
+        self._file = tempfile.TemporaryFile() if path is None else open(path, "w+b")
+        self._file.truncate(self.slots * PAGE_SIZE)
+        self._map = mmap.mmap(self._file.fileno(), self.slots * PAGE_SIZE)
+        self._slot_map = bytearray(self.slots)  # 1 = slot holds a page
+        self._free_slots = list(range(self.slots - 1, -1, -1))  # Lowest slot on top
+        self._pending = {}  # slot -> page waiting for writeback
+        self.used_slots = 0
+        self.pswpin = 0
+        self.pswpout = 0
+        self.writebacks = 0
+
+    def allocate_slot(self) -> Optional[int]:
+        if not self._free_slots:
+            return None
+        slot = self._free_slots.pop()
+        self._slot_map[slot] = 1
+        self.used_slots += 1
+        return slot
+
+    def free_slot(self, slot: int):
+        if not self._slot_map[slot]:
+            raise ValueError(f"Swap slot {slot} is not in use")
+        self._slot_map[slot] = 0
+        self._pending.pop(slot, None)
+        self._free_slots.append(slot)
+        self.used_slots -= 1
+
+    def write(self, slot: int, page: bytes):
+        """Queue a page for writeback to its slot"""
+        self._pending[slot] = page
+        self.pswpout += 1
+        if len(self._pending) >= self.WRITEBACK_BATCH:
+            self.flush()
+
+    def read(self, slot: int) -> bytes:
+        if slot in self._pending:
+            self.flush()
+        self.pswpin += 1
+        return self._map[slot * PAGE_SIZE:(slot + 1) * PAGE_SIZE]
+
+    def flush(self):
+        """Write every queued page, one copy per run of adjacent slots"""
+        if not self._pending:
+            return
+        slots = sorted(self._pending)
+        run_start = 0
+        for i in range(1, len(slots) + 1):
+            if i == len(slots) or slots[i] != slots[i - 1] + 1:
+                first = slots[run_start]
+                self._map[first * PAGE_SIZE:(slots[i - 1] + 1) * PAGE_SIZE] = \
+                    b"".join(self._pending[slot] for slot in slots[run_start:i])
+                run_start = i
+        self._pending.clear()
+        self.writebacks += 1
+
+    @property
+    def free_kb(self) -> int:
+        return (self.slots - self.used_slots) * PAGE_KB
+
+class VirtualMemory:
+    """Demand paging for simulated processes: page tables, TLB and frames.
+
+    Frames are PAGE_KB-sized blocks taken from the memory manager's
+    allocator, so paged memory competes with process images and slabs.
+    When no frame is free, a clock (second-chance) scan over resident pages
+    picks victims and pushes them out to the memory manager's swap space.
+    """
+    TRANSLATE_SLICE = 1 << 16  # References whose pages are pinned together while they fault in
+
+    def __init__(self, memory_manager, levels: int = 2, tlb_entries: int = 64, tlb_ways: int = 4):
+        if np is None:
+            raise RuntimeError("NumPy is required for the paging simulator")
+        self.memory_manager = memory_manager
+        self.levels = levels
+        self.page_tables = {}  # pid -> PageTable
+        self.resident = {}  # pid -> {vpn: frame}
+        self.tlb = TLB(tlb_entries, tlb_ways)
+        self.references = 0
+        self.page_faults = 0
+        self.failed_faults = 0  # No frame could be found
+        self.evictions = 0
+        self.swapped = {}  # pid -> {vpn: swap slot} for pages that are not resident
+        self.swap_cache = {}  # (pid, vpn) -> slot still holding a copy of a resident page
+        self.dirty = set()  # (pid, vpn) resident pages that differ from swap
+        self._clock = OrderedDict()  # (pid, vpn) -> referenced bit, in clock order
+        self._pinned = (None, set())  # (pid, vpns) of the slice being translated; reclaim skips them
+
+    def page_table(self, pid: int) -> PageTable:
+        if pid not in self.page_tables:
+            self.page_tables[pid] = PageTable(self.levels)
+            self.resident[pid] = {}
+            self.swapped[pid] = {}
+        return self.page_tables[pid]
+
+    def translate(self, pid: int, vaddrs, writes=None) -> "np.ndarray":
+        """Translate a batch of virtual addresses to physical byte addresses.
+
+        TLB misses walk the page table; first touches of a page fault it in
+        and pages out in swap are read back. `writes` (a bool or a mask the
+        shape of `vaddrs`) marks the pages that get dirtied. Addresses that
+        could not be backed by a frame come back as -1, as does the rest of
+        the batch if the OOM killer picks the process itself.
+
+        The batch is translated TRANSLATE_SLICE references at a time. Every
+        page a slice touches is pinned while the slice faults, so reclaim
+        never evicts a page the slice has just mapped; a page evicted
+        between slices faults again when it is next touched.
+        """
+        if pid not in self.memory_manager.regions:
+            raise ValueError(f"PID {pid} is not a running process")
+        vaddrs = np.asarray(vaddrs, dtype=np.int64)
+        if writes is not None and writes is not True:
+            writes = np.asarray(writes, dtype=bool)
+        physical = np.full(len(vaddrs), -1, dtype=np.int64)
+        for start in range(0, len(vaddrs), self.TRANSLATE_SLICE):
+            end = start + self.TRANSLATE_SLICE
+            physical[start:end] = self._translate_slice(
+                pid, vaddrs[start:end], writes if writes is None or writes is True else writes[start:end])
+            if pid not in self.page_tables:  # OOM-killed while faulting
+                break
+        return physical
+
+    def _translate_slice(self, pid: int, vaddrs, writes) -> "np.ndarray":
+        table = self.page_table(pid)
+        vpns = vaddrs >> PAGE_SHIFT
+        self.references += len(vaddrs)
+
+        self.tlb.access(vpns | (pid << 32))
+        # The TLB only models hit rates; every distinct page is walked once and the result reused
+        walked, inverse = np.unique(vpns, return_inverse=True)
+        frames = table.lookup(walked)
+        self._reference(pid, walked[frames >= 0])
+
+        faulting = walked[frames < 0]
+        if len(faulting):
+            self._pinned = (pid, set(walked.tolist()))
+            try:
+                failed = self._fault_in(pid, table, faulting)
+            finally:
+                self._pinned = (None, set())
+            self.memory_manager.game_manager.events.publish("memory")
+            if pid not in self.page_tables:
+                return np.full(len(vaddrs), -1, dtype=np.int64)
+            frames = table.lookup(walked)
+            unmapped = int((frames < 0).sum())
+            if unmapped != failed:
+                raise RuntimeError(f"{unmapped - failed} mapped pages of PID {pid} were lost mid-batch")
+
+        if writes is not None:
+            written = walked if writes is True else np.unique(vpns[np.asarray(writes, dtype=bool)])
+            resident = self.resident[pid]
+            self.dirty.update((pid, vpn) for vpn in written.tolist() if vpn in resident)
+
+        frames = frames[inverse].astype(np.int64)
+        return np.where(frames >= 0, frames * 1024 + (vaddrs & (PAGE_SIZE - 1)), -1)
+
+    def release(self, pid: int):
+        """Free every frame and swap slot a process held"""
+        table = self.page_tables.pop(pid, None)
+        resident = self.resident.pop(pid, {})
+        for vpn, frame in resident.items():
+            key = (pid, vpn)
+            del self._clock[key]
+            self.dirty.discard(key)
+            slot = self.swap_cache.pop(key, None)
+            if slot is not None:
+                self.memory_manager.swap.free_slot(slot)
+            self.memory_manager.allocator.free(frame)
+        for slot in self.swapped.pop(pid, {}).values():
+            self.memory_manager.swap.free_slot(slot)
+        if table is not None:
+            self.tlb.invalidate(pid)
+
+    def reclaim(self, pages: int = SwapSpace.WRITEBACK_BATCH) -> int:
+        """Swap out up to `pages` unreferenced pages; returns the frames freed.
+
+        The clock hand clears referenced bits as it passes, so a page is only
+        evicted if it has not been touched since the hand last went by.
+        """
+        swap = self.memory_manager.swap
+        clock = self._clock
+        pinned_pid, pinned = self._pinned
+        victims = {}  # pid -> [vpn]
+        freed = 0
+        for _ in range(2 * len(clock)):
+            if freed >= pages or not clock:
+                break
+            key, referenced = clock.popitem(last=False)
+            pid, vpn = key
+            if pid == pinned_pid and vpn in pinned:
+                clock[key] = True
+                continue
+            if referenced:
+                clock[key] = False
+                continue
+
+            slot = self.swap_cache.pop(key, None)
+            if slot is None:
+                slot = swap.allocate_slot()
+                if slot is None:  # Swap is full
+                    clock[key] = False
+                    break
+                swap.write(slot, self._page_image(pid, vpn))
+            elif key in self.dirty:
+                swap.write(slot, self._page_image(pid, vpn))
+            self.dirty.discard(key)
+
+            self.memory_manager.allocator.free(self.resident[pid].pop(vpn))
+            self.swapped[pid][vpn] = slot
+            victims.setdefault(pid, []).append(vpn)
+            freed += 1
+
+        swap.flush()
+        for pid, vpns in victims.items():
+            self.page_tables[pid].unmap(np.array(vpns, dtype=np.int64))
+            self.tlb.flush([pid << 32 | vpn for vpn in vpns])
+        self.evictions += freed
+        return freed
+
+    def _reference(self, pid: int, vpns):
+        clock = self._clock
+        for vpn in vpns.tolist():
+            clock[(pid, vpn)] = True
+
+    @staticmethod
+    def _page_image(pid: int, vpn: int) -> bytes:
+        """Stand-in page contents: the page's own (pid, vpn) tag repeated"""
+        return (pid << 32 | vpn).to_bytes(8, "little") * (PAGE_SIZE // 8)
+
+    def _fault_in(self, pid: int, table: PageTable, vpns) -> int:
+        """Back pages with frames; returns how many could not be backed"""
+        resident = self.resident[pid]
+        swapped = self.swapped[pid]
+        mapped_vpns = []
+        failed = 0
+        for vpn in vpns.tolist():
+            frame = self.memory_manager.allocate(PAGE_KB, ("page", pid), requester=pid)
+            if self.resident.get(pid) is not resident:  # The OOM killer chose this process
+                if frame is not None:
+                    self.memory_manager.allocator.free(frame)
+                return failed
+            if frame is None:
+                self.failed_faults += 1
+                failed += 1
+                continue
+
+            key = (pid, vpn)
+            slot = swapped.pop(vpn, None)
+            if slot is None:
+                self.dirty.add(key)  # Fresh anonymous page, no copy in swap yet
+            else:
+                page = self.memory_manager.swap.read(slot)
+                if page[:8] != (pid << 32 | vpn).to_bytes(8, "little"):
+                    raise RuntimeError(f"Swap slot {slot} does not hold page {vpn} of PID {pid}")
+                self.swap_cache[key] = slot
+            resident[vpn] = frame
+            self._clock[key] = True
+            mapped_vpns.append(vpn)
+        self.page_faults += len(vpns)
+
+        if mapped_vpns:
+            frames = [resident[vpn] for vpn in mapped_vpns]
+            table.map(np.array(mapped_vpns, dtype=np.int64), np.array(frames, dtype=np.int32))
+            self.memory_manager.note_footprint(pid)
+        return failed
+
+    def resident_pages(self) -> int:
+        return sum(len(pages) for pages in self.resident.values())
+
+    def get_status(self) -> Dict:
+        swap = self.memory_manager.swap
+        return {
+            "references": self.references,
+            "tlb_hits": self.tlb.hits,
+            "tlb_misses": self.tlb.misses,
+            "tlb_hit_rate": self.tlb.hit_rate * 100,
+            "page_faults": self.page_faults,
+            "failed_faults": self.failed_faults,
+            "resident_pages": self.resident_pages(),
+            "swapped_pages": sum(len(pages) for pages in self.swapped.values()),
+            "evictions": self.evictions,
+            "pswpin": swap.pswpin,
+            "pswpout": swap.pswpout,
+            "writebacks": swap.writebacks,
+            "page_table_bytes": sum(t.memory_bytes() for t in self.page_tables.values())
+        }
+
+class PageReplacementLab:
+    """Runs page-replacement algorithms over one reference string.
+
+    Next-use and previous-use indices are precomputed with NumPy. OPT
+    evicts by next use; LRU is a stack algorithm, so a single pass that
+    computes stack distances gives its fault count for every frame count.
+    """
+    ALGORITHMS = ("FIFO", "LRU", "Clock", "Second-Chance", "LFU", "Working-Set", "OPT")
+    REFERENCE_KINDS = ("locality", "random", "belady")
+
+    def __init__(self, references):
+        if np is None:
+            raise RuntimeError("NumPy is required for the page-replacement lab")
+        self.references = np.asarray(references, dtype=np.int64)
+        self.prev_use, self.next_use = self._use_indices()
+
+    @staticmethod
+    def reference_string(kind: str = "locality", length: int = 5000, pages: int = 32,
+                         seed: Optional[int] = None) -> "np.ndarray":
+        """Page reference string for the lab"""
+        if np is None:
+            raise RuntimeError("NumPy is required for the page-replacement lab")
+        if kind == "belady":  # Classic string that makes FIFO fault more with 4 frames than with 3
+            classic = np.array([1, 2, 3, 4, 1, 2, 5, 1, 2, 3, 4, 5])
+            return np.tile(classic, -(-length // len(classic)))[:length]
+        if kind == "random":
+            return np.random.default_rng(seed).integers(0, pages, size=length)
+        stream = generate_reference_stream(length * 8, pages=pages, run_length=8, seed=seed)
+        page_numbers = stream >> PAGE_SHIFT
+        keep = np.ones(len(page_numbers), dtype=bool)
+        keep[1:] = page_numbers[1:] != page_numbers[:-1]
+        return page_numbers[keep][:length] - 16
+
+    def run(self, max_frames: int) -> Dict[str, List[int]]:
+        """Fault counts for 1..max_frames frames, for every algorithm"""
+        return {name: self.fault_curve(name, max_frames) for name in self.ALGORITHMS}
+
+    def fault_curve(self, algorithm: str, max_frames: int) -> List[int]:
+        if algorithm == "LRU":
+            return self._lru_curve(max_frames)
+        if algorithm == "Working-Set":
+            return self._working_set_curve(max_frames)
+        simulate = {
+            "FIFO": self._fifo,
+            "Clock": self._clock,
+            "Second-Chance": self._second_chance,
+            "LFU": self._lfu,
+            "OPT": self._opt,
+        }[algorithm]
+        return [simulate(frames) for frames in range(1, max_frames + 1)]
+
+    @staticmethod
+    def belady_anomalies(curve: List[int]) -> List[int]:
+        """Frame counts F where F + 1 frames cause more faults than F"""
+        return [frames for frames, (fewer, more) in enumerate(zip(curve, curve[1:]), start=1) if more > fewer]
+
+    def _use_indices(self):
+        refs = self.references
+        count = len(refs)
+        order = np.argsort(refs, kind="stable")
+        same = refs[order][1:] == refs[order][:-1]
+        prev_use = np.full(count, -1, dtype=np.int64)
+        next_use = np.full(count, count, dtype=np.int64)
+        prev_use[order[1:][same]] = order[:-1][same]
+        next_use[order[:-1][same]] = order[1:][same]
+        return prev_use, next_use
+
+    def lru_stack_distances(self) -> "np.ndarray":
+        """Distinct pages touched since each reference's previous use (-1 if first use).
+
+        A Fenwick tree marks the latest occurrence of every page, so each
+        distance is a prefix-sum difference: O(n log n) overall. This is a
+        plain Python loop, not a NumPy pass; it runs once per lab and feeds
+        every frame count.
+        """
+        count = len(self.references)
+        tree = [0] * (count + 1)
+        distances = np.empty(count, dtype=np.int64)
+
+        def add(position, delta):
+            position += 1
+            while position <= count:
+                tree[position] += delta
+                position += position & -position
+
+        def prefix(position):  # Marks in [0, position)
+            total = 0
+            while position > 0:
+                total += tree[position]
+                position -= position & -position
+            return total
+
+        for i, previous in enumerate(self.prev_use.tolist()):
+            if previous < 0:
+                distances[i] = -1
+            else:
+                distances[i] = prefix(i) - prefix(previous + 1)
+                add(previous, -1)
+            add(i, 1)
+        return distances
+
+    def _lru_curve(self, max_frames: int) -> List[int]:
+        distances = self.lru_stack_distances()
+        cold = int((distances < 0).sum())
+        warm = distances[distances >= 0]
+        hits = np.cumsum(np.bincount(warm, minlength=max_frames)[:max_frames])  # Hit iff distance < frames
+        return [int(cold + len(warm) - hits[frames - 1]) for frames in range(1, max_frames + 1)]
+
+    def _working_set_curve(self, max_frames: int) -> List[int]:
+        """Faults of the largest working-set window whose mean resident set fits in F frames.
+
+        Histograms of reuse gaps and page lifetimes give faults and resident
+        set size for every window at once, so the curve is O(n) whatever
+        the frame count.
+        """
+        count = len(self.references)
+        positions = np.arange(count)
+        warm = self.prev_use >= 0
+        cold = count - int(warm.sum())
+
+        # A reference faults under window w iff it is a first use or its reuse gap exceeds w
+        gap_counts = np.bincount((positions - self.prev_use)[warm], minlength=count + 1)
+        faults = cold + int(warm.sum()) - np.cumsum(gap_counts)  # faults[w]
+
+        # A page stays in a window-w working set for min(lifetime, w + 1) references
+        lifetimes = np.minimum(self.next_use, count) - positions
+        lifetime_counts = np.bincount(lifetimes, minlength=count + 2)
+        spans = np.arange(count + 2)
+        short_total = np.cumsum(spans * lifetime_counts)  # Sum of lifetimes <= span
+        longer = count - np.cumsum(lifetime_counts)  # Lifetimes > span
+        windows = np.arange(1, count + 1)
+        resident_total = short_total[windows + 1] + (windows + 1) * longer[windows + 1]  # mean size * count
+
+        # The resident set grows with the window, so the largest fitting window is a search away
+        fitting = np.searchsorted(resident_total, np.arange(1, max_frames + 1) * count, side="right")
+        return [int(faults[fits]) if fits else count for fits in fitting.tolist()]
+
+    def _fifo(self, frames: int) -> int:
+        resident, queue, faults = set(), deque(), 0
+        for page in self.references.tolist():
+            if page in resident:
+                continue
+            faults += 1
+            if len(resident) >= frames:
+                resident.discard(queue.popleft())
+            queue.append(page)
+            resident.add(page)
+        return faults
+
+    def _clock(self, frames: int) -> int:
+        slots, referenced, where = [None] * frames, [False] * frames, {}
+        hand = faults = 0
+        for page in self.references.tolist():
+            slot = where.get(page)
+            if slot is not None:
+                referenced[slot] = True
+                continue
+            faults += 1
+            while referenced[hand]:
+                referenced[hand] = False
+                hand = (hand + 1) % frames
+            if slots[hand] is not None:
+                del where[slots[hand]]
+            slots[hand] = page
+            where[page] = hand
+            hand = (hand + 1) % frames
+        return faults
+
+    def _second_chance(self, frames: int) -> int:
+        queue, referenced, faults = deque(), {}, 0
+        for page in self.references.tolist():
+            if page in referenced:
+                referenced[page] = True
+                continue
+            faults += 1
+            if len(queue) >= frames:
+                while referenced[queue[0]]:
+                    referenced[queue[0]] = False
+                    queue.rotate(-1)
+                del referenced[queue.popleft()]
+            queue.append(page)
+            referenced[page] = False
+        return faults
+
+    def _lfu(self, frames: int) -> int:
+        """Least frequently used (while resident); ties go to the oldest entry"""
+        counts, stamps, heap, faults = {}, {}, [], 0
+        for stamp, page in enumerate(self.references.tolist()):
+            if page in counts:
+                counts[page] += 1
+            else:
+                faults += 1
+                if len(counts) >= frames:
+                    while True:
+                        count, entry_stamp, victim = heapq.heappop(heap)
+                        if stamps.get(victim) == entry_stamp:
+                            del counts[victim], stamps[victim]
+                            break
+                counts[page] = 1
+            stamps[page] = stamp
+            heapq.heappush(heap, (counts[page], stamp, page))
+        return faults
+
+    def _opt(self, frames: int) -> int:
+        """Belady's optimal policy: evict the page used furthest in the future"""
+        resident, heap, faults = {}, [], 0
+        for page, next_use in zip(self.references.tolist(), self.next_use.tolist()):
+            if page not in resident:
+                faults += 1
+                if len(resident) >= frames:
+                    while True:
+                        negative_use, victim = heapq.heappop(heap)
+                        if resident.get(victim) == -negative_use:
+                            del resident[victim]
+                            break
+            resident[page] = next_use
+            heapq.heappush(heap, (-next_use, page))
+        return faults
+
 class GameMemoryManager:
-    def __init__(self, game_manager):
+    KERNEL_RESERVED = 1024
+    SWAP_SIZE = 16384
+    POLICIES = ContiguousAllocator.POLICIES + ("buddy",)
+    THRASH_SWAPINS = 256  # Swap-ins between pressure checks that count as thrashing
+
+    def __init__(self, game_manager, policy: str = "first-fit"):
         self.game_manager = game_manager
         self.total_memory = 8192
-        self.used_memory = random.randint(1000, 2000)
-        self.free_memory = self.total_memory - self.used_memory
+        if policy == "buddy":
+            self.allocator = BuddyAllocator(self.total_memory)
+        else:
+            self.allocator = ContiguousAllocator(self.total_memory, policy)
+        self.regions = {}  # pid -> start address
+        self.pcbs = {}  # pid -> task_struct handle
+        self.allocator.allocate(self.KERNEL_RESERVED, owner="kernel")
+        self._virtual_memory = None
+        self._swap = None
+
+        # Free-memory watermarks (KB): background reclaim starts below "low"
+        # and runs until "high"; below "min" the system is in trouble
+        self.watermarks = {"min": self.total_memory * 2 // 100,
+                           "low": self.total_memory * 5 // 100,
+                           "high": self.total_memory * 10 // 100}
+        self.pressure = "ok"
+        self.thrashing = False
+        self.reclaimed = 0  # KB freed by reclaim passes
+        self._last_swapins = 0
+        self.oom_handler = None  # Called with the requesting pid; kills a process and returns True
+        self._badness = []  # Heap of (-footprint, pid), revalidated lazily
+
+        # Object caches for fixed-size kernel objects (sizes in bytes)
+        self.slab_caches = {
+            "task_struct": SlabCache("task_struct", 512, self.allocator),
+            "inode": SlabCache("inode", 256, self.allocator),
+        }
+
+    @property
+    def used_memory(self) -> int:
+        return self.allocator.used
+
+    @property
+    def virtual_memory(self) -> VirtualMemory:
+        """Paging subsystem, created on first use (needs NumPy)"""
+        if self._virtual_memory is None:
+            self._virtual_memory = VirtualMemory(self)
+        return self._virtual_memory
+
+    @property
+    def swap(self) -> SwapSpace:
+        """Swap area, created on first use"""
+        if self._swap is None:
+            self._swap = SwapSpace(self.SWAP_SIZE)
+        return self._swap
+
+    @property
+    def free_memory(self) -> int:
+        return self.allocator.free_memory
+
+    def set_policy(self, policy: str):
+        """Switch the placement policy used for future allocations"""
+        if policy not in ContiguousAllocator.POLICIES or not isinstance(self.allocator, ContiguousAllocator):
+            raise ValueError(f"Cannot switch {self.allocator.policy} memory to {policy}")
+        self.allocator.policy = policy
+        self.game_manager.events.publish("memory")
+
+    def allocate(self, size: int, owner, requester: Optional[int] = None) -> Optional[int]:
+        """Allocate from the arena, reclaiming and then OOM-killing on failure"""
+        start = self.allocator.allocate(size, owner=owner)
+        if start is None and self.reclaim(size):
+            start = self.allocator.allocate(size, owner=owner)
+        while start is None and self.oom_handler is not None and self.oom_handler(requester):
+            start = self.allocator.allocate(size, owner=owner)
+        return start
+
+    def allocate_process(self, pid: int, size: int) -> bool:
+        """Allocate a process image and its control block"""
+        start = self.allocate(size, pid, requester=pid)
+        if start is None:
+            return False
+        pcb = self.alloc_object("task_struct")
+        if pcb is None:
+            self.allocator.free(start)
+            return False
+        self.regions[pid] = start
+        self.pcbs[pid] = pcb
+        self.note_footprint(pid)
+        self.game_manager.events.publish("memory")
+        return True
+
+    def free_process(self, pid: int) -> int:
+        """Free a process image and control block; returns the image size freed"""
+        pcb = self.pcbs.pop(pid, None)
+        if pcb is not None:
+            self.free_object("task_struct", pcb)
+        if self._virtual_memory is not None:
+            self._virtual_memory.release(pid)
+        start = self.regions.pop(pid, None)
+        self.game_manager.events.publish("memory")
+        return 0 if start is None else self.allocator.free(start)
+
+    def reclaim(self, target: int) -> int:
+        """Try to free `target` KB: shrink slab caches, then swap out pages"""
+        before = self.free_memory
+        for cache in self.slab_caches.values():
+            cache.shrink()
+        if self._virtual_memory is not None:
+            while self.free_memory - before < target and self._virtual_memory.reclaim():
+                pass
+        freed = max(self.free_memory - before, 0)
+        self.reclaimed += freed
+        if freed:
+            self.game_manager.events.publish("memory")
+        return freed
+
+    def footprint(self, pid: int) -> int:
+        """KB charged to a process: image plus resident and swapped pages"""
+        start = self.regions.get(pid)
+        if start is None:
+            return 0
+        total = self.allocator.block_size(start)
+        vm = self._virtual_memory
+        if vm is not None:
+            total += (len(vm.resident.get(pid, ())) + len(vm.swapped.get(pid, ()))) * PAGE_KB
+        return total
+
+    def note_footprint(self, pid: int):
+        """Record a process's grown footprint in the OOM badness heap"""
+        heapq.heappush(self._badness, (-self.footprint(pid), pid))
+        if len(self._badness) > 4 * len(self.regions) + 64:  # Too many stale entries
+            self._badness = [(-self.footprint(p), p) for p in self.regions]
+            heapq.heapify(self._badness)
+
+    def select_victim(self, exclude=()) -> Optional[int]:
+        """Process with the largest footprint, skipping `exclude`.
+
+        Entries go stale as processes shrink or exit; a popped entry whose
+        score no longer matches is pushed back with its current score.
+        """
+        heap = self._badness
+        skipped = []
+        victim = None
+        while heap:
+            negative_score, pid = heapq.heappop(heap)
+            if pid not in self.regions:
+                continue
+            score = self.footprint(pid)
+            if score != -negative_score:
+                heapq.heappush(heap, (-score, pid))
+            elif pid in exclude:
+                skipped.append((negative_score, pid))
+            else:
+                victim = pid
+                skipped.append((negative_score, pid))
+                break
+        for entry in skipped:
+            heapq.heappush(heap, entry)
+        return victim
+
+    def check_pressure(self) -> Dict:
+        """Compare free memory with the watermarks, run background reclaim and
+        detect thrashing; level changes are posted as notifications"""
+        free = self.free_memory
+        if free < self.watermarks["low"]:
+            self.reclaim(self.watermarks["high"] - free)
+            free = self.free_memory
+        level = "min" if free < self.watermarks["min"] else "low" if free < self.watermarks["low"] else "ok"
+
+        swapins = 0 if self._swap is None else self._swap.pswpin
+        recent_swapins = swapins - self._last_swapins
+        thrashing = recent_swapins >= self.THRASH_SWAPINS
+        self._last_swapins = swapins
+
+        if level != self.pressure or thrashing != self.thrashing:
+            self.game_manager.events.publish("memory")
+        if level != self.pressure:
+            if level == "ok":
+                self.game_manager.add_notification("✅ Memory pressure relieved")
+            else:
+                self.game_manager.add_notification(
+                    f"⚠️ Memory pressure: {free:,} KB free, below the {level} watermark", "warning")
+        if thrashing and not self.thrashing:
+            self.game_manager.add_notification(
+                f"🌀 Thrashing: {recent_swapins:,} pages swapped back in since the last check", "warning")
+        self.pressure = level
+        self.thrashing = thrashing
+        return {"level": level, "free": free, "thrashing": thrashing}
+
+    def alloc_object(self, cache: str) -> Optional[int]:
+        """Allocate a kernel object from a slab cache"""
+        return self.slab_caches[cache].alloc()
+
+    def free_object(self, cache: str, handle: int):
+        self.slab_caches[cache].free(handle)
 
     def get_status(self) -> Dict:
         utilization = (self.used_memory / self.total_memory) * 100
@@ -1098,15 +3368,554 @@ class GameMemoryManager:
             "total": self.total_memory,
             "used": self.used_memory,
             "free": self.free_memory,
-            "utilization": utilization
+            "utilization": utilization,
+            "policy": self.allocator.policy,
+            "free_blocks": len(self.allocator.free_blocks()),
+            "largest_free": self.allocator.largest_free_block,
+            "fragmentation": self.allocator.fragmentation() * 100,
+            "internal_fragmentation": self.allocator.internal_fragmentation() * 100,
+            "failed_allocations": self.allocator.failed_allocations,
+            "swap_total": self.SWAP_SIZE,
+            "swap_used": 0 if self._swap is None else self._swap.used_slots * PAGE_KB,
+            "pressure": self.pressure,
+            "thrashing": self.thrashing,
+            "watermarks": dict(self.watermarks),
+            "reclaimed": self.reclaimed,
+            "slabs": {name: cache.stats() for name, cache in self.slab_caches.items()}
+        }
+
+class ProducerConsumerGame:
+    """Bounded-buffer producer-consumer mini-game running on the kernel scheduler.
+
+    Strategies:
+    - "semaphores": wait(empty) then lock(mutex) - the textbook solution
+    - "monitor": mutex plus not_full/not_empty condition variables
+    - "lock-first": lock(mutex) then wait(empty) - deadlocks under pressure
+    """
+    STRATEGIES = ("semaphores", "monitor", "lock-first")
+
+    def __init__(self, kernel, buffer_size: int = 5, producers: int = 2, consumers: int = 2,
+                 strategy: str = "semaphores", seed: Optional[int] = None):
+        if strategy not in self.STRATEGIES:
+            raise ValueError(f"Unknown strategy: {strategy}")
+        self.kernel = kernel
+        self.scheduler = kernel.scheduler
+        self.buffer_size = buffer_size
+        self.producer_count = producers
+        self.consumer_count = consumers
+        self.strategy = strategy
+        self.rng = random.Random(seed)
+
+        self.buffer = deque()
+        self.mutex = self.scheduler.mutex("buffer_lock")
+        self.empty = self.scheduler.semaphore(buffer_size, "empty_slots")
+        self.full = self.scheduler.semaphore(0, "full_slots")
+        self.not_full = self.scheduler.condition("not_full")
+        self.not_empty = self.scheduler.condition("not_empty")
+
+        self.pids = []
+        self.produced = 0
+        self.consumed = 0
+        self.start_clock = None
+        self.deadlocked = False
+        self.running = False
+
+    def start(self):
+        """Spawn producer and consumer processes"""
+        self.start_clock = self.scheduler.clock
+        self.running = True
+        process_manager = self.kernel.process_manager
+        for i in range(self.producer_count):
+            self.pids.append(process_manager.create_process(
+                f"producer{i + 1}", "/usr/games/buffer --produce", game_action=False, task=self._producer()))
+        for i in range(self.consumer_count):
+            self.pids.append(process_manager.create_process(
+                f"consumer{i + 1}", "/usr/games/buffer --consume", game_action=False, task=self._consumer()))
+        self.pids = [pid for pid in self.pids if pid is not None]  # Skip any that ran out of memory
+
+    def step(self, ticks: int = 1):
+        """Advance the virtual clock, stopping early on deadlock"""
+        for _ in range(ticks):
+            if not self.running:
+                return
+            self.scheduler.tick()
+            if self.scheduler.detect_deadlock(self.pids):
+                self.deadlocked = True
+                self.running = False
+
+    def stop(self) -> Dict:
+        """End the round, reap the game processes and return the result"""
+        self.running = False
+        for pid in self.pids:
+            self.kernel.process_manager.exit_process(pid)
+        return self.result()
+
+    def run(self, ticks: int) -> Dict:
+        """Play a whole round headlessly"""
+        self.start()
+        self.step(ticks)
+        return self.stop()
+
+    @property
+    def elapsed(self) -> int:
+        return 0 if self.start_clock is None else self.scheduler.clock - self.start_clock
+
+    def result(self) -> Dict:
+        throughput = self.consumed / self.elapsed if self.elapsed else 0.0
+        score = self.consumed * 10 + (-500 if self.deadlocked else 250)  # Deadlock-free bonus
+        return {
+            "strategy": self.strategy,
+            "ticks": self.elapsed,
+            "produced": self.produced,
+            "consumed": self.consumed,
+            "throughput": throughput,
+            "deadlocked": self.deadlocked,
+            "score": max(score, 0)
         }
 
+    def _work(self):
+        for _ in range(self.rng.randint(1, 3)):
+            yield None
+
+    def _producer(self):
+        while True:
+            yield from self._work()  # Produce an item
+            if self.strategy == "monitor":
+                yield ("lock", self.mutex)
+                while len(self.buffer) >= self.buffer_size:
+                    yield ("cond_wait", self.not_full, self.mutex)
+                self.buffer.append(self.produced)
+                self.produced += 1
+                yield ("cond_signal", self.not_empty)
+                yield ("unlock", self.mutex)
+            else:
+                if self.strategy == "lock-first":
+                    yield ("lock", self.mutex)
+                    yield ("wait", self.empty)
+                else:
+                    yield ("wait", self.empty)
+                    yield ("lock", self.mutex)
+                self.buffer.append(self.produced)
+                self.produced += 1
+                yield ("unlock", self.mutex)
+                yield ("signal", self.full)
+
+    def _consumer(self):
+        while True:
+            if self.strategy == "monitor":
+                yield ("lock", self.mutex)
+                while not self.buffer:
+                    yield ("cond_wait", self.not_empty, self.mutex)
+                self.buffer.popleft()
+                self.consumed += 1
+                yield ("cond_signal", self.not_full)
+                yield ("unlock", self.mutex)
+            else:
+                if self.strategy == "lock-first":
+                    yield ("lock", self.mutex)
+                    yield ("wait", self.full)
+                else:
+                    yield ("wait", self.full)
+                    yield ("lock", self.mutex)
+                self.buffer.popleft()
+                self.consumed += 1
+                yield ("unlock", self.mutex)
+                yield ("signal", self.empty)
+            yield from self._work()  # Consume the item
+
+class Disk:
+    """Moving-head disk: a block map, an I/O request queue and arm scheduling.
+
+    Block b sits on cylinder b // blocks_per_cylinder. Requests queue up
+    until dispatch(), which services the whole batch with the current
+    algorithm, the way an elevator works through the requests waiting at
+    the time. SCAN and C-SCAN travel to the last cylinder before turning
+    around; C-SCAN and C-LOOK count the return sweep as seek distance.
+    """
+    ALGORITHMS = ("FCFS", "SSTF", "SCAN", "C-SCAN", "LOOK", "C-LOOK")
+    BLOCK_SIZE = 4096  # Bytes
+
+    def __init__(self, cylinders: int = 1024, blocks_per_cylinder: int = 64, algorithm: str = "LOOK",
+                 queue_depth: int = 64):
+        if algorithm not in self.ALGORITHMS:
+            raise ValueError(f"Unknown disk scheduling algorithm: {algorithm}")
+        self.cylinders = cylinders
+        self.blocks_per_cylinder = blocks_per_cylinder
+        self.blocks = cylinders * blocks_per_cylinder
+        self.algorithm = algorithm
+        self.queue_depth = queue_depth  # Dispatch automatically once this many requests wait
+        self.head = 0
+        self.direction = 1
+        self.queue = []  # Cylinders of pending requests, in arrival order
+        self.last_path = [0]  # Head positions visited by the last dispatch
+        self._block_map = bytearray(self.blocks)  # 1 = block in use
+        self.used_blocks = 0
+        self.reads = 0
+        self.writes = 0
+        self.served = 0
+        self.dispatches = 0
+        self.total_seek = 0
+
+    def group_start(self, key: str) -> int:
+        """First block of the cylinder group a directory's files are placed in"""
+        return zlib.crc32(key.encode()) % self.cylinders * self.blocks_per_cylinder
+
+    def allocate_blocks(self, count: int, goal: int = 0) -> Optional[List[int]]:
+        """Take `count` free blocks, searching forward from `goal` and wrapping"""
+        if count > self.blocks - self.used_blocks:
+            return None
+        blocks = []
+        position = goal
+        while len(blocks) < count:
+            block = self._block_map.find(0, position)
+            if block < 0:
+                block = self._block_map.find(0)
+            self._block_map[block] = 1
+            blocks.append(block)
+            position = block + 1
+        self.used_blocks += count
+        return blocks
+
+    def free_blocks(self, blocks: List[int]):
+        for block in blocks:
+            self._block_map[block] = 0
+        self.used_blocks -= len(blocks)
+
+    def submit(self, blocks: List[int], write: bool = False):
+        """Queue block I/O; the queue is dispatched once it reaches queue_depth"""
+        if write:
+            self.writes += len(blocks)
+        else:
+            self.reads += len(blocks)
+        self.queue.extend(block // self.blocks_per_cylinder for block in blocks)
+        if len(self.queue) >= self.queue_depth:
+            self.dispatch()
+
+    def dispatch(self) -> int:
+        """Service every queued request; returns the seek distance in cylinders"""
+        if not self.queue:
+            return 0
+        path = self.seek_path(self.queue, self.head, self.algorithm, self.cylinders, self.direction)
+        seek = int(np.abs(np.diff(path)).sum())
+        if self.algorithm in ("SCAN", "LOOK"):  # The sweep turns if anything was behind the head
+            behind = min(self.queue) < self.head if self.direction > 0 else max(self.queue) > self.head
+            if behind:
+                self.direction = -self.direction
+        self.head = int(path[-1])
+        self.last_path = path.tolist()
+        self.served += len(self.queue)
+        self.dispatches += 1
+        self.total_seek += seek
+        self.queue = []
+        return seek
+
+    def get_status(self) -> Dict:
+        return {
+            "algorithm": self.algorithm,
+            "head": self.head,
+            "queued": len(self.queue),
+            "reads": self.reads,
+            "writes": self.writes,
+            "served": self.served,
+            "dispatches": self.dispatches,
+            "total_seek": self.total_seek,
+            "average_seek": self.total_seek / self.served if self.served else 0.0,
+            "used_blocks": self.used_blocks,
+            "blocks": self.blocks
+        }
+
+    @staticmethod
+    def seek_path(requests, head: int, algorithm: str, cylinders: int, direction: int = 1) -> "np.ndarray":
+        """Head positions (starting at `head`) visited while servicing one batch"""
+        requests = np.asarray(requests, dtype=np.int64)
+        if algorithm == "FCFS":
+            return np.concatenate(([head], requests))
+        if algorithm == "SSTF":
+            ordered = np.sort(requests).tolist()
+            return np.array([head] + Disk._sstf(ordered, head)[2], dtype=np.int64)
+
+        if direction < 0:  # Mirror the disk so every sweep starts upwards
+            mirrored = Disk.seek_path(cylinders - 1 - requests, cylinders - 1 - head, algorithm, cylinders)
+            return cylinders - 1 - mirrored
+
+        ordered = np.sort(requests)
+        split = np.searchsorted(ordered, head)
+        above, below = ordered[split:], ordered[:split]
+        end = cylinders - 1
+        if algorithm == "SCAN":
+            parts = [above, [end], below[::-1]] if len(below) else [above]
+        elif algorithm == "C-SCAN":
+            parts = [above, [end, 0], below] if len(below) else [above]
+        elif algorithm == "LOOK":
+            parts = [above, below[::-1]]
+        else:  # C-LOOK
+            parts = [above, below]
+        return np.concatenate([[head]] + [np.asarray(part, dtype=np.int64) for part in parts])
+
+    @staticmethod
+    def _sstf(ordered: List[int], head: int):
+        """Shortest seek time first over sorted requests.
+
+        The served requests always form a contiguous run of the sorted
+        order, so the next one is the nearer of the run's two neighbours.
+        Returns (seek, final head, visit order).
+        """
+        right = bisect.bisect_left(ordered, head)
+        left = right - 1
+        seek = 0
+        order = []
+        while left >= 0 or right < len(ordered):
+            if right >= len(ordered) or (left >= 0 and head - ordered[left] <= ordered[right] - head):
+                target = ordered[left]
+                left -= 1
+            else:
+                target = ordered[right]
+                right += 1
+            seek += abs(target - head)
+            head = target
+            order.append(target)
+        return seek, head, order
+
+    @staticmethod
+    def compare(requests, cylinders: int, head: int = 0, depth: int = 64) -> Dict[str, int]:
+        """Total seek distance of every algorithm over a request stream served
+        in batches of `depth`; rows are sorted once in NumPy and each sweep's
+        length comes from its batch's extremes"""
+        requests = np.asarray(requests, dtype=np.int64)
+        batches = len(requests) // depth
+        rows = np.sort(requests[:batches * depth].reshape(batches, depth), axis=1)
+        tail = np.sort(requests[batches * depth:])
+        lows = rows[:, 0].tolist() + ([int(tail[0])] if len(tail) else [])
+        highs = rows[:, -1].tolist() + ([int(tail[-1])] if len(tail) else [])
+        end = cylinders - 1
+
+        def row(i):
+            return rows[i] if i < batches else tail
+
+        totals = {"FCFS": int(np.abs(np.diff(np.concatenate(([head], requests)))).sum())}
+
+        position, seek = head, 0
+        for i in range(len(lows)):
+            step, position, _ = Disk._sstf(row(i).tolist(), position)
+            seek += step
+        totals["SSTF"] = seek
+
+        for algorithm in ("SCAN", "LOOK"):
+            position, direction, seek = head, 1, 0
+            for low, high in zip(lows, highs):
+                if direction < 0:  # Mirror the disk so the sweep runs upwards
+                    low, high, position = end - high, end - low, end - position
+                if low >= position:
+                    seek += high - position
+                    position = high
+                    turned = False
+                else:
+                    top = end if algorithm == "SCAN" else max(high, position)
+                    seek += (top - position) + (top - low)
+                    position = low
+                    turned = True
+                if direction < 0:
+                    position = end - position
+                if turned:
+                    direction = -direction
+            totals[algorithm] = seek
+
+        for algorithm in ("C-SCAN", "C-LOOK"):
+            position, seek = head, 0
+            for i, (low, high) in enumerate(zip(lows, highs)):
+                if low >= position:
+                    seek += high - position
+                    position = high
+                    continue
+                current = row(i)
+                below = int(current[np.searchsorted(current, position) - 1])  # Last request below the head
+                if algorithm == "C-SCAN":
+                    seek += (end - position) + end + below
+                else:
+                    top = max(high, position)
+                    seek += (top - position) + (top - low) + (below - low)
+                position = below
+            totals[algorithm] = seek
+        return {algorithm: totals[algorithm] for algorithm in Disk.ALGORITHMS}
+
+    @staticmethod
+    def request_stream(count: int, cylinders: int = 1024, seed: Optional[int] = None) -> "np.ndarray":
+        """Random cylinder requests: half uniform, half around a drifting hot spot"""
+        rng = np.random.default_rng(seed)
+        hot_spot = (np.arange(count) * 4 * cylinders // max(count, 1)) % cylinders
+        clustered = (hot_spot + rng.normal(0, cylinders / 32, size=count)).astype(np.int64) % cylinders
+        return np.where(rng.random(count) < 0.5, rng.integers(0, cylinders, size=count), clustered)
+
+class JobCancelled(Exception):
+    """Raised inside a job's function once the job has been cancelled"""
+
+class Job:
+    """A function running on a WorkerPool thread, with a handle for progress and cancellation"""
+    def __init__(self, job_id: int, name: str, function, args: tuple, on_done=None):
+        self.id = job_id
+        self.name = name
+        self.function = function
+        self.args = args
+        self.on_done = on_done  # Called on the Tk thread with the job once it ended, however it ended
+        self.state = "queued"  # queued, running, done, failed or cancelled; only set on the Tk thread
+        self.progress = 0.0
+        self.detail = ""
+        self.result = None
+        self.error = None
+        self.submitted = time.perf_counter()
+        self.cancelled = threading.Event()
+        self._messages = None
+
+    @property
+    def active(self) -> bool:
+        return self.state in ("queued", "running")
+
+    def cancel(self):
+        self.cancelled.set()
+
+    # Called from the job's function, on the worker thread
+    def check(self):
+        """Stop the job here if it was cancelled"""
+        if self.cancelled.is_set():
+            raise JobCancelled()
+
+    def report(self, progress: float, detail: str = ""):
+        self._post("progress", (progress, detail))
+
+    def apply(self, function, *args):
+        """Have the Tk thread run function(*args), the only way a job may change kernel state"""
+        self._post("apply", (function, args))
+
+    def _post(self, kind: str, payload):
+        while True:  # The queue is bounded: wait for the Tk thread, but not past a cancel
+            self.check()
+            try:
+                self._messages.put((self, kind, payload), timeout=0.1)
+                return
+            except queue.Full:
+                pass
+
+class WorkerPool:
+    """Worker threads for long jobs: simulations, bulk file operations and the like.
+
+    Threading rules: kernel and game state belong to the Tk thread, and
+    EventBus.publish() raises if it is changed anywhere else. A job's
+    function gets its inputs as arguments, computes on them freely, and
+    hands kernel changes back with job.apply(); progress and results go
+    through the same bounded queue. The Tk thread drains it with drain(),
+    a time budget at a time, so applied batches never freeze the window,
+    and calls each job's on_done there. Cancellation is cooperative: a
+    cancelled job stops at its next check(), report() or apply(). If an
+    applied function or on_done raises, the job is cancelled and ends as
+    failed with that error.
+    """
+    WORKERS = 2
+    KEEP = 50  # Finished jobs kept for the jobs window
+
+    def __init__(self, workers: int = WORKERS, listener=None):
+        self.jobs = OrderedDict()  # id -> Job, oldest first
+        self.listener = listener  # Called on the Tk thread whenever a job changed
+        self.messages = queue.Queue(maxsize=256)
+        self._work = queue.Queue()
+        self._ids = itertools.count(1)
+        self._threads = [threading.Thread(target=self._run, name=f"worker-{i}", daemon=True)
+                         for i in range(workers)]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, name: str, function, *args, on_done=None) -> Job:
+        """Queue function(job, *args) for a worker"""
+        job = Job(next(self._ids), name, function, args, on_done)
+        job._messages = self.messages
+        self.jobs[job.id] = job
+        finished = [job_id for job_id, old in self.jobs.items() if not old.active]
+        for job_id in finished[:max(0, len(finished) - self.KEEP)]:
+            del self.jobs[job_id]
+        self._work.put(job)
+        if self.listener is not None:
+            self.listener()
+        return job
+
+    def active(self) -> List[Job]:
+        return [job for job in self.jobs.values() if job.active]
+
+    def _run(self):
+        while True:
+            job = self._work.get()
+            if job is None:
+                return
+            if job.cancelled.is_set():
+                self.messages.put((job, "cancelled", None))
+                continue
+            self.messages.put((job, "running", None))
+            try:
+                result = job.function(job, *job.args)
+            except JobCancelled:
+                self.messages.put((job, "cancelled", None))
+            except Exception as e:
+                self.messages.put((job, "failed", e))
+            else:
+                self.messages.put((job, "done", result))
+
+    def drain(self, budget: float = 0.02) -> int:
+        """Handle queued job messages for up to `budget` seconds; returns how many"""
+        deadline = time.perf_counter() + budget
+        handled = 0
+        while time.perf_counter() < deadline:
+            try:
+                job, kind, payload = self.messages.get_nowait()
+            except queue.Empty:
+                break
+            handled += 1
+            if kind == "apply":
+                if not job.cancelled.is_set():
+                    function, args = payload
+                    try:
+                        function(*args)
+                    except Exception as e:
+                        # Stays active until the worker notices the cancel, then ends as failed
+                        job.error = e
+                        job.cancel()
+                continue
+            if kind == "progress":
+                if not job.cancelled.is_set():  # Keep the detail a cancel left
+                    job.progress, job.detail = payload
+            elif kind == "running":
+                job.state = "running"
+            else:
+                if job.error is not None:
+                    kind = "failed"
+                elif kind == "done" and job.cancelled.is_set():  # Its queued applies were skipped
+                    kind = "cancelled"
+                elif kind == "done":
+                    job.progress, job.result = 1.0, payload
+                elif kind == "failed":
+                    job.error = payload
+                job.state = kind
+                if job.on_done is not None:
+                    try:
+                        job.on_done(job)
+                    except Exception as e:
+                        job.state, job.error = "failed", e
+                        job.cancel()
+        if handled and self.listener is not None:
+            self.listener()
+        return handled
+
+    def shutdown(self):
+        for job in self.active():
+            job.cancel()
+        for _ in self._threads:
+            self._work.put(None)
+
 class GameKernel:
-    def __init__(self):
+    def __init__(self, memory_policy: str = "first-fit"):
         self.game_manager = GameManager()
-        self.filesystem = GameFileSystem(self.game_manager)
-        self.process_manager = GameProcessManager(self.game_manager)
-        self.memory_manager = GameMemoryManager(self.game_manager)
+        self.memory_manager = GameMemoryManager(self.game_manager, memory_policy)
+        self.disk = Disk() if np is not None else None  # Disk scheduling is vectorized with NumPy
+        self.filesystem = GameFileSystem(self.game_manager, self.memory_manager, self.disk)
+        self.process_manager = GameProcessManager(self.game_manager, self.memory_manager)
+        self.scheduler = self.process_manager.scheduler
         self.boot_time = datetime.now()
 
     def get_system_info(self):
@@ -1121,10 +3930,1275 @@ class GameKernel:
             "total_xp": self.game_manager.stats.total_xp
         }
 
+class SaveGame:
+    """Persistent game progress: a compact snapshot plus an append-only event log.
+
+    The file system and process manager journal their changes; stats,
+    achievements and missions are diffed against what was last logged.
+    save() runs on the Tk thread and only collects records. A writer thread
+    appends them to the log and, every SNAPSHOT_EVERY records, writes a new
+    snapshot (to a temporary file, then os.replace) and truncates the log.
+    Records carry sequence numbers, so records already folded into the
+    snapshot are skipped if a crash leaves them in the log.
+    """
+    DEFAULT_DIR = os.path.join(os.path.expanduser("~"), ".pyos_gameos")
+    SNAPSHOT = "snapshot.json"
+    LOG = "events.jsonl"
+    VERSION = 1
+    SNAPSHOT_EVERY = 5000  # Log records before they are folded into a new snapshot
+    TRANSIENT_STATS = ("listener", "processes_running")  # Not saved: rebuilt by the running kernel
+
+    def __init__(self, kernel, directory: Optional[str] = None):
+        self.kernel = kernel
+        self.directory = directory or self.DEFAULT_DIR
+        self.snapshot_path = os.path.join(self.directory, self.SNAPSHOT)
+        self.log_path = os.path.join(self.directory, self.LOG)
+        self.seq = 0  # Sequence number of the last record handed to the writer
+        self.log_records = 0  # Records logged since the last snapshot
+        self.error = None  # Last error from the writer thread
+        self._journal = []
+        self._last = None  # Last logged stats, achievements and missions
+        self._jobs = queue.Queue()
+        self._writer = None
+
+    # Capturing state
+    def _stats_state(self) -> Dict:
+        state = {name: value for name, value in vars(self.kernel.game_manager.stats).items()
+                 if name not in self.TRANSIENT_STATS}
+        state["directories_explored"] = sorted(state["directories_explored"])
+        for name, value in state.items():
+            if isinstance(value, list):  # Copied, so _collect sees in-place changes as changes
+                state[name] = list(value)
+        return state
+
+    def _achievements_state(self) -> Dict:
+        return {a.id: a.unlock_time.isoformat() if a.unlock_time else None
+                for a in self.kernel.game_manager.achievements.values() if a.unlocked}
+
+    def _missions_state(self) -> List:
+        return [[m.id, m.name, m.description, m.xp_reward, m.difficulty, m.target, m.progress, m.completed,
+                 m.counter, m.window]
+                for m in self.kernel.game_manager.active_missions]
+
+    def export(self) -> Dict:
+        """Full snapshot of the saved game state"""
+        filesystem = self.kernel.filesystem
+        return {
+            "version": self.VERSION,
+            "seq": self.seq,
+            "saved": datetime.now().isoformat(),
+            "stats": self._stats_state(),
+            "achievements": self._achievements_state(),
+            "missions": self._missions_state(),
+            "files": [[path, node.get("content") if node["type"] == "file" else None]
+                      for path, node in filesystem.walk()],
+            "cwd": filesystem.current_path,
+            "processes": [[p.pid, p.name, p.command, p.memory_usage]
+                          for p in self.kernel.process_manager.processes.values()
+                          if p.state != "terminated" and p.task is None
+                          and p.pid not in GameProcessManager.PROTECTED_PIDS]
+        }
+
+    def attach(self):
+        """Start journaling kernel changes; call after restore()"""
+        self.kernel.filesystem.journal = self._journal.append
+        self.kernel.process_manager.journal = self._journal.append
+        self._last = {"stats": self._stats_state(), "achievements": self._achievements_state(),
+                      "missions": self._missions_state()}
+
+    def _collect(self) -> List[Dict]:
+        records, self._journal[:] = list(self._journal), []
+
+        stats = self._stats_state()
+        changed = {name: value for name, value in stats.items() if self._last["stats"].get(name) != value}
+        if changed:
+            records.append({"op": "stats", "values": changed})
+        achievements = self._achievements_state()
+        for achievement_id, unlocked in achievements.items():
+            if achievement_id not in self._last["achievements"]:
+                records.append({"op": "achievement", "id": achievement_id, "time": unlocked})
+        missions = self._missions_state()
+        if missions != self._last["missions"]:
+            records.append({"op": "missions", "missions": missions})
+        self._last = {"stats": stats, "achievements": achievements, "missions": missions}
+
+        for record in records:
+            self.seq += 1
+            record["seq"] = self.seq
+        return records
+
+    # Saving
+    def save(self, snapshot: bool = False) -> int:
+        """Hand new records (and a snapshot when due) to the writer thread; returns records logged"""
+        records = self._collect()
+        if records:
+            self._submit(("append", records))
+            self.log_records += len(records)
+        if snapshot or self.log_records >= self.SNAPSHOT_EVERY:
+            self._submit(("snapshot", self.export()))
+            self.log_records = 0
+        return len(records)
+
+    def _submit(self, job):
+        if self._writer is None or not self._writer.is_alive():
+            self._writer = threading.Thread(target=self._write_loop, name="savegame", daemon=True)
+            self._writer.start()
+        self._jobs.put(job)
+
+    def sync(self):
+        """Block until the writer has written everything submitted so far"""
+        if self._writer is not None:
+            self._jobs.join()
+
+    def close(self):
+        """Final save: snapshot, then stop the writer"""
+        self.save(snapshot=True)
+        self._jobs.put(None)
+        self._writer.join()
+        self._writer = None
+
+    def _write_loop(self):
+        while True:
+            job = self._jobs.get()
+            try:
+                if job is None:
+                    return
+                os.makedirs(self.directory, exist_ok=True)
+                kind, payload = job
+                if kind == "append":
+                    self._append(payload)
+                else:
+                    self._write_snapshot(payload)
+            except Exception as error:  # Not just OSError: unserializable state must not kill the writer
+                self.error = str(error)
+            finally:
+                self._jobs.task_done()
+
+    def _append(self, records: List[Dict]):
+        with open(self.log_path, "a", encoding="utf-8") as log:
+            log.write("".join(json.dumps(record, separators=(",", ":")) + "\n" for record in records))
+            log.flush()
+            os.fsync(log.fileno())
+
+    def _write_snapshot(self, state: Dict):
+        temp_path = self.snapshot_path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as snapshot:
+            json.dump(state, snapshot, separators=(",", ":"))
+            snapshot.flush()
+            os.fsync(snapshot.fileno())
+        os.replace(temp_path, self.snapshot_path)
+        # Everything logged so far is in the snapshot now
+        open(self.log_path, "w").close()
+
+    # Loading
+    def read(self):
+        """The saved snapshot (or None) and the log records newer than it"""
+        state = None
+        if os.path.exists(self.snapshot_path):
+            with open(self.snapshot_path, encoding="utf-8") as snapshot:
+                state = json.load(snapshot)
+            if state.get("version") != self.VERSION:
+                raise ValueError(f"unsupported save version {state.get('version')}")
+
+        base = state["seq"] if state else 0
+        records = []
+        if os.path.exists(self.log_path):
+            with open(self.log_path, encoding="utf-8") as log:
+                for line in log:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        break  # Torn final write
+                    if record["seq"] > base:
+                        records.append(record)
+        return state, records
+
+    def restore(self) -> bool:
+        """Load the latest snapshot and replay the log tail into the kernel"""
+        state, records = self.read()
+        if state is None and not records:
+            return False
+
+        game_manager = self.kernel.game_manager
+        filesystem = self.kernel.filesystem
+        stats = {}
+        achievements = {}
+        missions = None
+        processes = {}
+        if state is not None:
+            stats.update(state["stats"])
+            achievements.update(state["achievements"])
+            missions = state["missions"]
+            processes = {pid: (name, command, memory) for pid, name, command, memory in state["processes"]}
+            filesystem.clear()
+            for path, content in state["files"]:
+                if content is None:
+                    filesystem.mkdir(path, game_action=False)
+                else:
+                    filesystem.create_file(path, content, game_action=False)
+
+        for record in records:
+            op = record["op"]
+            if op == "stats":
+                stats.update(record["values"])
+            elif op == "achievement":
+                achievements[record["id"]] = record["time"]
+            elif op == "missions":
+                missions = record["missions"]
+            elif op == "mkdir":
+                filesystem.mkdir(record["path"], game_action=False)
+            elif op == "write":
+                filesystem.create_file(record["path"], record["content"], game_action=False)
+            elif op == "rm":
+                filesystem.rm(record["path"], game_action=False)
+            elif op == "spawn":
+                processes[record["pid"]] = (record["name"], record["command"], record["memory"])
+            elif op == "exit":
+                processes.pop(record["pid"], None)
+
+        for name, value in stats.items():
+            if name == "directories_explored":
+                value = set(value)
+            setattr(game_manager.stats, name, value)
+        for achievement_id, unlocked in achievements.items():
+            achievement = game_manager.achievements.get(achievement_id)
+            if achievement is not None:
+                achievement.unlocked = True
+                achievement.unlock_time = datetime.fromisoformat(unlocked) if unlocked else None
+        if missions is not None:
+            game_manager.clear_missions()
+            for mission_id, name, description, xp_reward, difficulty, target, progress, completed, *rate in missions:
+                mission = Mission(mission_id, name, description, xp_reward, difficulty, target, *rate)
+                mission.progress, mission.completed = progress, completed
+                game_manager.add_mission(mission)
+        for name, command, memory in processes.values():
+            self.kernel.process_manager.create_process(name, command, game_action=False, memory=memory)
+        if state is not None and filesystem._navigate_to_path(state["cwd"]) is not None:
+            filesystem.current_path = state["cwd"]
+
+        self.seq = records[-1]["seq"] if records else state["seq"]
+        for topic in ("stats", "achievements", "missions"):
+            game_manager.events.publish(topic)
+        return True
+
+class SpeedChallenge:
+    """A timed run through a fixed task list, checked against awarded game actions.
+
+    While a run is active the game manager passes every action to
+    on_action(), which only looks the action up in a dict of pending tasks,
+    so actions the run is not waiting for cost one dict miss. Split times
+    come from time.perf_counter. Finished runs are kept in a personal-best
+    table on disk; the best run's splits are the ghost the next run races.
+    """
+    TASKS = (  # (id, label, action, subject name or None, count)
+        ("file", "Create a file named 'speed_test.txt'", "file_create", "speed_test.txt", 1),
+        ("folder", "Create a folder named 'fast_folder'", "dir_create", "fast_folder", 1),
+        ("process", "Create a process named 'speedrun'", "process_create", "speedrun", 1),
+        ("tmp", "Navigate to /tmp directory", "explore", "/tmp", 1),
+        ("commands", "Execute 5 terminal commands", "command", None, 5),
+    )
+    FILE = "challenges.json"
+    KEEP = 10  # Runs in the personal-best table
+    PAR_SECONDS = 60  # Bonus XP for finishing under this
+
+    def __init__(self, kernel, directory: Optional[str] = None):
+        self.kernel = kernel
+        self.path = os.path.join(directory or SaveGame.DEFAULT_DIR, self.FILE)
+        self.runs = self._load()  # Fastest first: {"time", "date", "splits": {task id: seconds}}
+        self.start_time = None
+        self.finish_time = None
+        self.progress = {}
+        self.splits = {}  # Task id -> seconds from the start, in completion order
+        self._pending = {}  # Action -> [task] still to complete
+
+    def _load(self) -> List[Dict]:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)["runs"]
+        except (OSError, ValueError, KeyError):
+            return []
+
+    def _save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"runs": self.runs}, f)
+        os.replace(tmp_path, self.path)
+
+    @property
+    def running(self) -> bool:
+        return self.start_time is not None and self.finish_time is None
+
+    @property
+    def finished(self) -> bool:
+        return self.finish_time is not None
+
+    @property
+    def ghost(self) -> Dict[str, float]:
+        """Split times of the personal best"""
+        return self.runs[0]["splits"] if self.runs else {}
+
+    def start(self):
+        self.progress = {task[0]: 0 for task in self.TASKS}
+        self.splits = {}
+        self._pending = {}
+        for task in self.TASKS:
+            self._pending.setdefault(task[2], []).append(task)
+        self.finish_time = None
+        self.kernel.game_manager.on_action = self.on_action
+        self.start_time = time.perf_counter()
+
+    def stop(self):
+        """Abandon the current run"""
+        if self.kernel.game_manager.on_action == self.on_action:
+            self.kernel.game_manager.on_action = None
+        self.start_time = None
+        self.finish_time = None
+
+    def elapsed(self) -> float:
+        if self.start_time is None:
+            return 0.0
+        return (self.finish_time or time.perf_counter()) - self.start_time
+
+    def on_action(self, action: str, subject=None):
+        tasks = self._pending.get(action)
+        if not tasks:
+            return
+        now = time.perf_counter()
+        name = subject
+        if action in ("file_create", "dir_create"):
+            name = subject.rsplit("/", 1)[-1]
+        elif action == "process_create":
+            process = self.kernel.process_manager.processes.get(subject)
+            name = process.name if process is not None else None
+        for task in list(tasks):
+            task_id, _, _, wanted, count = task
+            if wanted is not None and wanted != name:
+                continue
+            self.progress[task_id] += 1
+            if self.progress[task_id] >= count:
+                self.splits[task_id] = now - self.start_time
+                tasks.remove(task)
+        if len(self.splits) == len(self.TASKS):
+            self.finish_time = now
+            self.kernel.game_manager.on_action = None
+
+    def record(self) -> Optional[int]:
+        """Add the finished run to the personal-best table; returns its place, or None if it missed the table"""
+        run = {"time": self.elapsed(), "date": datetime.now().isoformat(timespec="seconds"),
+               "splits": self.splits}
+        place = bisect.bisect_right([r["time"] for r in self.runs], run["time"])
+        if place >= self.KEEP:
+            return None
+        self.runs.insert(place, run)
+        del self.runs[self.KEEP:]
+        self._save()
+        return place + 1
+
+class ProfileStore:
+    """Player profiles in SQLite (WAL mode) with indexed leaderboard queries.
+
+    Profiles are sorted through indexes on total_xp, level and achievements
+    (each implicitly ordered by id after the key). Pages use keyset
+    pagination, so any page costs O(page size). Ranks use competition ranking
+    (1 + number of players with more XP). Triggers keep a two-level XP
+    histogram: exact XP values plus buckets of 2**BUCKET_BITS. A rank lookup
+    sums the buckets above the player's bucket and the exact values above the
+    player inside it, so it never scans the players themselves.
+    """
+    BUCKET_BITS = 10
+    BATCH = 500  # Buffered upserts per write transaction
+    SORT_KEYS = ("total_xp", "level", "achievements")
+    RIVALS = ("SystemMaster", "AdminPro", "CodeNinja", "TechWizard", "KernelHacker", "ShellSage", "BitWrangler")
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS profiles (
+            id INTEGER PRIMARY KEY,
+            name TEXT UNIQUE NOT NULL,
+            level INTEGER NOT NULL,
+            total_xp INTEGER NOT NULL,
+            achievements INTEGER NOT NULL,
+            updated TEXT
+        );
+        CREATE INDEX IF NOT EXISTS idx_profiles_total_xp ON profiles (total_xp);
+        CREATE INDEX IF NOT EXISTS idx_profiles_level ON profiles (level);
+        CREATE INDEX IF NOT EXISTS idx_profiles_achievements ON profiles (achievements);
+        CREATE TABLE IF NOT EXISTS xp_counts (total_xp INTEGER PRIMARY KEY, players INTEGER NOT NULL) WITHOUT ROWID;
+        CREATE TABLE IF NOT EXISTS xp_buckets (bucket INTEGER PRIMARY KEY, players INTEGER NOT NULL) WITHOUT ROWID;
+        CREATE TRIGGER IF NOT EXISTS profiles_insert AFTER INSERT ON profiles BEGIN
+            INSERT INTO xp_counts VALUES (NEW.total_xp, 1)
+                ON CONFLICT (total_xp) DO UPDATE SET players = players + 1;
+            INSERT INTO xp_buckets VALUES (NEW.total_xp >> {bits}, 1)
+                ON CONFLICT (bucket) DO UPDATE SET players = players + 1;
+        END;
+        CREATE TRIGGER IF NOT EXISTS profiles_update AFTER UPDATE OF total_xp ON profiles
+        WHEN OLD.total_xp <> NEW.total_xp BEGIN
+            UPDATE xp_counts SET players = players - 1 WHERE total_xp = OLD.total_xp;
+            UPDATE xp_buckets SET players = players - 1 WHERE bucket = OLD.total_xp >> {bits};
+            INSERT INTO xp_counts VALUES (NEW.total_xp, 1)
+                ON CONFLICT (total_xp) DO UPDATE SET players = players + 1;
+            INSERT INTO xp_buckets VALUES (NEW.total_xp >> {bits}, 1)
+                ON CONFLICT (bucket) DO UPDATE SET players = players + 1;
+        END;
+        CREATE TRIGGER IF NOT EXISTS profiles_delete AFTER DELETE ON profiles BEGIN
+            UPDATE xp_counts SET players = players - 1 WHERE total_xp = OLD.total_xp;
+            UPDATE xp_buckets SET players = players - 1 WHERE bucket = OLD.total_xp >> {bits};
+        END;
+    """
+    COLUMNS = "id, name, level, total_xp, achievements"
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or os.path.join(SaveGame.DEFAULT_DIR, "profiles.db")
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self.db = sqlite3.connect(self.path)
+        self.db.row_factory = sqlite3.Row
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")  # WAL stays consistent; only the last commits can be lost
+        self.db.executescript(self.SCHEMA.format(bits=self.BUCKET_BITS))
+        self._pending = {}  # name -> (level, total_xp, achievements)
+
+    def upsert(self, name: str, level: int, total_xp: int, achievements: int):
+        """Queue a profile write; written with the next batch"""
+        self._pending[name] = (level, total_xp, achievements)
+        if len(self._pending) >= self.BATCH:
+            self.flush()
+
+    def flush(self) -> int:
+        """Write queued profiles in one transaction"""
+        if not self._pending:
+            return 0
+        now = datetime.now().isoformat()
+        rows = [(name, level, total_xp, achievements, now)
+                for name, (level, total_xp, achievements) in self._pending.items()]
+        self._pending = {}
+        with self.db:
+            self.db.executemany(
+                "INSERT INTO profiles (name, level, total_xp, achievements, updated) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (name) DO UPDATE SET level = excluded.level, total_xp = excluded.total_xp, "
+                "achievements = excluded.achievements, updated = excluded.updated", rows)
+        return len(rows)
+
+    def count(self) -> int:
+        self.flush()
+        return self.db.execute("SELECT COUNT(*) FROM profiles").fetchone()[0]
+
+    def get(self, name: str) -> Optional[Dict]:
+        self.flush()
+        row = self.db.execute(f"SELECT {self.COLUMNS} FROM profiles WHERE name = ?", (name,)).fetchone()
+        return dict(row) if row is not None else None
+
+    def rank_of_xp(self, total_xp: int) -> int:
+        """Rank a player with `total_xp` would have: 1 + players with more XP"""
+        self.flush()
+        bucket = total_xp >> self.BUCKET_BITS
+        above = self.db.execute("SELECT TOTAL(players) FROM xp_buckets WHERE bucket > ?", (bucket,)).fetchone()[0]
+        above += self.db.execute("SELECT TOTAL(players) FROM xp_counts WHERE total_xp > ? AND total_xp < ?",
+                                 (total_xp, (bucket + 1) << self.BUCKET_BITS)).fetchone()[0]
+        return int(above) + 1
+
+    def rank(self, name: str) -> Optional[int]:
+        profile = self.get(name)
+        return self.rank_of_xp(profile["total_xp"]) if profile is not None else None
+
+    def _ranked(self, rows) -> List[Dict]:
+        ranks = {}
+        profiles = []
+        for row in rows:
+            profile = dict(row)
+            if profile["total_xp"] not in ranks:
+                ranks[profile["total_xp"]] = self.rank_of_xp(profile["total_xp"])
+            profile["rank"] = ranks[profile["total_xp"]]
+            profiles.append(profile)
+        return profiles
+
+    def top(self, n: int = 10, by: str = "total_xp", after=None) -> List[Dict]:
+        """One leaderboard page, best first; pass the last row's (key, id) as `after` for the next"""
+        if by not in self.SORT_KEYS:
+            raise ValueError(f"Cannot sort profiles by {by}")
+        self.flush()
+        where, params = "", (n,)
+        if after is not None:
+            where, params = f"WHERE ({by}, id) < (?, ?)", (after[0], after[1], n)
+        rows = self.db.execute(f"SELECT {self.COLUMNS} FROM profiles {where} "
+                               f"ORDER BY {by} DESC, id DESC LIMIT ?", params)
+        return self._ranked(rows)
+
+    def around(self, name: str, n: int = 10) -> List[Dict]:
+        """The XP leaderboard page centred on one player"""
+        profile = self.get(name)
+        if profile is None:
+            return []
+        key = (profile["total_xp"], profile["id"])
+        above = self.db.execute(f"SELECT {self.COLUMNS} FROM profiles WHERE (total_xp, id) > (?, ?) "
+                                f"ORDER BY total_xp, id LIMIT ?", (*key, n // 2)).fetchall()
+        below = self.db.execute(f"SELECT {self.COLUMNS} FROM profiles WHERE (total_xp, id) <= (?, ?) "
+                                f"ORDER BY total_xp DESC, id DESC LIMIT ?", (*key, n - len(above))).fetchall()
+        return self._ranked(list(reversed(above)) + below)
+
+    def all_profiles(self):
+        """(name, level, total_xp, achievements) for every profile"""
+        self.flush()
+        return self.db.execute("SELECT name, level, total_xp, achievements FROM profiles")
+
+    def seed(self, count: int, seed: int = 42) -> int:
+        """Add `count` simulated rival profiles"""
+        rng = random.Random(seed)
+        start = self.db.execute("SELECT COALESCE(MAX(id), 0) FROM profiles").fetchone()[0]
+        for i in range(start, start + count):
+            total_xp = int(rng.paretovariate(1.2) * 100)
+            self.upsert(f"{rng.choice(self.RIVALS)}{i}", int(math.sqrt(total_xp / 100)) + 1, total_xp,
+                        min(int(math.log2(total_xp + 1)), 20))
+        self.flush()
+        return count
+
+    def close(self):
+        self.flush()
+        self.db.close()
+
+class _SkipNode:
+    __slots__ = ("key", "next", "width")
+
+    def __init__(self, key, height: int):
+        self.key = key
+        self.next = [None] * height
+        self.width = [1] * height  # Elements skipped by each link, counting its target
+
+class _End:
+    """Key of the tail sentinel: greater than every real key"""
+    def __lt__(self, other):
+        return False
+
+    def __le__(self, other):
+        return False
+
+class IndexableSkipList:
+    """Sorted keys with O(log n) insert, remove, positional access and rank.
+
+    Every link records how many elements it skips, so the position of a key
+    is the sum of the widths followed on the way to it.
+    """
+    MAX_LEVELS = 32
+
+    def __init__(self, seed: Optional[int] = None):
+        self.size = 0
+        self._rng = random.Random(seed)
+        self._tail = _SkipNode(_End(), 0)
+        self.head = _SkipNode(None, self.MAX_LEVELS)
+        self.head.next = [self._tail] * self.MAX_LEVELS
+
+    def __len__(self):
+        return self.size
+
+    def _height(self) -> int:
+        height = 1
+        while height < self.MAX_LEVELS and self._rng.random() < 0.5:
+            height += 1
+        return height
+
+    def insert(self, key):
+        chain = [None] * self.MAX_LEVELS
+        steps_at_level = [0] * self.MAX_LEVELS
+        node = self.head
+        for level in reversed(range(self.MAX_LEVELS)):
+            while node.next[level].key <= key:
+                steps_at_level[level] += node.width[level]
+                node = node.next[level]
+            chain[level] = node
+
+        height = self._height()
+        new = _SkipNode(key, height)
+        steps = 0
+        for level in range(height):
+            previous = chain[level]
+            new.next[level] = previous.next[level]
+            previous.next[level] = new
+            new.width[level] = previous.width[level] - steps
+            previous.width[level] = steps + 1
+            steps += steps_at_level[level]
+        for level in range(height, self.MAX_LEVELS):
+            chain[level].width[level] += 1
+        self.size += 1
+
+    def remove(self, key):
+        chain = [None] * self.MAX_LEVELS
+        node = self.head
+        for level in reversed(range(self.MAX_LEVELS)):
+            while node.next[level].key < key:
+                node = node.next[level]
+            chain[level] = node
+        target = chain[0].next[0]
+        if target is self._tail or target.key != key:
+            raise KeyError(key)
+
+        for level in range(len(target.next)):
+            previous = chain[level]
+            previous.width[level] += target.width[level] - 1
+            previous.next[level] = target.next[level]
+        for level in range(len(target.next), self.MAX_LEVELS):
+            chain[level].width[level] -= 1
+        self.size -= 1
+
+    def count_less(self, key) -> int:
+        """Number of keys smaller than `key`"""
+        position = 0
+        node = self.head
+        for level in reversed(range(self.MAX_LEVELS)):
+            while node.next[level].key < key:
+                position += node.width[level]
+                node = node.next[level]
+        return position
+
+    def slice(self, start: int, count: int) -> List:
+        """Up to `count` keys from position `start`"""
+        node = self.head
+        remaining = start + 1
+        for level in reversed(range(self.MAX_LEVELS)):
+            while node.width[level] <= remaining and node.next[level] is not self._tail:
+                remaining -= node.width[level]
+                node = node.next[level]
+        if remaining:
+            return []
+        keys = []
+        while node is not self._tail and len(keys) < count:
+            keys.append(node.key)
+            node = node.next[0]
+        return keys
+
+class LeaderboardServer:
+    """Leaderboard service speaking newline-delimited JSON over TCP.
+
+    Players are kept in an IndexableSkipList ordered by (-total_xp, name),
+    so rank, page and around queries are O(log n). Score submissions are
+    buffered and applied in batches every BATCH_SECONDS (or once MAX_PENDING
+    accumulate), so a player who submits many times in between moves in
+    the list only once. A rank or around query for a player with a pending
+    submission applies the batch first, so players always see their own
+    latest score.
+
+    Requests: {"op": "submit", "scores": [[name, level, total_xp, achievements], ...]},
+    {"op": "rank", "name": ...}, {"op": "top", "n": ..., "after": [total_xp, name]}
+    and {"op": "around", "name": ..., "n": ...}.
+    """
+    MAX_PENDING = 10000
+    BATCH_SECONDS = 0.05
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        self.host = host
+        self.port = port
+        self.players = {}  # name -> (level, total_xp, achievements)
+        self.ranking = IndexableSkipList()
+        self.requests = 0
+        self.batches = 0
+        self._pending = {}
+        self._writers = set()  # Open client connections
+        self._batcher = None
+        self._loop = None
+        self._server = None
+        self._thread = None
+
+    # Leaderboard state
+    def load(self, profiles):
+        """Add (name, level, total_xp, achievements) rows without going through the network"""
+        for name, level, total_xp, achievements in profiles:
+            self._pending[name] = (level, total_xp, achievements)
+        self._apply()
+
+    def _apply(self):
+        if not self._pending:
+            return
+        for name, profile in self._pending.items():
+            old = self.players.get(name)
+            if old is not None:
+                if old[1] != profile[1]:
+                    self.ranking.remove((-old[1], name))
+                    self.ranking.insert((-profile[1], name))
+            else:
+                self.ranking.insert((-profile[1], name))
+            self.players[name] = profile
+        self._pending = {}
+        self.batches += 1
+
+    def _row(self, key) -> Dict:
+        name = key[1]
+        level, total_xp, achievements = self.players[name]
+        return {"id": name, "name": name, "level": level, "total_xp": total_xp,
+                "achievements": achievements, "rank": self.ranking.count_less((key[0], "")) + 1}
+
+    def handle(self, request: Dict) -> Dict:
+        """Answer one decoded request"""
+        self.requests += 1
+        op = request["op"]
+        if op == "submit":
+            for name, level, total_xp, achievements in request["scores"]:
+                self._pending[str(name)] = (int(level), int(total_xp), int(achievements))
+            if len(self._pending) >= self.MAX_PENDING:
+                self._apply()
+            return {"accepted": len(request["scores"])}
+
+        if request.get("name") in self._pending:
+            self._apply()
+        if op == "rank":
+            profile = self.players.get(request["name"])
+            if profile is None:
+                return {"rank": None, "of": len(self.ranking)}
+            return {"rank": self.ranking.count_less((-profile[1], "")) + 1, "of": len(self.ranking)}
+        if op == "top":
+            start = 0
+            if request.get("after") is not None:
+                total_xp, name = request["after"]
+                profile = self.players.get(name)
+                start = self.ranking.count_less((-total_xp, name)) + (profile is not None and profile[1] == total_xp)
+            return {"rows": [self._row(key) for key in self.ranking.slice(start, int(request.get("n", 10)))]}
+        if op == "around":
+            profile = self.players.get(request["name"])
+            if profile is None:
+                return {"rows": []}
+            n = int(request.get("n", 10))
+            position = self.ranking.count_less((-profile[1], request["name"]))
+            start = max(0, position - n // 2)
+            return {"rows": [self._row(key) for key in self.ranking.slice(start, n)]}
+        raise ValueError(f"unknown op {op!r}")
+
+    # Networking
+    async def _serve_client(self, reader, writer):
+        self._writers.add(writer)
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    response = self.handle(json.loads(line))
+                except (ValueError, KeyError, TypeError) as e:
+                    response = {"error": str(e)}
+                writer.write(json.dumps(response, separators=(",", ":")).encode() + b"\n")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+    async def serve(self):
+        """Start listening on the running event loop"""
+        self._server = await asyncio.start_server(self._serve_client, self.host, self.port, backlog=4096)
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._batcher = asyncio.ensure_future(self._apply_batches())
+        return self._server
+
+    async def _apply_batches(self):
+        while self._server.is_serving():
+            await asyncio.sleep(self.BATCH_SECONDS)
+            self._apply()
+
+    def start(self) -> int:
+        """Run the server on its own event loop thread; returns the port"""
+        ready = threading.Event()
+
+        def run():
+            self._loop = asyncio.new_event_loop()
+            self._loop.run_until_complete(self.serve())
+            ready.set()
+            self._loop.run_forever()
+            self._server.close()
+            for writer in list(self._writers):
+                writer.close()  # Open connections read EOF and finish
+            self._loop.run_until_complete(asyncio.gather(*asyncio.all_tasks(self._loop), return_exceptions=True))
+            self._loop.run_until_complete(self._server.wait_closed())
+            self._loop.close()
+
+        self._thread = threading.Thread(target=run, name="leaderboard", daemon=True)
+        self._thread.start()
+        ready.wait()
+        return self.port
+
+    def stop(self):
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop = None
+
+class LeaderboardClient:
+    """Blocking client for LeaderboardServer used from the Tk thread.
+
+    Keeps one connection open, caches query responses for `ttl` seconds and
+    goes offline after a failure: calls then return None at once (callers
+    fall back to local data) until RETRY_SECONDS have passed. An error
+    response also returns None, without going offline; the message is kept
+    in `error`.
+    """
+    RETRY_SECONDS = 15.0
+
+    def __init__(self, host: str, port: int, ttl: float = 5.0, timeout: float = 0.5):
+        self.host = host
+        self.port = port
+        self.ttl = ttl
+        self.timeout = timeout
+        self.hits = 0
+        self.misses = 0
+        self._cache = {}  # request key -> (expires, response)
+        self._socket = None
+        self._file = None
+        self._offline_until = 0.0
+        self.error = None  # Last error response from the server
+
+    @property
+    def online(self) -> bool:
+        return time.monotonic() >= self._offline_until
+
+    def _request(self, request: Dict) -> Optional[Dict]:
+        if not self.online:
+            return None
+        try:
+            if self._socket is None:
+                self._socket = socket.create_connection((self.host, self.port), timeout=self.timeout)
+                self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                self._file = self._socket.makefile("rwb")
+            self._file.write(json.dumps(request, separators=(",", ":")).encode() + b"\n")
+            self._file.flush()
+            line = self._file.readline()
+            if not line:
+                raise ConnectionError("leaderboard server closed the connection")
+            response = json.loads(line)
+        except (OSError, ValueError):
+            self.close()
+            self._offline_until = time.monotonic() + self.RETRY_SECONDS
+            return None
+        if "error" in response:
+            self.error = response["error"]
+            return None
+        return response
+
+    def _cached(self, request: Dict) -> Optional[Dict]:
+        if not self.online:
+            return None
+        key = json.dumps(request, sort_keys=True)
+        now = time.monotonic()
+        entry = self._cache.get(key)
+        if entry is not None and entry[0] > now:
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        response = self._request(request)
+        if response is not None:
+            self._cache[key] = (now + self.ttl, response)
+        return response
+
+    def submit(self, name: str, level: int, total_xp: int, achievements: int) -> bool:
+        response = self._request({"op": "submit", "scores": [[name, level, total_xp, achievements]]})
+        if response is None:
+            return False
+        self._cache.clear()  # Ranks and pages may have moved
+        return True
+
+    def rank(self, name: str) -> Optional[Dict]:
+        return self._cached({"op": "rank", "name": name})
+
+    def top(self, n: int = 10, after=None) -> Optional[List[Dict]]:
+        response = self._cached({"op": "top", "n": n, "after": list(after) if after else None})
+        return response["rows"] if response is not None else None
+
+    def around(self, name: str, n: int = 10) -> Optional[List[Dict]]:
+        response = self._cached({"op": "around", "name": name, "n": n})
+        return response["rows"] if response is not None else None
+
+    def close(self):
+        if self._socket is not None:
+            try:
+                self._file.close()
+                self._socket.close()
+            except OSError:
+                pass
+        self._socket = None
+        self._file = None
+
+class TickScheduler:
+    """One Tk timer for all of the GUI's periodic tasks.
+
+    Tasks wait in a heap ordered by deadline. First deadlines are aligned
+    to wall-clock multiples of each task's interval, so tasks whose
+    intervals divide each other fall due together, and every task due
+    within SLACK of a wake-up runs in it, in priority order (lowest first).
+    A task that fell more than an interval behind runs once and drops the
+    ticks it missed instead of replaying them. Tasks tied to a notebook tab
+    are skipped while that tab is hidden; event callbacks wrapped with
+    on_tab() are deferred instead and run when their tab is shown.
+    """
+    SLACK = 0.05  # Seconds early a task may run to share a wake-up
+
+    def __init__(self, root, notebook=None):
+        self.root = root
+        self.notebook = notebook
+        self.tasks = {}  # name -> task
+        self.heap = []  # (deadline, priority, seq, task); entries of replaced tasks are dropped lazily
+        self.pending = {}  # tab widget path -> [callbacks deferred while it was hidden]
+        self.timer = None
+        self.armed_for = None
+        self._seq = itertools.count()
+        self.wakeups = 0
+        self.runs = 0
+        self.skipped = 0  # Runs skipped or deferred because their tab was hidden
+        self.dropped = 0  # Late ticks merged into one run
+        if notebook is not None:
+            notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed, add="+")
+
+    def add(self, name: str, interval: float, callback, priority: int = 1, tab=None,
+            delay: Optional[float] = None):
+        """Run `callback` every `interval` seconds, first after `delay` or at the next aligned tick"""
+        if delay is None:
+            delay = interval - time.time() % interval
+        task = {"name": name, "interval": interval, "callback": callback, "priority": priority,
+                "tab": tab, "deadline": time.monotonic() + delay}
+        self.tasks[name] = task
+        heapq.heappush(self.heap, (task["deadline"], priority, next(self._seq), task))
+        self._arm()
+
+    def reschedule(self, name: str, delay: float):
+        task = self.tasks[name]
+        self.add(name, task["interval"], task["callback"], task["priority"], task["tab"], delay)
+
+    def remove(self, name: str):
+        self.tasks.pop(name, None)
+
+    def visible(self, tab) -> bool:
+        return tab is None or self.notebook is None or self.notebook.select() == str(tab)
+
+    def on_tab(self, tab, callback):
+        """Wrap an event callback so it waits while `tab` is hidden"""
+        def run():
+            if self.visible(tab):
+                callback()
+                return
+            pending = self.pending.setdefault(str(tab), [])
+            if callback not in pending:
+                pending.append(callback)
+                self.skipped += 1
+        return run
+
+    def _on_tab_changed(self, event=None):
+        for callback in self.pending.pop(self.notebook.select(), []):
+            callback()
+
+    def _arm(self):
+        heap = self.heap
+        while heap and self.tasks.get(heap[0][3]["name"]) is not heap[0][3]:
+            heapq.heappop(heap)
+        if not heap:
+            return
+        deadline = heap[0][0]
+        if self.timer is not None:
+            if self.armed_for <= deadline:
+                return
+            self.root.after_cancel(self.timer)
+        self.armed_for = deadline
+        self.timer = self.root.after(max(0, int((deadline - time.monotonic()) * 1000)), self._wake)
+
+    def _wake(self):
+        self.timer = None
+        self.wakeups += 1
+        now = time.monotonic()
+        due = []
+        while self.heap and self.heap[0][0] <= now + self.SLACK:
+            task = heapq.heappop(self.heap)[3]
+            if self.tasks.get(task["name"]) is task:
+                due.append(task)
+        due.sort(key=lambda task: task["priority"])
+        # Requeue every due task before running any, so a failing callback cannot stop the others
+        for task in due:
+            missed = max(0, int((now - task["deadline"]) // task["interval"]))
+            self.dropped += missed
+            task["deadline"] += (missed + 1) * task["interval"]
+            heapq.heappush(self.heap, (task["deadline"], task["priority"], next(self._seq), task))
+        try:
+            for task in due:
+                if self.tasks.get(task["name"]) is not task:  # Removed by an earlier callback
+                    continue
+                if not self.visible(task["tab"]):
+                    self.skipped += 1
+                    continue
+                self.runs += 1
+                try:
+                    task["callback"]()
+                except Exception:
+                    self.root.report_callback_exception(*sys.exc_info())
+        finally:
+            self._arm()
+
+class TerminalWriter:
+    """Buffered, bounded output for the terminal's Text widget.
+
+    write() only appends to a buffer; the buffer goes into the widget with
+    one insert() and one see() per Tk idle cycle. stream() takes an iterator
+    of lines and drains it a few milliseconds at a time, so a long listing
+    neither blocks the GUI nor has to be built as one string first. Lines
+    beyond `scrollback` are trimmed from the top, at least TRIM_CHUNK
+    whole lines at a time.
+    """
+    TRIM_CHUNK = 500
+    STREAM_SECONDS = 0.008  # Time spent pulling stream lines per pump
+
+    def __init__(self, text, scrollback: int = 5000):
+        self.text = text
+        self.scrollback = scrollback
+        self.pending = []
+        self.flush_scheduled = False
+        self.streams = deque()  # Iterators still to drain, in output order
+
+    def write(self, output: str):
+        if self.streams:
+            self.streams.append(iter((output,)))  # Keep it behind the output still streaming
+            return
+        self.pending.append(output)
+        if not self.flush_scheduled:
+            self.flush_scheduled = True
+            self.text.after_idle(self.flush)
+
+    def stream(self, lines):
+        self.streams.append(iter(lines))
+        if len(self.streams) == 1:
+            self.text.after_idle(self._pump)
+
+    def _pump(self):
+        deadline = time.perf_counter() + self.STREAM_SECONDS
+        while self.streams and time.perf_counter() < deadline:
+            chunk = list(itertools.islice(self.streams[0], 256))
+            if chunk:
+                self.pending.extend(chunk)
+            else:
+                self.streams.popleft()
+        self.flush()
+        if self.streams:
+            self.text.after(1, self._pump)
+
+    def flush(self):
+        self.flush_scheduled = False
+        if not self.pending:
+            return
+        self.text.insert(tk.END, "".join(self.pending))
+        self.pending.clear()
+        excess = int(self.text.index("end-1c").split(".")[0]) - self.scrollback
+        if excess >= self.TRIM_CHUNK:
+            self.text.delete("1.0", f"{excess + 1}.0")
+        self.text.see(tk.END)
+
+class TreeviewSync:
+    """Keeps a ttk.Treeview in step with a list of keyed rows.
+
+    update() diffs the rows against the values last written for each key
+    and only deletes, inserts or rewrites the rows that changed, so a
+    refresh where nothing changed makes no Tk calls at all.
+    """
+    def __init__(self, tree):
+        self.tree = tree
+        self.items = {}  # key -> [item id, values]
+        self.order = []  # Keys in display order
+
+    def update(self, rows: List[tuple]) -> int:
+        """Show (key, values) rows in order; returns the number of rows touched"""
+        tree = self.tree
+        items = self.items
+        keys = [key for key, _ in rows]
+        present = set(keys)
+        touched = 0
+
+        gone = [key for key in items if key not in present]
+        if gone:
+            tree.delete(*[items.pop(key)[0] for key in gone])
+            touched += len(gone)
+        if [key for key in self.order if key in present] != [key for key in keys if key in items]:
+            for index, key in enumerate(key for key in keys if key in items):
+                tree.move(items[key][0], "", index)  # Rows kept but reordered
+                touched += 1
+
+        for index, (key, values) in enumerate(rows):
+            entry = items.get(key)
+            if entry is None:
+                items[key] = [tree.insert("", index, values=values), values]
+                touched += 1
+            elif entry[1] != values:
+                tree.item(entry[0], values=values)
+                entry[1] = values
+                touched += 1
+        self.order = keys
+        return touched
+
+class VirtualList(tk.Frame):
+    """A scrolling list that only draws the rows in view.
+
+    Rows come from fetch(offset, limit) -> (total, [(key, values)]), asked
+    for the rows on screen plus OVERSCAN on each side, so the widget holds a
+    screenful of data however long the list is. Each on-screen row slot
+    keeps its canvas items and only has their text changed when it scrolls.
+    """
+    ROW_HEIGHT = 22
+    OVERSCAN = 20
+    SELECTED = '#cce5ff'
+
+    def __init__(self, parent, columns: List[tuple], fetch, on_sort=None, on_activate=None):
+        super().__init__(parent)
+        self.columns = columns  # [(heading, width in pixels)]
+        self.fetch = fetch
+        self.on_sort = on_sort  # Called with the index of a clicked heading
+        self.on_activate = on_activate  # Called with the event on a double click
+        self.x = list(itertools.accumulate([0] + [width for _, width in columns]))
+        self.total = 0
+        self.top = 0  # Index of the first row on screen
+        self.start = 0  # Index of the first fetched row
+        self.rows = []  # Fetched (key, values) rows, from self.start on
+        self.stale = True  # The fetched rows must be fetched again
+        self.selected = None  # (key, values) of the selected row
+        self.slots = []  # [background, [text per column], what it shows] per row slot on screen
+
+        self.header = tk.Canvas(self, height=self.ROW_HEIGHT, bg='#e0e0e0', highlightthickness=0)
+        self.header.pack(side=tk.TOP, fill=tk.X)
+        self.headings = [self.header.create_text(x + 6, self.ROW_HEIGHT // 2, text=heading, anchor='w',
+                                                 font=('Arial', 10, 'bold'))
+                         for (heading, _), x in zip(columns, self.x)]
+        self.header.bind("<Button-1>", self._on_heading)
+
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.yview)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.canvas = tk.Canvas(self, bg='white', highlightthickness=0)
+        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.canvas.bind("<Configure>", lambda event: self.redraw())
+        self.canvas.bind("<MouseWheel>", self._on_wheel)
+        self.canvas.bind("<Button-4>", lambda event: self.scroll_to(self.top - 3))
+        self.canvas.bind("<Button-5>", lambda event: self.scroll_to(self.top + 3))
+        self.canvas.bind("<Button-1>", self._on_click)
+        self.canvas.bind("<Double-1>", self._on_double_click)
+
+    def set_heading(self, column: int, text: str):
+        self.header.itemconfig(self.headings[column], text=text)
+
+    def visible_rows(self) -> int:
+        return max(1, self.canvas.winfo_height() // self.ROW_HEIGHT + 1)
+
+    def selection(self) -> Optional[tuple]:
+        """(key, values) of the selected row, or None"""
+        return self.selected
+
+    def refresh(self, reset: bool = False):
+        """Fetch the rows on screen again, after the data, its order or its filter changed"""
+        if reset:
+            self.top = 0
+            self.selected = None
+        self.stale = True
+        self.redraw()
+        if self.selected is not None:
+            # Keep the selection in step with the data; drop it if its row went away
+            self.selected = next((row for row in self.rows if row[0] == self.selected[0]), None)
+            if self.selected is None:
+                self.redraw()
+
+    def yview(self, *args):
+        """Scrollbar command"""
+        if args[0] == "moveto":
+            self.scroll_to(int(float(args[1]) * self.total))
+        elif args[0] == "scroll":
+            step = max(1, self.visible_rows() - 1) if args[2] == "pages" else 1
+            self.scroll_to(self.top + int(args[1]) * step)
+
+    def scroll_to(self, top: int):
+        top = max(0, min(top, self.total - self.visible_rows() + 1))
+        if top != self.top:
+            self.top = top
+            self.redraw()
+
+    def _fetch(self, visible: int):
+        self.start = max(0, self.top - self.OVERSCAN)
+        self.total, self.rows = self.fetch(self.start, visible + 2 * self.OVERSCAN)
+        self.stale = False
+
+    def redraw(self):
+        visible = self.visible_rows()
+        fetched_end = self.start + len(self.rows)
+        if self.stale or self.top < self.start or (self.top + visible > fetched_end and fetched_end < self.total):
+            self._fetch(visible)
+            top = max(0, min(self.top, self.total - visible + 1))
+            if top != self.top:  # The list shrank under the view
+                self.top = top
+                self._fetch(visible)
+
+        while len(self.slots) < visible:
+            y = len(self.slots) * self.ROW_HEIGHT
+            background = self.canvas.create_rectangle(0, y, self.x[-1], y + self.ROW_HEIGHT, width=0, fill='white')
+            texts = [self.canvas.create_text(x + 6, y + self.ROW_HEIGHT // 2, anchor='w', font=('Arial', 10))
+                     for x in self.x[:-1]]
+            self.slots.append([background, texts, None])
+
+        selected_key = self.selected[0] if self.selected else None
+        for i, slot in enumerate(self.slots):
+            position = self.top + i - self.start
+            row = self.rows[position] if i < visible and 0 <= position < len(self.rows) else None
+            shown = (row, row is not None and row[0] == selected_key)
+            if slot[2] == shown:
+                continue
+            slot[2] = shown
+            background, texts, _ = slot
+            if row is None:
+                self.canvas.itemconfig(background, state=tk.HIDDEN)
+                for text in texts:
+                    self.canvas.itemconfig(text, state=tk.HIDDEN)
+                continue
+            self.canvas.itemconfig(background, state=tk.NORMAL, fill=self.SELECTED if shown[1] else 'white')
+            for text, value in zip(texts, row[1]):
+                self.canvas.itemconfig(text, state=tk.NORMAL, text=value)
+
+        if self.total:
+            self.scrollbar.set(self.top / self.total, min(1.0, (self.top + visible - 1) / self.total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def _row_at(self, y: int) -> Optional[tuple]:
+        position = self.top + y // self.ROW_HEIGHT - self.start
+        return self.rows[position] if 0 <= position < len(self.rows) else None
+
+    def _on_click(self, event):
+        row = self._row_at(event.y)
+        if row is not None:
+            self.selected = row
+            self.redraw()
+
+    def _on_wheel(self, event):
+        """Windows reports multiples of 120 per notch, macOS small deltas; scroll whole rows either way"""
+        if event.delta:
+            steps = max(1, abs(event.delta) // 40)
+            self.scroll_to(self.top - steps if event.delta > 0 else self.top + steps)
+
+    def _on_double_click(self, event):
+        self._on_click(event)
+        if self.selected is not None and self.on_activate is not None:
+            self.on_activate(event)
+
+    def _on_heading(self, event):
+        column = bisect.bisect_right(self.x, event.x) - 1
+        if 0 <= column < len(self.columns) and self.on_sort is not None:
+            self.on_sort(column)
+
 class GameOSGUI:
+    FRAME_MS = 16  # Coalesce widget refreshes into one render per ~60 Hz frame
+    SAVE_MS = 2000
+    KERNEL_TICK_SECONDS = 5
+    JOB_DRAIN_SECONDS = 0.1
+    VMSTAT_CHUNK = 250_000  # References translated per Tk-thread batch
+    MKFILES_BATCH = 500  # Files created per Tk-thread batch
+    FILE_COLUMNS = ("Name", "Type", "Size", "Modified")
+    TERMINAL_SCROLLBACK = int(os.environ.get("PYOS_SCROLLBACK", 5000))  # Lines kept in the terminal
+    LEADERBOARD_PAGE = 15
+
     def __init__(self):
         self.kernel = GameKernel()
         self.game_manager = self.kernel.game_manager
+        self.save_game = SaveGame(self.kernel)
+        self.load_game()
+        self.profiles = ProfileStore()
+        if self.profiles.count() == 0:
+            self.profiles.seed(1000)
+        self.player_name = getpass.getuser()
+        self.leaderboard_server = None
+        self.leaderboard = self.connect_leaderboard()
+        self.challenge = SpeedChallenge(self.kernel)
+        self.jobs = WorkerPool(listener=lambda: self.game_manager.events.publish("jobs"))
         self.root = tk.Tk()
         self.setup_window()
         self.create_interface()
@@ -1132,6 +5206,52 @@ class GameOSGUI:
         # Start game timer
         self.game_timer_start = datetime.now()
         self.update_game_timer()
+        self.start_ticks()
+
+    def start_ticks(self):
+        """Register the periodic GUI tasks with the tick scheduler"""
+        scheduler = self.scheduler
+        scheduler.add("kernel", self.KERNEL_TICK_SECONDS, self.tick_kernel, priority=0)
+        scheduler.add("autosave", self.SAVE_MS / 1000, self.autosave, priority=1)
+        scheduler.add("clock", 1, self.update_clock, priority=2)
+        scheduler.add("playtime", 1, self.update_game_timer, priority=2)
+        scheduler.add("day", 24 * 3600, self.roll_over_day, priority=3, delay=self.seconds_to_midnight())
+
+    def load_game(self):
+        """Restore saved progress, then start journaling"""
+        try:
+            restored = self.save_game.restore()
+        except (OSError, ValueError, KeyError) as e:
+            restored = False
+            self.game_manager.add_notification(f"❌ Could not load saved game: {e}", "error")
+        self.save_game.attach()
+        if self.game_manager.start_day(date.today()) and restored:
+            self.game_manager.add_notification("🌅 A new day: fresh daily missions!", "info")
+        if restored:
+            # Restored processes got new PIDs; start the log from a snapshot that uses them
+            self.save_game.save(snapshot=True)
+            self.game_manager.add_notification(f"💾 Welcome back! Level {self.game_manager.stats.level} progress loaded", "info")
+
+    def connect_leaderboard(self) -> LeaderboardClient:
+        """Client for the server in PYOS_LEADERBOARD (host:port), or for a local stand-in server"""
+        address = os.environ.get("PYOS_LEADERBOARD")
+        if address:
+            host, _, port = address.rpartition(":")
+            if port.isdigit() and 0 < int(port) < 65536:
+                return LeaderboardClient(host or "127.0.0.1", int(port))
+            self.game_manager.add_notification(
+                f"⚠️ PYOS_LEADERBOARD={address!r} is not host:port; using the local leaderboard", "warning")
+        self.leaderboard_server = LeaderboardServer()
+        self.leaderboard_server.load(self.profiles.all_profiles())
+        return LeaderboardClient("127.0.0.1", self.leaderboard_server.start())
+
+    def autosave(self):
+        """Hand changes since the last save to the background writer"""
+        self.save_game.save()
+        self.update_profile()
+        if self.save_game.error:
+            self.game_manager.add_notification(f"❌ Saving failed: {self.save_game.error}", "error")
+            self.save_game.error = None
 
     def setup_window(self):
         """Setup main window with gaming theme"""
@@ -1163,6 +5283,7 @@ class GameOSGUI:
         # Create main content with tabs
         self.notebook = ttk.Notebook(self.root)
         self.notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+        self.scheduler = TickScheduler(self.root, self.notebook)
 
         # Create all tabs
         self.create_dashboard_tab()
@@ -1177,9 +5298,23 @@ class GameOSGUI:
         # Create status bar
         self.create_status_bar()
 
+        # Re-render widgets only when their data changed, at most once per frame;
+        # views on a hidden tab wait until it is shown
+        events = self.game_manager.events
+        on_tab = self.scheduler.on_tab
+        events.subscribe("stats", self.update_xp_display)
+        events.subscribe("missions", on_tab(self.missions_tab, self.update_missions_display))
+        events.subscribe(("achievements", "missions"), on_tab(self.dashboard_tab, self.update_dashboard))
+        events.subscribe("memory", on_tab(self.dashboard_tab, self.update_memory_map))
+        events.subscribe("processes", on_tab(self.process_tab, self.refresh_processes))
+        events.subscribe("files", on_tab(self.file_tab, self.refresh_files))
+        events.subscribe("notifications", self.show_notifications)
+        events.subscribe("jobs", self.show_jobs_status)
+        events.on_dirty = lambda: self.root.after(self.FRAME_MS, self.render_frame)
+
         # Start updates
-        self.update_displays()
-        self.show_notifications()
+        self.render_frame()
+        self.tick_kernel()
 
     def create_game_bar(self):
         """Create top game status bar"""
@@ -1251,6 +5386,8 @@ class GameOSGUI:
         game_menu.add_separator()
         game_menu.add_command(label="🔄 New Daily Missions", command=self.generate_new_missions)
         game_menu.add_command(label="📈 View Stats", command=self.show_detailed_stats)
+        game_menu.add_command(label="🔔 Notifications", command=self.notification_panel)
+        game_menu.add_command(label="🧵 Jobs", command=self.jobs_panel)
 
         # File menu
         file_menu = tk.Menu(menubar, tearoff=0)
@@ -1269,6 +5406,8 @@ class GameOSGUI:
         games_menu.add_command(label="🐍 Snake Game", command=self.play_snake)
         games_menu.add_command(label="🧩 Puzzle Challenge", command=self.play_puzzle)
         games_menu.add_command(label="⚡ Speed Challenge", command=self.speed_challenge)
+        games_menu.add_command(label="🏭 Producer-Consumer", command=self.play_producer_consumer)
+        games_menu.add_command(label="💿 Disk Scheduling", command=self.disk_scheduling_view)
 
         # Help menu
         help_menu = tk.Menu(menubar, tearoff=0)
@@ -1281,6 +5420,7 @@ class GameOSGUI:
         """Create main dashboard with game overview"""
         dashboard = ttk.Frame(self.notebook)
         self.notebook.add(dashboard, text="📊 Dashboard")
+        self.dashboard_tab = dashboard
 
         # Create scrollable frame
         canvas = tk.Canvas(dashboard)
@@ -1304,7 +5444,7 @@ class GameOSGUI:
 🎯 Your Current Status:
 • Level: {self.game_manager.stats.level}
 • Total XP: {self.game_manager.stats.total_xp:,}
-• Achievements: {self.game_manager.stats.achievements_unlocked}/20
+• Achievements: {self.game_manager.stats.achievements_unlocked}/{len(self.game_manager.achievements)}
 • Missions Completed: {self.game_manager.stats.missions_completed}
 • Login Streak: {self.game_manager.stats.login_streak} days
 
@@ -1352,13 +5492,35 @@ Ready to continue your journey to becoming a Master System Administrator?"""
         missions_frame.pack(fill=tk.X, padx=10, pady=5)
 
         self.mission_overview_frame = tk.Frame(missions_frame)
+        self.mission_overview_cards = None  # mission id -> widgets of its dashboard card
         self.mission_overview_frame.pack(fill=tk.X)
 
+        # Live memory map
+        memory_frame = ttk.LabelFrame(scrollable_frame, text="💾 Memory", padding=10)
+        memory_frame.pack(fill=tk.X, padx=10, pady=5)
+
+        policy_frame = tk.Frame(memory_frame)
+        policy_frame.pack(fill=tk.X)
+        tk.Label(policy_frame, text="Placement policy:", font=('Arial', 10)).pack(side=tk.LEFT)
+        self.memory_policy_var = tk.StringVar(value=self.kernel.memory_manager.allocator.policy)
+        buddy = isinstance(self.kernel.memory_manager.allocator, BuddyAllocator)
+        policy_box = ttk.Combobox(policy_frame, textvariable=self.memory_policy_var,
+                                  state=tk.DISABLED if buddy else "readonly",
+                                  values=ContiguousAllocator.POLICIES, width=12)
+        policy_box.pack(side=tk.LEFT, padx=5)
+        policy_box.bind("<<ComboboxSelected>>", self.on_memory_policy_change)
+
+        self.memory_map_canvas = tk.Canvas(memory_frame, height=40, bg='#757575')
+        self.memory_map_canvas.pack(fill=tk.X, pady=5)
+        self.memory_status_label = tk.Label(memory_frame, font=('Courier', 10), justify=tk.LEFT)
+        self.memory_status_label.pack(anchor='w')
+
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
 
         # Update dashboard content
         self.update_dashboard()
+        self.update_memory_map()
 
     def update_dashboard(self):
         """Update dashboard content"""
@@ -1375,43 +5537,105 @@ Ready to continue your journey to becoming a Master System Administrator?"""
             self.recent_achievements_text.insert(tk.END, "No achievements unlocked yet. Start exploring to earn your first achievement!")
 
         # Update mission overview
-        for widget in self.mission_overview_frame.winfo_children():
-            widget.destroy()
-
-        if self.game_manager.active_missions:
-            for i, mission in enumerate(self.game_manager.active_missions):
-                mission_frame = tk.Frame(self.mission_overview_frame, relief='ridge', bd=1)
-                mission_frame.pack(fill=tk.X, pady=2)
-
-                # Mission info
-                info_frame = tk.Frame(mission_frame)
-                info_frame.pack(fill=tk.X, padx=5, pady=2)
-
-                tk.Label(info_frame, text=f"🎯 {mission.name}", 
-                        font=('Arial', 10, 'bold')).pack(anchor='w')
-                tk.Label(info_frame, text=mission.description, 
-                        font=('Arial', 9)).pack(anchor='w')
-
-                # Progress bar
-                progress_frame = tk.Frame(mission_frame)
-                progress_frame.pack(fill=tk.X, padx=5, pady=2)
-
-                progress_bar = ttk.Progressbar(progress_frame, length=200, mode='determinate')
-                progress_bar.pack(side=tk.LEFT)
-                progress_bar['value'] = (mission.progress / mission.target) * 100
-
-                status = "✅ Complete" if mission.completed else f"{mission.progress}/{mission.target}"
-                tk.Label(progress_frame, text=status).pack(side=tk.LEFT, padx=5)
-
-                if mission.completed:
-                    tk.Label(progress_frame, text=f"🎉 +{mission.xp_reward} XP", 
-                            fg='green', font=('Arial', 8, 'bold')).pack(side=tk.LEFT)
+        self.mission_overview_cards = self.sync_mission_cards(
+            self.mission_overview_frame, self.mission_overview_cards,
+            self.build_mission_overview_card, self.update_mission_overview_card)
+
+    def sync_mission_cards(self, frame, cards: Optional[Dict], build, update, empty_text: Optional[str] = None) -> Dict:
+        """Rebuild a frame's mission cards only when the set of missions changed, else update them in place"""
+        missions = self.game_manager.active_missions
+        if cards is None or list(cards) != [mission.id for mission in missions]:
+            for widget in frame.winfo_children():
+                widget.destroy()
+            cards = {mission.id: build(frame, mission) for mission in missions}
+            if not missions and empty_text:
+                tk.Label(frame, text=empty_text, font=('Arial', 12)).pack(expand=True)
+        for mission in missions:
+            update(cards[mission.id], mission)
+        return cards
+
+    def build_mission_overview_card(self, parent, mission: Mission) -> Dict:
+        mission_frame = tk.Frame(parent, relief='ridge', bd=1)
+        mission_frame.pack(fill=tk.X, pady=2)
+
+        # Mission info
+        info_frame = tk.Frame(mission_frame)
+        info_frame.pack(fill=tk.X, padx=5, pady=2)
+
+        tk.Label(info_frame, text=f"🎯 {mission.name}", 
+                font=('Arial', 10, 'bold')).pack(anchor='w')
+        tk.Label(info_frame, text=mission.description, 
+                font=('Arial', 9)).pack(anchor='w')
+
+        # Progress bar
+        progress_frame = tk.Frame(mission_frame)
+        progress_frame.pack(fill=tk.X, padx=5, pady=2)
+
+        progress_bar = ttk.Progressbar(progress_frame, length=200, mode='determinate')
+        progress_bar.pack(side=tk.LEFT)
+        status_label = tk.Label(progress_frame)
+        status_label.pack(side=tk.LEFT, padx=5)
+        reward_label = tk.Label(progress_frame, fg='green', font=('Arial', 8, 'bold'))
+        reward_label.pack(side=tk.LEFT)
+        return {"progress": progress_bar, "status": status_label, "reward": reward_label, "shown": None}
+
+    def update_mission_overview_card(self, card: Dict, mission: Mission):
+        shown = (mission.progress, mission.target, mission.completed)
+        if card["shown"] == shown:
+            return
+        card["shown"] = shown
+        card["progress"]['value'] = (mission.progress / mission.target) * 100
+        card["status"].config(text="✅ Complete" if mission.completed else f"{mission.progress}/{mission.target}")
+        card["reward"].config(text=f"🎉 +{mission.xp_reward} XP" if mission.completed else "")
+
+    def update_memory_map(self):
+        """Draw the physical memory arena and fragmentation stats"""
+        memory = self.kernel.memory_manager
+        allocator = memory.allocator
+        status = memory.get_status()
+
+        canvas = self.memory_map_canvas
+        canvas.delete("all")
+        width = max(canvas.winfo_width(), 600)
+        scale = width / allocator.size
+        for start, (size, owner) in allocator.allocations.items():
+            if owner == "kernel":
+                color = '#2196F3'
+            elif isinstance(owner, str):  # Slab
+                color = '#9C27B0'
+            elif isinstance(owner, tuple):  # Page frame
+                color = '#FF9800'
+            else:
+                color = '#4CAF50'
+            end = start + allocator.block_size(start)
+            canvas.create_rectangle(start * scale, 0, end * scale, 40, fill=color, outline='#1a1a2e')
+
+        slabs = "   ".join(f"{name}: {cache['active']}/{cache['total']}" for name, cache in status["slabs"].items())
+        watermarks = status["watermarks"]
+        pressure = status["pressure"].upper() + ("  🌀 THRASHING" if status["thrashing"] else "")
+        pressure_colors = {"ok": 'black', "low": '#FF9800', "min": '#F44336'}
+        self.memory_status_label.config(fg=pressure_colors[status["pressure"]], text=(
+            f"Used: {status['used']:,}/{status['total']:,} KB ({status['utilization']:.1f}%)   "
+            f"Free blocks: {status['free_blocks']}   Largest free: {status['largest_free']:,} KB\n"
+            f"External fragmentation: {status['fragmentation']:.1f}%   "
+            f"Internal fragmentation: {status['internal_fragmentation']:.1f}%   "
+            f"Failed allocations: {status['failed_allocations']}\n"
+            f"Slab caches: {slabs}\n"
+            f"Pressure: {pressure}   Watermarks min/low/high: "
+            f"{watermarks['min']}/{watermarks['low']}/{watermarks['high']} KB   "
+            f"Swap: {status['swap_used']:,}/{status['swap_total']:,} KB   "
+            f"Reclaimed: {status['reclaimed']:,} KB   OOM kills: {self.kernel.process_manager.oom_kills}"))
+
+    def on_memory_policy_change(self, event=None):
+        """Switch the memory placement policy"""
+        self.kernel.memory_manager.set_policy(self.memory_policy_var.get())
+        self.game_manager.add_notification(f"💾 Memory policy: {self.memory_policy_var.get()}")
 
-                    print("✅ Part 2 complete - Game GUI framework created!")
     def create_file_manager_tab(self):
         """File manager with XP rewards"""
         file_frame = ttk.Frame(self.notebook)
         self.notebook.add(file_frame, text="📁 File Manager (+XP)")
+        self.file_tab = file_frame
 
         # XP info banner
         xp_banner = tk.Frame(file_frame, bg='#4CAF50', height=30)
@@ -1429,22 +5653,20 @@ Ready to continue your journey to becoming a Master System Administrator?"""
         self.path_var = tk.StringVar(value="/")
         ttk.Label(path_frame, textvariable=self.path_var, font=('Courier', 10)).pack(side=tk.LEFT, padx=10)
 
-        # File list
+        self.file_filter_var = tk.StringVar()
+        ttk.Entry(path_frame, textvariable=self.file_filter_var, width=20).pack(side=tk.RIGHT)
+        ttk.Label(path_frame, text="🔍 Filter:").pack(side=tk.RIGHT, padx=5)
+        self.file_filter_var.trace_add("write", lambda *args: self.file_list.refresh(reset=True))
+
+        # File list: only the rows on screen are fetched and drawn
         list_frame = ttk.Frame(file_frame)
         list_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
 
-        columns = ("Name", "Type", "Size", "Modified")
-        self.file_tree = ttk.Treeview(list_frame, columns=columns, show="headings")
-
-        for col in columns:
-            self.file_tree.heading(col, text=col)
-            self.file_tree.column(col, width=150)
-
-        scrollbar = ttk.Scrollbar(list_frame, orient="vertical", command=self.file_tree.yview)
-        self.file_tree.configure(yscrollcommand=scrollbar.set)
-
-        self.file_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.file_sort = ("name", False)
+        self.file_list = VirtualList(list_frame, [(column, 180) for column in self.FILE_COLUMNS],
+                                     self.fetch_files, self.sort_files, self.on_file_double_click)
+        self.file_list.pack(fill=tk.BOTH, expand=True)
+        self.file_list.set_heading(0, "Name ▲")
 
         # Gaming buttons
         button_frame = ttk.Frame(file_frame)
@@ -1461,9 +5683,6 @@ Ready to continue your journey to becoming a Master System Administrator?"""
         ttk.Button(button_frame, text="🔄 Refresh", 
                   command=self.refresh_files).pack(side=tk.LEFT, padx=5)
 
-        # Bind events
-        self.file_tree.bind("<Double-1>", self.on_file_double_click)
-
         self.refresh_files()
 
     def create_achievements_tab(self):
@@ -1475,13 +5694,13 @@ Ready to continue your journey to becoming a Master System Administrator?"""
         header_frame = ttk.Frame(achievements_frame)
         header_frame.pack(fill=tk.X, padx=10, pady=5)
 
-        progress_text = f"🏆 Achievements Unlocked: {self.game_manager.stats.achievements_unlocked}/20"
+        progress_text = f"🏆 Achievements Unlocked: {self.game_manager.stats.achievements_unlocked}/{len(self.game_manager.achievements)}"
         tk.Label(header_frame, text=progress_text, font=('Arial', 14, 'bold')).pack()
 
         # Achievement progress bar
         achievement_progress = ttk.Progressbar(header_frame, length=400, mode='determinate')
         achievement_progress.pack(pady=5)
-        achievement_progress['value'] = (self.game_manager.stats.achievements_unlocked / 20) * 100
+        achievement_progress['value'] = (self.game_manager.stats.achievements_unlocked / len(self.game_manager.achievements)) * 100
 
         # Scrollable achievements list
         canvas = tk.Canvas(achievements_frame)
@@ -1546,6 +5765,7 @@ Ready to continue your journey to becoming a Master System Administrator?"""
         """Daily missions tab"""
         missions_frame = ttk.Frame(self.notebook)
         self.notebook.add(missions_frame, text="🎯 Daily Missions")
+        self.missions_tab = missions_frame
 
         # Header
         header_frame = ttk.Frame(missions_frame)
@@ -1569,6 +5789,7 @@ Ready to continue your journey to becoming a Master System Administrator?"""
         missions_container.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
 
         self.missions_display_frame = tk.Frame(missions_container)
+        self.mission_cards = None  # mission id -> widgets of its card
         self.missions_display_frame.pack(fill=tk.BOTH, expand=True)
 
         # Refresh missions button
@@ -1582,68 +5803,68 @@ Ready to continue your journey to becoming a Master System Administrator?"""
 
     def update_missions_display(self):
         """Update missions display"""
-        # Clear existing widgets
-        for widget in self.missions_display_frame.winfo_children():
-            widget.destroy()
-
-        if not self.game_manager.active_missions:
-            tk.Label(self.missions_display_frame, 
-                    text="No active missions. Generate new daily missions!", 
-                    font=('Arial', 12)).pack(expand=True)
-            return
+        self.mission_cards = self.sync_mission_cards(
+            self.missions_display_frame, self.mission_cards, self.build_mission_card, self.update_mission_card,
+            "No active missions. Generate new daily missions!")
 
-        for mission in self.game_manager.active_missions:
-            # Mission card
-            mission_card = tk.Frame(self.missions_display_frame, relief='ridge', bd=2)
-            mission_card.pack(fill=tk.X, pady=5)
+    def build_mission_card(self, parent, mission: Mission) -> Dict:
+        # Mission card
+        mission_card = tk.Frame(parent, relief='ridge', bd=2)
+        mission_card.pack(fill=tk.X, pady=5)
 
-            # Mission header
-            header = tk.Frame(mission_card)
-            header.pack(fill=tk.X, padx=10, pady=5)
+        # Mission header
+        header = tk.Frame(mission_card)
+        header.pack(fill=tk.X, padx=10, pady=5)
 
-            # Difficulty color
-            diff_colors = {"Easy": "#4CAF50", "Medium": "#FF9800", "Hard": "#F44336"}
-            diff_color = diff_colors.get(mission.difficulty, "#757575")
+        # Difficulty color
+        diff_colors = {"Easy": "#4CAF50", "Medium": "#FF9800", "Hard": "#F44336"}
+        diff_color = diff_colors.get(mission.difficulty, "#757575")
 
-            tk.Label(header, text="🎯", font=('Arial', 16)).pack(side=tk.LEFT)
+        tk.Label(header, text="🎯", font=('Arial', 16)).pack(side=tk.LEFT)
 
-            info_frame = tk.Frame(header)
-            info_frame.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=10)
+        info_frame = tk.Frame(header)
+        info_frame.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=10)
 
-            tk.Label(info_frame, text=mission.name, 
-                    font=('Arial', 12, 'bold')).pack(anchor='w')
-            tk.Label(info_frame, text=mission.description, 
-                    font=('Arial', 10)).pack(anchor='w')
+        tk.Label(info_frame, text=mission.name, 
+                font=('Arial', 12, 'bold')).pack(anchor='w')
+        tk.Label(info_frame, text=mission.description, 
+                font=('Arial', 10)).pack(anchor='w')
 
-            # Difficulty and XP
-            reward_frame = tk.Frame(header)
-            reward_frame.pack(side=tk.RIGHT)
+        # Difficulty and XP
+        reward_frame = tk.Frame(header)
+        reward_frame.pack(side=tk.RIGHT)
 
-            tk.Label(reward_frame, text=mission.difficulty, 
-                    bg=diff_color, fg='white', font=('Arial', 8, 'bold'), 
-                    padx=5, pady=2).pack()
-            tk.Label(reward_frame, text=f"+{mission.xp_reward} XP", 
-                    font=('Arial', 10, 'bold'), fg='#FFD700').pack()
+        tk.Label(reward_frame, text=mission.difficulty, 
+                bg=diff_color, fg='white', font=('Arial', 8, 'bold'), 
+                padx=5, pady=2).pack()
+        tk.Label(reward_frame, text=f"+{mission.xp_reward} XP", 
+                font=('Arial', 10, 'bold'), fg='#FFD700').pack()
 
-            # Progress bar
-            progress_frame = tk.Frame(mission_card)
-            progress_frame.pack(fill=tk.X, padx=10, pady=5)
+        # Progress bar
+        progress_frame = tk.Frame(mission_card)
+        progress_frame.pack(fill=tk.X, padx=10, pady=5)
 
-            progress_bar = ttk.Progressbar(progress_frame, length=300, mode='determinate')
-            progress_bar.pack(side=tk.LEFT)
+        progress_bar = ttk.Progressbar(progress_frame, length=300, mode='determinate')
+        progress_bar.pack(side=tk.LEFT)
 
-            if mission.target > 0:
-                progress_percentage = (mission.progress / mission.target) * 100
-                progress_bar['value'] = progress_percentage
+        progress_label = tk.Label(progress_frame, font=('Arial', 10))
+        progress_label.pack(side=tk.LEFT, padx=10)
+        return {"progress": progress_bar, "status": progress_label, "shown": None}
 
-                progress_text = f"{mission.progress}/{mission.target}"
-                if mission.completed:
-                    progress_text += " ✅ COMPLETE!"
-            else:
-                progress_text = "Ready to start"
+    def update_mission_card(self, card: Dict, mission: Mission):
+        shown = (mission.progress, mission.target, mission.completed)
+        if card["shown"] == shown:
+            return
+        card["shown"] = shown
+        if mission.target > 0:
+            card["progress"]['value'] = (mission.progress / mission.target) * 100
 
-            tk.Label(progress_frame, text=progress_text, 
-                    font=('Arial', 10)).pack(side=tk.LEFT, padx=10)
+            progress_text = f"{mission.progress}/{mission.target}"
+            if mission.completed:
+                progress_text += " ✅ COMPLETE!"
+        else:
+            progress_text = "Ready to start"
+        card["status"].config(text=progress_text)
 
     def create_games_tab(self):
         """Mini-games tab"""
@@ -1668,7 +5889,9 @@ Ready to continue your journey to becoming a Master System Administrator?"""
             ("🐍 Snake", "Classic Snake game", "snake", "#4CAF50"),
             ("🧩 Puzzle", "Logic puzzles", "puzzle", "#2196F3"),
             ("⚡ Speed Test", "Test your speed", "speed", "#FF9800"),
-            ("🎯 Memory Game", "Memory challenge", "memory", "#9C27B0"),
+            ("🧪 Page Lab", "Page replacement showdown", "memory", "#9C27B0"),
+            ("🏭 Producer-Consumer", "Sync the bounded buffer", "buffer", "#F44336"),
+            ("💿 Disk Arm", "Race the disk schedulers", "disk", "#607D8B"),
         ]
 
         for i, (name, desc, game_id, color) in enumerate(games):
@@ -1708,56 +5931,56 @@ Ready to continue your journey to becoming a Master System Administrator?"""
                 font=('Arial', 16, 'bold')).pack()
         tk.Label(header_frame, text="See how you rank against other System Administrators!", 
                 font=('Arial', 10)).pack()
+        self.leaderboard_status_var = tk.StringVar()
+        tk.Label(header_frame, textvariable=self.leaderboard_status_var, font=('Arial', 9), fg='gray').pack()
 
         # Current player stats
         player_frame = ttk.LabelFrame(leaderboard_frame, text="👤 Your Stats", padding=10)
         player_frame.pack(fill=tk.X, padx=10, pady=5)
 
-        stats_text = f"""Level: {self.game_manager.stats.level}
-Total XP: {self.game_manager.stats.total_xp:,}
-Achievements: {self.game_manager.stats.achievements_unlocked}/20
-Login Streak: {self.game_manager.stats.login_streak} days
-Files Created: {self.game_manager.stats.files_created}"""
-
-        tk.Label(player_frame, text=stats_text, font=('Courier', 10), justify=tk.LEFT).pack()
+        self.leaderboard_stats_label = tk.Label(player_frame, font=('Courier', 10), justify=tk.LEFT)
+        self.leaderboard_stats_label.pack()
 
-        # Mock leaderboard (in real app, this would connect to a server)
         leaderboard_data_frame = ttk.LabelFrame(leaderboard_frame, text="🏆 Top Players", padding=10)
         leaderboard_data_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
 
+        # Paging controls
+        controls = ttk.Frame(leaderboard_data_frame)
+        controls.pack(fill=tk.X, pady=(0, 5))
+        ttk.Label(controls, text="Sort by:").pack(side=tk.LEFT)
+        self.leaderboard_sort_var = tk.StringVar(value="total_xp")
+        sort_box = ttk.Combobox(controls, textvariable=self.leaderboard_sort_var, state="readonly",
+                                values=ProfileStore.SORT_KEYS, width=12)
+        sort_box.pack(side=tk.LEFT, padx=5)
+        sort_box.bind("<<ComboboxSelected>>", lambda event: self.show_leaderboard_page())
+        ttk.Button(controls, text="⏮️ Top", command=self.show_leaderboard_page).pack(side=tk.LEFT, padx=2)
+        ttk.Button(controls, text="◀️ Prev", command=self.previous_leaderboard_page).pack(side=tk.LEFT, padx=2)
+        ttk.Button(controls, text="▶️ Next", command=self.next_leaderboard_page).pack(side=tk.LEFT, padx=2)
+        ttk.Button(controls, text="🎯 Find Me", command=self.show_my_leaderboard_page).pack(side=tk.LEFT, padx=2)
+
         # Leaderboard table
         columns = ("Rank", "Player", "Level", "XP", "Achievements")
-        leaderboard_tree = ttk.Treeview(leaderboard_data_frame, columns=columns, show="headings", height=15)
+        self.leaderboard_tree = ttk.Treeview(leaderboard_data_frame, columns=columns, show="headings", height=15)
 
         for col in columns:
-            leaderboard_tree.heading(col, text=col)
-            leaderboard_tree.column(col, width=100)
-
-        # Mock data
-        mock_data = [
-            (1, "SystemMaster", 15, "22,500", "18/20"),
-            (2, "AdminPro", 12, "14,400", "15/20"),
-            (3, "CodeNinja", 10, "10,000", "12/20"),
-            (4, "TechWizard", 8, "6,400", "10/20"),
-            (5, f"YOU ({datetime.now().strftime('%H:%M')})", self.game_manager.stats.level, 
-                f"{self.game_manager.stats.total_xp:,}", f"{self.game_manager.stats.achievements_unlocked}/20"),
-        ]
+            self.leaderboard_tree.heading(col, text=col)
+            self.leaderboard_tree.column(col, width=100)
+        self.leaderboard_tree.tag_configure("you", background="#fff3b0")
 
-        for data in mock_data:
-            item = leaderboard_tree.insert("", tk.END, values=data)
-            if "YOU" in str(data[1]):
-                leaderboard_tree.set(item, "Player", data[1])
-                # Highlight current player
+        self.leaderboard_tree.pack(fill=tk.BOTH, expand=True)
 
-        leaderboard_tree.pack(fill=tk.BOTH, expand=True)
-
-        # Note about online features
         note_frame = tk.Frame(leaderboard_frame)
         note_frame.pack(fill=tk.X, padx=10, pady=5)
 
-        tk.Label(note_frame, text="📝 Note: This is a demo leaderboard. In the full version, you'd compete with real players!", 
+        tk.Label(note_frame, text=f"📝 Offline, the leaderboard is served from {self.profiles.path}; rivals are simulated players.",
                 font=('Arial', 9), fg='gray').pack()
 
+        self.leaderboard_pages = []  # Keyset cursors of the pages up to the current one
+        self.leaderboard_rows = []
+        self.leaderboard_online = None  # Source of the rows on screen
+        self.update_profile()
+        self.show_leaderboard_page()
+
         print("✅ Complete gamified GUI created!")
         print("Features include:")
         print("- Dashboard with game stats")
@@ -1767,6 +5990,90 @@ Files Created: {self.game_manager.stats.files_created}"""
         print("- Mini-games hub")
         print("- Leaderboard")
         print("- Gamified file manager")
+    def update_profile(self):
+        """Write the player's profile and refresh the leaderboard when it changed"""
+        stats = self.game_manager.stats
+        profile = (stats.level, stats.total_xp, stats.achievements_unlocked)
+        if getattr(self, "_saved_profile", None) == profile:
+            return
+        self._saved_profile = profile
+        self.profiles.upsert(self.player_name, *profile)
+        self.profiles.flush()
+        self.leaderboard.submit(self.player_name, *profile)
+
+        standing = self.leaderboard.rank(self.player_name)
+        if standing is None or standing["rank"] is None:  # Offline, or the submit was refused
+            standing = {"rank": self.profiles.rank(self.player_name), "of": self.profiles.count()}
+        self.leaderboard_stats_label.config(text=f"""Player: {self.player_name}
+Rank: #{standing['rank']:,} of {standing['of']:,}
+Level: {stats.level}
+Total XP: {stats.total_xp:,}
+Achievements: {stats.achievements_unlocked}/{len(self.game_manager.achievements)}
+Login Streak: {stats.login_streak} days
+Speed Challenge Best: {f"{self.challenge.runs[0]['time']:.2f}s" if self.challenge.runs else "-"}""")
+        if len(self.leaderboard_pages) == 0:
+            self.show_leaderboard_page()
+
+    def show_leaderboard_rows(self, rows: List[Dict]):
+        tree = self.leaderboard_tree
+        tree.delete(*tree.get_children())
+        achievements = len(self.game_manager.achievements)
+        for row in rows:
+            tags = ("you",) if row["name"] == self.player_name else ()
+            tree.insert("", tk.END, tags=tags, values=(
+                row["rank"], row["name"], row["level"], f"{row['total_xp']:,}",
+                f"{row['achievements']}/{achievements}"))
+        self.leaderboard_rows = rows
+
+    def set_leaderboard_source(self, online: bool) -> bool:
+        """Record where leaderboard rows come from; returns False if that changed mid-paging"""
+        changed = self.leaderboard_online is not None and online != self.leaderboard_online
+        self.leaderboard_online = online
+        if online:
+            self.leaderboard_status_var.set(f"🌐 Online: {self.leaderboard.host}:{self.leaderboard.port}")
+        else:
+            self.leaderboard_status_var.set("📴 Offline: showing local profiles")
+        return not changed
+
+    def show_leaderboard_page(self, after=None):
+        """Show a page of the leaderboard; `after` is the keyset cursor of the previous page's last row"""
+        if after is None:
+            self.leaderboard_pages = []
+        by = self.leaderboard_sort_var.get()
+        rows = self.leaderboard.top(self.LEADERBOARD_PAGE, after) if by == "total_xp" else None
+        if not self.set_leaderboard_source(rows is not None) and after is not None:
+            return self.show_leaderboard_page()  # Cursors are only valid for the source they came from
+        if rows is None:
+            rows = self.profiles.top(self.LEADERBOARD_PAGE, by, after)
+        if rows:
+            self.show_leaderboard_rows(rows)
+        return bool(rows)
+
+    def next_leaderboard_page(self):
+        if not self.leaderboard_rows:
+            return
+        last = self.leaderboard_rows[-1]
+        cursor = (last[self.leaderboard_sort_var.get()], last["id"])
+        self.leaderboard_pages.append(cursor)
+        if not self.show_leaderboard_page(cursor) and self.leaderboard_pages:
+            self.leaderboard_pages.pop()  # Past the last page
+
+    def previous_leaderboard_page(self):
+        if len(self.leaderboard_pages) > 1:
+            self.leaderboard_pages.pop()
+            self.show_leaderboard_page(self.leaderboard_pages[-1])
+        else:
+            self.show_leaderboard_page()
+
+    def show_my_leaderboard_page(self):
+        self.leaderboard_sort_var.set("total_xp")
+        self.leaderboard_pages = [None]  # Not a top-down page; Prev goes back to the top
+        rows = self.leaderboard.around(self.player_name, self.LEADERBOARD_PAGE)
+        self.set_leaderboard_source(rows is not None)
+        if rows is None:
+            rows = self.profiles.around(self.player_name, self.LEADERBOARD_PAGE)
+        self.show_leaderboard_rows(rows)
+
     def update_xp_display(self):
         """Update XP progress bar"""
         progress = self.game_manager.get_level_progress()
@@ -1780,22 +6087,37 @@ Files Created: {self.game_manager.stats.files_created}"""
 
     def refresh_files(self):
         """Refresh file list"""
-        for item in self.file_tree.get_children():
-            self.file_tree.delete(item)
-
-        items = self.kernel.filesystem.ls()
+        current_path = self.kernel.filesystem.current_path
+        self.file_list.refresh(reset=current_path != self.path_var.get())
+        self.path_var.set(current_path)
+
+    def fetch_files(self, offset: int, limit: int) -> tuple:
+        """One page of the current directory for the file list"""
+        sort, descending = self.file_sort
+        total, items = self.kernel.filesystem.ls_page(None, offset, limit, sort, descending,
+                                                      self.file_filter_var.get())
+        rows = []
         for item in items:
             icon = "📁" if item["type"] == "directory" else "📄"
             name_with_icon = f"{icon} {item['name']}"
 
-            self.file_tree.insert("", tk.END, values=(
+            rows.append((item["name"], (
                 name_with_icon,
                 item["type"],
                 f"{item['size']} bytes" if item["type"] == "file" else f"{item['size']} items",
                 item["modified"]
-            ))
-
-        self.path_var.set(self.kernel.filesystem.current_path)
+            )))
+        return total, rows
+
+    def sort_files(self, column: int):
+        """Sort the file list by a column; clicking the same column again reverses it"""
+        sort = self.FILE_COLUMNS[column].lower()
+        descending = self.file_sort == (sort, False)
+        self.file_sort = (sort, descending)
+        for index, heading in enumerate(self.FILE_COLUMNS):
+            arrow = (" ▼" if descending else " ▲") if index == column else ""
+            self.file_list.set_heading(index, heading + arrow)
+        self.file_list.refresh(reset=True)
 
     """ 
     owner - Samruddha Belsare
@@ -1808,10 +6130,7 @@ Files Created: {self.game_manager.stats.files_created}"""
             current_path = self.kernel.filesystem.current_path
             file_path = f"{current_path.rstrip('/')}/{filename}" if current_path != "/" else f"/{filename}"
 
-            if self.kernel.filesystem.create_file(file_path, ""):
-                self.refresh_files()
-                self.update_xp_display()
-                self.update_missions_display()
+            self.kernel.filesystem.create_file(file_path, "")
 
     def new_folder(self):
         """Create new folder with XP reward"""
@@ -1820,47 +6139,37 @@ Files Created: {self.game_manager.stats.files_created}"""
             current_path = self.kernel.filesystem.current_path
             folder_path = f"{current_path.rstrip('/')}/{foldername}" if current_path != "/" else f"/{foldername}"
 
-            if self.kernel.filesystem.mkdir(folder_path):
-                self.refresh_files()
-                self.update_xp_display()
-                self.update_missions_display()
+            self.kernel.filesystem.mkdir(folder_path)
 
     def delete_item(self):
         """Delete selected item with XP reward"""
-        selection = self.file_tree.selection()
+        selection = self.file_list.selection()
         if selection:
-            item = self.file_tree.item(selection[0])
-            name = item["values"][0].split(" ", 1)[1]  # Remove icon
+            name = selection[0]
 
             if messagebox.askyesno("Confirm Delete", f"Delete '{name}'? (+5 XP)"):
                 current_path = self.kernel.filesystem.current_path
                 item_path = f"{current_path.rstrip('/')}/{name}" if current_path != "/" else f"/{name}"
 
-                if self.kernel.filesystem.rm(item_path):
-                    self.refresh_files()
-                    self.update_xp_display()
-                    self.update_missions_display()
+                self.kernel.filesystem.rm(item_path)
 
     def on_file_double_click(self, event):
         """Handle file double click"""
-        selection = self.file_tree.selection()
+        selection = self.file_list.selection()
         if selection:
-            item = self.file_tree.item(selection[0])
-            name = item["values"][0].split(" ", 1)[1]  # Remove icon
-            file_type = item["values"][1]
+            name = selection[0]
+            file_type = selection[1][1]
 
             if file_type == "directory":
-                if self.kernel.filesystem.cd(name):
-                    self.refresh_files()
+                self.kernel.filesystem.cd(name)
             else:
                 self.view_file()
 
     def view_file(self):
         """View selected file"""
-        selection = self.file_tree.selection()
+        selection = self.file_list.selection()
         if selection:
-            item = self.file_tree.item(selection[0])
-            name = item["values"][0].split(" ", 1)[1]  # Remove icon
+            name = selection[0]
 
             content = self.kernel.filesystem.cat(name)
             if content is not None:
@@ -1879,6 +6188,7 @@ Files Created: {self.game_manager.stats.files_created}"""
         """Process manager with gaming elements"""
         process_frame = ttk.Frame(self.notebook)
         self.notebook.add(process_frame, text="⚙️ Process Manager (+XP)")
+        self.process_tab = process_frame
 
         # XP banner
         xp_banner = tk.Frame(process_frame, bg='#FF9800', height=30)
@@ -1891,6 +6201,7 @@ Files Created: {self.game_manager.stats.files_created}"""
         # Process list
         columns = ("PID", "Name", "State", "Memory", "CPU", "Command")
         self.process_tree = ttk.Treeview(process_frame, columns=columns, show="headings")
+        self.process_rows = TreeviewSync(self.process_tree)
 
         for col in columns:
             self.process_tree.heading(col, text=col)
@@ -1913,22 +6224,25 @@ Files Created: {self.game_manager.stats.files_created}"""
 
     def refresh_processes(self):
         """Refresh process list"""
-        for item in self.process_tree.get_children():
-            self.process_tree.delete(item)
+        self.process_rows.update(self.process_rows_for(self.kernel.process_manager.list_processes()))
 
-        processes = self.kernel.process_manager.list_processes()
+    @staticmethod
+    def process_rows_for(processes: List[Dict]) -> List[tuple]:
+        rows = []
         for proc in processes:
-            state_icon = {"ready": "⏸️", "running": "▶️", "terminated": "❌"}.get(proc["state"], "❓")
+            state_icon = {"ready": "⏸️", "running": "▶️", "blocked": "⏳", "stopped": "⏹️",
+                          "terminated": "❌"}.get(proc["state"], "❓")
             status = f"{state_icon} {proc['state']}"
 
-            self.process_tree.insert("", tk.END, values=(
+            rows.append((proc["pid"], (
                 proc["pid"],
                 proc["name"],
                 status,
                 f"{proc['memory']} KB",
                 proc["cpu_time"],
                 proc["command"]
-            ))
+            )))
+        return rows
 
     def new_process(self):
         """Create new process with XP reward"""
@@ -1936,10 +6250,8 @@ Files Created: {self.game_manager.stats.files_created}"""
         if name:
             command = simpledialog.askstring("New Process", "Enter command:")
             if command:
-                self.kernel.process_manager.create_process(name, command)
-                self.refresh_processes()
-                self.update_xp_display()
-                self.update_missions_display()
+                if self.kernel.process_manager.create_process(name, command) is None:
+                    messagebox.showwarning("Out of Memory", "Not enough contiguous memory to start the process!")
 
     def kill_process(self):
         """Kill selected process with XP reward"""
@@ -1949,15 +6261,12 @@ Files Created: {self.game_manager.stats.files_created}"""
             pid = int(item["values"][0])
             name = item["values"][1]
 
-            if pid <= 4:
+            if pid in self.kernel.process_manager.PROTECTED_PIDS:
                 messagebox.showwarning("Protected Process", "Cannot kill system processes!")
                 return
 
             if messagebox.askyesno("Confirm Kill", f"Kill process '{name}'? (+20 XP)"):
-                if self.kernel.process_manager.kill_process(pid):
-                    self.refresh_processes()
-                    self.update_xp_display()
-                    self.update_missions_display()
+                self.kernel.process_manager.kill_process(pid)
 
     def create_terminal_tab(self):
         """Gaming terminal with XP rewards"""
@@ -1980,6 +6289,7 @@ Files Created: {self.game_manager.stats.files_created}"""
             font=("Courier", 11)
         )
         self.terminal_output.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+        self.terminal = TerminalWriter(self.terminal_output, self.TERMINAL_SCROLLBACK)
 
         # Command input
         input_frame = ttk.Frame(terminal_frame)
@@ -1996,9 +6306,9 @@ Files Created: {self.game_manager.stats.files_created}"""
                   command=self.execute_command).pack(side=tk.RIGHT)
 
         # Initialize terminal
-        self.terminal_output.insert(tk.END, "🎮 Welcome to GameOS Terminal! 🎮\n")
-        self.terminal_output.insert(tk.END, "Each command earns you +5 XP!\n")
-        self.terminal_output.insert(tk.END, "Type 'help' to see available commands\n\n")
+        self.terminal.write("🎮 Welcome to GameOS Terminal! 🎮\n")
+        self.terminal.write("Each command earns you +5 XP!\n")
+        self.terminal.write("Type 'help' to see available commands\n\n")
 
     def execute_command(self, event=None):
         """Execute command with XP reward"""
@@ -2008,21 +6318,19 @@ Files Created: {self.game_manager.stats.files_created}"""
 
         # Add to terminal
         current_path = self.kernel.filesystem.current_path
-        self.terminal_output.insert(tk.END, f"player@gameos:{current_path}$ {command}\n")
+        self.terminal.write(f"player@gameos:{current_path}$ {command}\n")
 
         # Clear entry
         self.command_entry.delete(0, tk.END)
 
         # Award XP for command
-        leveled_up = self.game_manager.stats.add_xp(5)
-        self.game_manager.stats.commands_executed += 1
+        leveled_up = self.game_manager.award("command", 5)
 
         if leveled_up:
             self.game_manager.add_notification(f"🎉 LEVEL UP! Now Level {self.game_manager.stats.level}!")
 
         # Check achievements
-        self.game_manager.check_achievement("terminal_rookie")
-        self.game_manager.check_achievement("terminal_expert")
+        self.game_manager.bump("commands_executed")
 
         # Update missions
         self.game_manager.update_mission_progress("terminal_warrior")
@@ -2046,11 +6354,18 @@ Files Created: {self.game_manager.stats.files_created}"""
   touch <name>    - Create file (+10 XP)
   cat <file>      - Display file content
   rm <path>       - Remove file/directory (+5 XP)
+  mkfiles <n> [dir] - Create n files in the background (no XP)
 
 ⚙️ Process Management:
   ps              - List processes
   kill <pid>      - Kill process (+20 XP)
+  kill -SIG <pid> - Send a signal (TERM, KILL, STOP, CONT, INT, CHLD)
+  kill -SIG -1    - Send a signal to every user process
+  kill -l         - List signals
   top             - Show system status
+  vmstat [refs] [pages] - Virtual memory stats (optionally simulate a trace as a job)
+  pagelab [kind] [frames] - Compare page replacement (locality, random, belady)
+  diskstat [requests] - Disk I/O stats (optionally compare schedulers as a job)
 
 🎮 Gaming:
   stats           - Show your game stats
@@ -2072,7 +6387,7 @@ Files Created: {self.game_manager.stats.files_created}"""
   XP to next level: {int(self.game_manager.get_level_progress()['needed_xp'] - self.game_manager.get_level_progress()['current_xp'])}
 
 🏆 Achievements:
-  Unlocked: {self.game_manager.stats.achievements_unlocked}/20
+  Unlocked: {self.game_manager.stats.achievements_unlocked}/{len(self.game_manager.achievements)}
 
 📈 Activity:
   Files Created: {self.game_manager.stats.files_created}
@@ -2096,16 +6411,12 @@ Needed for next level: {int(progress['needed_xp'] - progress['current_xp'])}
 Total XP: {self.game_manager.stats.total_xp:,}"""
 
         elif cmd == "ls":
-            items = self.kernel.filesystem.ls()
-            for item in items:
-                icon = "📁" if item["type"] == "directory" else "📄"
-                output += f"{icon} {item['name']}\n"
+            output = self.ls_lines()
 
         elif cmd == "cd":
             if args:
                 if self.kernel.filesystem.cd(args[0]):
                     output = f"📁 Changed to: {self.kernel.filesystem.current_path}"
-                    self.refresh_files()
                 else:
                     output = f"❌ cd: {args[0]}: No such directory"
             else:
@@ -2115,24 +6426,351 @@ Total XP: {self.game_manager.stats.total_xp:,}"""
             output = f"📍 {self.kernel.filesystem.current_path}"
 
         elif cmd == "ps":
-            processes = self.kernel.process_manager.list_processes()
-            output = f"{'PID':<6} {'NAME':<15} {'STATE'}\n"
-            for p in processes:
-                output += f"{p['pid']:<6} {p['name']:<15} {p['state']}\n"
+            output = self.ps_lines()
+
+        elif cmd == "kill":
+            output = self.kill_command(args)
+
+        elif cmd == "vmstat":
+            output = self.vmstat_command(args)
+
+        elif cmd == "pagelab":
+            output = self.pagelab_command(args)
+
+        elif cmd == "diskstat":
+            output = self.diskstat_command(args)
+
+        elif cmd == "mkfiles":
+            output = self.mkfiles_command(args)
 
         else:
             output = f"❌ {cmd}: command not found (but you still got +5 XP!)"
 
-        # Add output
-        if output:
-            self.terminal_output.insert(tk.END, output + "\n")
+        # Add output: long listings stream in line by line
+        if isinstance(output, str):
+            if output:
+                self.terminal.write(output + "\n")
+        else:
+            self.terminal.stream(output)
+
+        self.terminal.write("\n")
+
+    def ls_lines(self):
+        """Terminal 'ls': the listing is taken now and streamed afterwards, so a later
+        cd or file change does not cut it short or repeat entries"""
+        snapshot = self.kernel.filesystem.ls_snapshot()
+        if snapshot is None:
+            return iter(())
+        contents, names = snapshot
+
+        def lines():
+            for name in names:
+                item = contents.get(name)
+                if item is not None:  # Skip entries deleted while streaming
+                    yield f"{'📁' if item['type'] == 'directory' else '📄'} {name}\n"
+        return lines()
+
+    def ps_lines(self):
+        """Terminal 'ps': the process table as of now, streamed afterwards"""
+        rows = [(p.pid, p.name, p.state) for p in self.kernel.process_manager.processes.values()]
+
+        def lines():
+            yield f"{'PID':<6} {'NAME':<15} {'STATE'}\n"
+            for pid, name, state in rows:
+                yield f"{pid:<6} {name:<15} {state}\n"
+        return lines()
+
+    def kill_command(self, args: List[str]) -> str:
+        """Terminal 'kill [-SIG] pid' command"""
+        if args == ["-l"]:
+            return "  ".join(f"{number}) {name}" for number, name in sorted(SIGNAL_NAMES.items()))
+
+        sig = SIGTERM
+        if args and args[0].startswith("-") and len(args) > 1:
+            sig = parse_signal(args[0])
+            if sig is None:
+                return f"❌ kill: {args[0]}: invalid signal specification"
+            args = args[1:]
+        if not args:
+            return "❌ kill: usage: kill [-SIG] <pid>"
+
+        process_manager = self.kernel.process_manager
+        if args[0] == "-1":
+            count = process_manager.broadcast_signal(sig)
+            return f"📡 Sent {SIGNAL_NAMES[sig]} to {count} processes"
+
+        try:
+            pid = int(args[0])
+        except ValueError:
+            return f"❌ kill: {args[0]}: arguments must be process IDs"
 
-        self.terminal_output.insert(tk.END, "\n")
-        self.terminal_output.see(tk.END)
+        if pid not in process_manager.processes:
+            return f"❌ kill: ({pid}) - No such process"
+        if not process_manager.kill_process(pid, sig):
+            return f"❌ kill: ({pid}) - Operation not permitted"
 
-        # Update displays
-        self.update_xp_display()
-        self.update_missions_display()
+        return f"📡 Sent {SIGNAL_NAMES[sig]} to {pid} ({process_manager.processes[pid].state})"
+
+    def vmstat_command(self, args: List[str]) -> str:
+        """Terminal 'vmstat [references] [pages]' command"""
+        if np is None:
+            return "❌ vmstat: the paging simulator needs NumPy (pip install numpy)"
+
+        vm = self.kernel.memory_manager.virtual_memory
+        output = ""
+        if args:
+            try:
+                references = min(int(args[0].replace("_", "")), 50_000_000)
+                pages = max(1, min(int(args[1]), 65536)) if len(args) > 1 else 256
+            except ValueError:
+                return f"❌ vmstat: {' '.join(args)}: invalid reference or page count"
+
+            pid = self.kernel.process_manager.create_process("vmstat", f"vmstat {references}", game_action=False)
+            if pid is None:
+                return "❌ vmstat: out of memory"
+
+            swap = self.kernel.memory_manager.swap
+            faults_before, misses_before = vm.page_faults, vm.tlb.misses
+            swapins_before, swapouts_before = swap.pswpin, swap.pswpout
+
+            def translate(vaddrs, writes):
+                proc = self.kernel.process_manager.processes.get(pid)
+                if proc is None or proc.state == "terminated":  # Killed by the user or the OOM killer
+                    job.detail = f"PID {pid} was killed"
+                    job.cancel()
+                    return
+                vm.translate(pid, vaddrs, writes)
+
+            def finished(job):
+                table = vm.page_tables.get(pid)
+                table_bytes = table.memory_bytes() if table is not None else 0
+                self.kernel.process_manager.exit_process(pid)
+                self.kernel.memory_manager.check_pressure()
+                if job.state != "done":
+                    self.terminal.write(self.job_ended_text(job) + "\n\n")
+                    return
+                elapsed = time.perf_counter() - job.submitted
+                self.terminal.write(f"""🧪 Simulated {references:,} references in {elapsed:.2f}s ({references / elapsed:,.0f} refs/s)
+  TLB misses: {vm.tlb.misses - misses_before:,}   Page faults: {vm.page_faults - faults_before:,}
+  Swapped in: {swap.pswpin - swapins_before:,}   Swapped out: {swap.pswpout - swapouts_before:,}
+  Page table: {table_bytes:,} bytes ({vm.levels}-level) vs {PageTable.single_level_bytes():,} bytes single-level
+
+""")
+
+            job = self.submit_job(f"vmstat {references:,} references", self.vmstat_job,
+                                  translate, references, pages, on_done=finished)
+            output += f"🧵 Started job #{job.id}: simulating {references:,} references (Game > Jobs to watch or cancel)\n\n"
+
+        status = vm.get_status()
+        output += f"""📊 Virtual Memory Statistics:
+  References translated: {status['references']:,}
+  TLB: {vm.tlb.entries} entries, {vm.tlb.ways}-way   Hits: {status['tlb_hits']:,}   Misses: {status['tlb_misses']:,}   Hit rate: {status['tlb_hit_rate']:.2f}%
+  Page faults: {status['page_faults']:,}   Unbacked faults: {status['failed_faults']:,}
+  Resident pages: {status['resident_pages']:,} ({status['resident_pages'] * PAGE_KB:,} KB)
+  Swap: {status['swapped_pages']:,} pages out   pswpin: {status['pswpin']:,}   pswpout: {status['pswpout']:,}   Writebacks: {status['writebacks']:,}   Evictions: {status['evictions']:,}
+  Page tables: {status['page_table_bytes']:,} bytes"""
+        return output
+
+    @staticmethod
+    def vmstat_job(job: Job, translate, references: int, pages: int) -> int:
+        """Worker side of 'vmstat': build the trace here, translate it on the Tk thread in chunks"""
+        stream = generate_reference_stream(references, pages=pages)
+        writes = np.random.default_rng().random(references) < 0.3
+        chunk = GameOSGUI.VMSTAT_CHUNK
+        for i in range(0, references, chunk):
+            job.apply(translate, stream[i:i + chunk], writes[i:i + chunk])
+            done = min(i + chunk, references)
+            job.report(done / references, f"{done:,} references")
+        return references
+
+    def diskstat_command(self, args: List[str]) -> str:
+        """Terminal 'diskstat [requests]' command"""
+        disk = self.kernel.disk
+        if disk is None:
+            return "❌ diskstat: the disk simulator needs NumPy (pip install numpy)"
+
+        output = ""
+        if args:
+            try:
+                count = max(1, min(int(args[0].replace("_", "")), 10_000_000))
+            except ValueError:
+                return f"❌ diskstat: {args[0]}: invalid request count"
+
+            def finished(job):
+                if job.state != "done":
+                    self.terminal.write(self.job_ended_text(job) + "\n\n")
+                    return
+                totals = job.result
+                elapsed = time.perf_counter() - job.submitted
+                best = min(totals, key=totals.get)
+                result = f"🧪 {count:,} requests, queue depth {disk.queue_depth}, compared in {elapsed:.2f}s\n"
+                result += f"{'ALGORITHM':<10} {'TOTAL SEEK':>14} {'AVG/REQ':>9}\n"
+                for name, seek in totals.items():
+                    result += f"{name:<10} {seek:>14,} {seek / count:>9.1f}{'  🏆' if name == best else ''}\n"
+                self.terminal.write(result + "\n")
+
+            job = self.submit_job(f"diskstat {count:,} requests", self.diskstat_job,
+                                  count, disk.cylinders, disk.head, disk.queue_depth, on_done=finished)
+            output += f"🧵 Started job #{job.id}: comparing arm schedulers on {count:,} requests\n\n"
+
+        disk.dispatch()
+        status = disk.get_status()
+        output += f"""💿 Disk Statistics ({disk.cylinders} cylinders, {status['algorithm']}):
+  Head: cylinder {status['head']}   Queued: {status['queued']}
+  Reads: {status['reads']:,} blocks   Writes: {status['writes']:,} blocks
+  Served: {status['served']:,} requests in {status['dispatches']:,} dispatches
+  Total seek: {status['total_seek']:,} cylinders   Average: {status['average_seek']:.1f} per request
+  Blocks used: {status['used_blocks']:,}/{status['blocks']:,}"""
+        return output
+
+    @staticmethod
+    def diskstat_job(job: Job, count: int, cylinders: int, head: int, depth: int) -> Dict[str, int]:
+        """Worker side of 'diskstat': the comparison only reads its own request stream"""
+        requests = Disk.request_stream(count, cylinders)
+        job.report(0.5, "comparing schedulers")
+        return Disk.compare(requests, cylinders, head, depth)
+
+    def mkfiles_command(self, args: List[str]) -> str:
+        """Terminal 'mkfiles <count> [directory]' command: bulk file creation as a background job"""
+        try:
+            count = max(1, min(int(args[0].replace("_", "")), 1_000_000))
+        except (IndexError, ValueError):
+            return "❌ mkfiles: usage: mkfiles <count> [directory]"
+        filesystem = self.kernel.filesystem
+        directory = args[1] if len(args) > 1 else filesystem.current_path
+        if not directory.startswith("/"):
+            directory = f"{filesystem.current_path.rstrip('/')}/{directory}"
+        if filesystem._navigate_to_path(directory) is None and not filesystem.mkdir(directory, game_action=False):
+            return f"❌ mkfiles: {directory}: cannot create directory"
+
+        created = [0]
+
+        def create_batch(files):
+            batch_created = filesystem.create_files(files)
+            created[0] += batch_created
+            if batch_created < len(files):  # Names are unique, so the inodes ran out
+                job.detail = f"out of memory after {created[0]:,} files"
+                job.cancel()
+
+        def finished(job):
+            ended = "" if job.state == "done" else f" ({self.job_ended_text(job)})"
+            self.terminal.write(f"📄 mkfiles: created {created[0]:,} files in {directory}{ended}\n\n")
+
+        job = self.submit_job(f"mkfiles {count:,} in {directory}", self.mkfiles_job,
+                              directory.rstrip("/"), count, create_batch, on_done=finished)
+        return f"🧵 Started job #{job.id}: creating {count:,} files in {directory} (no XP for bulk files)"
+
+    @staticmethod
+    def mkfiles_job(job: Job, directory: str, count: int, create_batch) -> int:
+        """Worker side of 'mkfiles': name and fill the files here, create them on the Tk thread in batches"""
+        batch_size = GameOSGUI.MKFILES_BATCH
+        for start in range(0, count, batch_size):
+            end = min(start + batch_size, count)
+            job.apply(create_batch, [(f"{directory}/bulk{job.id}_{i:06d}.txt", f"Bulk file {i} from job {job.id}\n")
+                                     for i in range(start, end)])
+            job.report(end / count, f"{end:,} files")
+        return count
+
+    def submit_job(self, name: str, function, *args, on_done=None) -> Job:
+        """Run function(job, *args) on a worker, draining its messages while jobs are active"""
+        job = self.jobs.submit(name, function, *args, on_done=on_done)
+        if "jobs" not in self.scheduler.tasks:
+            self.scheduler.add("jobs", self.JOB_DRAIN_SECONDS, self.drain_jobs, priority=0,
+                               delay=self.JOB_DRAIN_SECONDS)
+        return job
+
+    def drain_jobs(self):
+        self.jobs.drain()
+        if not self.jobs.active() and self.jobs.messages.empty():
+            self.scheduler.remove("jobs")
+
+    @staticmethod
+    def job_ended_text(job: Job) -> str:
+        if job.state == "failed":
+            return f"❌ Job #{job.id} failed: {job.error}"
+        ended = f"🛑 Job #{job.id} {job.state}"
+        return f"{ended}: {job.detail}" if job.state == "cancelled" and job.detail else ended
+
+    def show_jobs_status(self):
+        self.jobs_var.set(f"🧵 {len(self.jobs.active())}")
+
+    def jobs_panel(self):
+        """Background jobs with their progress; the selected job can be cancelled"""
+        panel = tk.Toplevel(self.root)
+        panel.title("🧵 Jobs")
+        panel.geometry("720x360")
+
+        list_frame = ttk.Frame(panel)
+        list_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        columns = ("ID", "Job", "State", "Progress", "Detail")
+        tree = ttk.Treeview(list_frame, columns=columns, show="headings")
+        for column, width in zip(columns, (50, 250, 110, 80, 200)):
+            tree.heading(column, text=column)
+            tree.column(column, width=width)
+        scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=tree.yview)
+        tree.configure(yscrollcommand=scrollbar.set)
+        tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        rows = TreeviewSync(tree)
+
+        state_icons = {"queued": "⏸️", "running": "▶️", "done": "✅", "failed": "❌", "cancelled": "🛑"}
+
+        def refresh():
+            rows.update([(job.id, (job.id, job.name, f"{state_icons[job.state]} {job.state}",
+                                   f"{job.progress:.0%}", str(job.error) if job.error else job.detail))
+                         for job in reversed(self.jobs.jobs.values())])
+
+        def cancel():
+            for item in tree.selection():
+                job = self.jobs.jobs.get(int(tree.item(item)["values"][0]))
+                if job is not None and job.active:
+                    job.cancel()
+
+        def on_close():
+            self.game_manager.events.unsubscribe(refresh)
+            panel.destroy()
+
+        button_frame = ttk.Frame(panel)
+        button_frame.pack(fill=tk.X, padx=5, pady=5)
+        ttk.Button(button_frame, text="🛑 Cancel Job", command=cancel).pack(side=tk.LEFT)
+        ttk.Button(button_frame, text="Close", command=on_close).pack(side=tk.RIGHT)
+
+        self.game_manager.events.subscribe("jobs", refresh)
+        panel.protocol("WM_DELETE_WINDOW", on_close)
+        refresh()
+
+    def run_page_lab(self, kind: str, length: int, max_frames: int) -> Dict[str, List[int]]:
+        """Run every replacement algorithm on a fresh reference string and credit the mission"""
+        references = PageReplacementLab.reference_string(kind, length)
+        curves = PageReplacementLab(references).run(max_frames)
+        self.game_manager.update_mission_progress("memory_manager")
+        if any(PageReplacementLab.belady_anomalies(curve) for curve in curves.values()):
+            self.game_manager.add_notification("⚠️ Belady's anomaly spotted: more frames, more faults!", "warning")
+        return curves
+
+    def pagelab_command(self, args: List[str]) -> str:
+        """Terminal 'pagelab [kind] [frames]' command"""
+        if np is None:
+            return "❌ pagelab: the page-replacement lab needs NumPy (pip install numpy)"
+
+        kind = args[0] if args else "locality"
+        if kind not in PageReplacementLab.REFERENCE_KINDS:
+            return f"❌ pagelab: {kind}: expected one of {', '.join(PageReplacementLab.REFERENCE_KINDS)}"
+        try:
+            max_frames = max(1, min(int(args[1]), 32)) if len(args) > 1 else 8
+        except ValueError:
+            return f"❌ pagelab: {args[1]}: invalid frame count"
+
+        length = 12 if kind == "belady" else 5000
+        curves = self.run_page_lab(kind, length, max_frames)
+
+        output = f"🧪 Page faults for {length:,} '{kind}' references\n"
+        output += f"{'ALGORITHM':<14}" + "".join(f"{frames:>7}" for frames in range(1, max_frames + 1)) + "\n"
+        for name, curve in curves.items():
+            output += f"{name:<14}" + "".join(f"{faults:>7}" for faults in curve) + "\n"
+            for frames in PageReplacementLab.belady_anomalies(curve):
+                output += f"  ⚠️ Belady's anomaly: {frames} → {frames + 1} frames raises faults {curve[frames - 1]} → {curve[frames]}\n"
+        return output.rstrip("\n")
 
     def create_status_bar(self):
         """Gaming status bar"""
@@ -2146,6 +6784,12 @@ Total XP: {self.game_manager.stats.total_xp:,}"""
         # Notifications
         self.notification_var = tk.StringVar(value="🎮 Ready to play!")
         ttk.Label(self.status_frame, textvariable=self.notification_var).pack(side=tk.LEFT, padx=20)
+        self.unread_var = tk.StringVar(value="🔔 0")
+        ttk.Button(self.status_frame, textvariable=self.unread_var, width=6,
+                   command=self.notification_panel).pack(side=tk.LEFT)
+        self.jobs_var = tk.StringVar(value="🧵 0")
+        ttk.Button(self.status_frame, textvariable=self.jobs_var, width=6,
+                   command=self.jobs_panel).pack(side=tk.LEFT, padx=5)
 
         # Clock
         self.clock_var = tk.StringVar()
@@ -2155,49 +6799,129 @@ Total XP: {self.game_manager.stats.total_xp:,}"""
     def update_clock(self):
         """Update clock"""
         self.clock_var.set(datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
-        self.root.after(1000, self.update_clock)
 
     def update_game_timer(self):
         """Update game playtime"""
         playtime = datetime.now() - self.game_timer_start
         self.playtime_var.set(f"Playtime: {str(playtime).split('.')[0]}")
-        self.root.after(1000, self.update_game_timer)
 
     def show_notifications(self):
-        """Show recent notifications"""
-        if self.game_manager.notifications:
-            recent = self.game_manager.notifications[-1]
-            self.notification_var.set(recent["message"][:50] + "...")
-        self.root.after(5000, self.show_notifications)
-
-    def update_displays(self):
-        """Update all displays"""
-        self.refresh_processes()
-        self.update_dashboard()
-        self.update_missions_display()
-        self.update_xp_display()
-
-        # Check time-based achievements
-        self.game_manager.check_achievement("night_owl")
-        self.game_manager.check_achievement("early_bird")
+        """Show the newest notification and the unread count in the status bar"""
+        center = self.game_manager.notifications
+        recent = center.latest()
+        if recent is not None:
+            message = recent["message"]
+            if len(message) > 80:
+                message = message[:79] + "…"
+            self.notification_var.set(message)
+        self.unread_var.set(f"🔔 {center.unread()}")
+
+    def notification_panel(self):
+        """Scrollable notification history with a severity filter"""
+        center = self.game_manager.notifications
+        panel = tk.Toplevel(self.root)
+        panel.title("🔔 Notifications")
+        panel.geometry("640x420")
+
+        filter_frame = ttk.Frame(panel, padding=5)
+        filter_frame.pack(fill=tk.X)
+        ttk.Label(filter_frame, text="Show at least:").pack(side=tk.LEFT)
+        severity_var = tk.StringVar(value="info")
+        severity_box = ttk.Combobox(filter_frame, textvariable=severity_var, state="readonly",
+                                    values=NotificationCenter.SEVERITIES, width=8)
+        severity_box.pack(side=tk.LEFT, padx=5)
+
+        list_frame = ttk.Frame(panel)
+        list_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        columns = ("Time", "Message")
+        tree = ttk.Treeview(list_frame, columns=columns, show="headings")
+        tree.heading("Time", text="Time")
+        tree.heading("Message", text="Message")
+        tree.column("Time", width=80, stretch=False)
+        tree.column("Message", width=520)
+        scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=tree.yview)
+        tree.configure(yscrollcommand=scrollbar.set)
+        tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
-        self.root.after(5000, self.update_displays)
+        shown = {"last": 0}
+
+        def insert(notification, index):
+            severity = notification["type"]
+            tree.insert("", index, values=(notification["time"].strftime("%H:%M:%S"),
+                                           f"{NotificationCenter.ICONS[severity]} {notification['message']}"))
+
+        def rebuild(event=None):
+            tree.delete(*tree.get_children())
+            for notification in center.history(severity_var.get()):
+                insert(notification, tk.END)
+            latest = center.latest()
+            shown["last"] = latest["id"] if latest is not None else 0
+            center.mark_read()
+            self.show_notifications()
+
+        def on_new():
+            """Prepend only what was posted since the last render"""
+            floor = NotificationCenter.SEVERITIES.index(severity_var.get())
+            for notification in center.since(shown["last"]):
+                if NotificationCenter.SEVERITIES.index(notification["type"]) >= floor:
+                    insert(notification, 0)
+                shown["last"] = notification["id"]
+            center.mark_read()
+            self.show_notifications()
+
+        def on_close():
+            self.game_manager.events.unsubscribe(on_new)
+            panel.destroy()
+
+        severity_box.bind("<<ComboboxSelected>>", rebuild)
+        self.game_manager.events.subscribe("notifications", on_new)
+        panel.protocol("WM_DELETE_WINDOW", on_close)
+        rebuild()
+
+    def render_frame(self):
+        """Re-render the widgets whose data changed since the last frame"""
+        self.game_manager.events.flush()
+
+    def tick_kernel(self):
+        """Advance the simulated kernel; widgets follow through the event bus"""
+        self.kernel.scheduler.run(10)
+        self.kernel.memory_manager.check_pressure()
+        if self.kernel.disk is not None:
+            self.kernel.disk.dispatch()
+
+        # Check time-based achievements and let rate missions decay
+        self.game_manager.set_counter("hour", datetime.now().hour)
+        self.game_manager.update_rate_missions()
 
     def generate_new_missions(self):
         """Generate new daily missions"""
-        self.game_manager._generate_daily_missions()
-        self.update_missions_display()
+        self.game_manager.reroll_missions()
         self.game_manager.add_notification("🎯 New daily missions generated!")
 
+    @staticmethod
+    def seconds_to_midnight() -> float:
+        """Seconds until just past the next local midnight"""
+        now = datetime.now()
+        midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+        # A second past midnight, so a timer that fires a little early still lands on the new day
+        return (midnight - now).total_seconds() + 1
+
+    def roll_over_day(self):
+        """Start the next day's missions and streak at local midnight"""
+        if self.game_manager.start_day(date.today()):
+            self.game_manager.add_notification(
+                f"🌅 A new day: fresh daily missions! Login streak: {self.game_manager.stats.login_streak} days", "info")
+        self.scheduler.reschedule("day", self.seconds_to_midnight())  # Days are not always 24 hours long
+
     def play_game(self, game_id):
         """Play mini-games"""
-        self.game_manager.stats.games_played += 1
-        leveled_up = self.game_manager.stats.add_xp(50)
+        leveled_up = self.game_manager.award("game", 50)
 
         if leveled_up:
             self.game_manager.add_notification(f"🎉 LEVEL UP! Now Level {self.game_manager.stats.level}!")
 
-        self.game_manager.check_achievement("gamer")
+        self.game_manager.bump("games_played")
 
         if game_id == "snake":
             self.play_snake()
@@ -2206,9 +6930,11 @@ Total XP: {self.game_manager.stats.total_xp:,}"""
         elif game_id == "speed":
             self.speed_challenge()
         elif game_id == "memory":
-            self.memory_game()
-
-        self.update_xp_display()
+            self.page_replacement_lab()
+        elif game_id == "buffer":
+            self.play_producer_consumer()
+        elif game_id == "disk":
+            self.disk_scheduling_view()
 
     def play_snake(self):
         """Snake game placeholder"""
@@ -2225,42 +6951,395 @@ Total XP: {self.game_manager.stats.total_xp:,}"""
                            "Solve programming and system administration puzzles.")
 
     def speed_challenge(self):
-        """Speed challenge mini-game"""
+        """Speed challenge mini-game: a timed task run against your personal-best ghost"""
+        challenge = self.challenge
         challenge_window = tk.Toplevel(self.root)
         challenge_window.title("⚡ Speed Challenge")
-        challenge_window.geometry("400x300")
+        challenge_window.geometry("560x600")
 
         tk.Label(challenge_window, text="⚡ Speed Challenge", 
-                font=('Arial', 16, 'bold')).pack(pady=20)
+                font=('Arial', 16, 'bold')).pack(pady=10)
+        tk.Label(challenge_window,
+                 text=f"Quick! Complete these tasks as fast as possible.\n"
+                      f"Bonus XP for finishing under {SpeedChallenge.PAR_SECONDS} seconds!",
+                 font=('Arial', 10)).pack()
+
+        timer_var = tk.StringVar(value="0.00s")
+        tk.Label(challenge_window, textvariable=timer_var, font=('Courier', 20, 'bold')).pack(pady=5)
+
+        task_tree = ttk.Treeview(challenge_window, columns=("task", "progress", "split", "ghost"),
+                                 show="headings", height=len(SpeedChallenge.TASKS))
+        for column, heading, width in (("task", "Task", 260), ("progress", "Done", 60),
+                                       ("split", "Split", 80), ("ghost", "vs Best", 80)):
+            task_tree.heading(column, text=heading)
+            task_tree.column(column, width=width, anchor=tk.W if column == "task" else tk.E)
+        task_tree.pack(fill=tk.X, padx=10, pady=5)
+        for task_id, label, _, _, count in SpeedChallenge.TASKS:
+            task_tree.insert("", tk.END, iid=task_id, values=(label, f"0/{count}", "", ""))
+
+        tk.Label(challenge_window, text="🏆 Personal Bests", font=('Arial', 12, 'bold')).pack(pady=(10, 0))
+        best_tree = ttk.Treeview(challenge_window, columns=("place", "time", "date"),
+                                 show="headings", height=SpeedChallenge.KEEP)
+        for column, heading, width in (("place", "#", 40), ("time", "Time", 100), ("date", "Date", 200)):
+            best_tree.heading(column, text=heading)
+            best_tree.column(column, width=width)
+        best_tree.pack(fill=tk.X, padx=10, pady=5)
+
+        def show_tasks():
+            ghost = challenge.ghost
+            for task_id, _, _, _, count in SpeedChallenge.TASKS:
+                split = challenge.splits.get(task_id)
+                best = ghost.get(task_id)
+                if split is not None and best is not None:
+                    versus = f"{split - best:+.2f}s"
+                else:
+                    versus = f"{best:.2f}s" if best is not None else ""
+                task_tree.set(task_id, "progress", f"{challenge.progress.get(task_id, 0)}/{count}")
+                task_tree.set(task_id, "split", f"{split:.2f}s" if split is not None else "")
+                task_tree.set(task_id, "ghost", versus)
+
+        def show_bests():
+            best_tree.delete(*best_tree.get_children())
+            for place, run in enumerate(challenge.runs, 1):
+                best_tree.insert("", tk.END, values=(place, f"{run['time']:.2f}s", run["date"].replace("T", " ")))
+
+        def tick():
+            if not challenge_window.winfo_exists():
+                return
+            timer_var.set(f"{challenge.elapsed():.2f}s")
+            show_tasks()
+            if challenge.finished:
+                self.finish_speed_challenge()
+                show_bests()
+                start_button.config(state=tk.NORMAL)
+            elif challenge.running:
+                challenge_window.after(100, tick)
 
-        challenge_text = """Quick! Complete these tasks as fast as possible:
+        def start_challenge():
+            challenge.start()
+            start_button.config(state=tk.DISABLED)
+            self.game_manager.add_notification("⚡ Speed Challenge started! Go fast!")
+            tick()
 
-1. Create a file named 'speed_test.txt'
-2. Create a folder named 'fast_folder'  
-3. Create a process named 'speedrun'
-4. Navigate to /tmp directory
-5. Execute 5 terminal commands
+        def close():
+            if challenge.running:
+                challenge.stop()
+                self.game_manager.add_notification("⚡ Speed Challenge abandoned", "info")
+            challenge_window.destroy()
 
-Timer starts when you close this window!
-Bonus XP for completing under 1 minute!"""
+        button_frame = tk.Frame(challenge_window)
+        button_frame.pack(pady=10)
+        start_button = tk.Button(button_frame, text="🚀 Start Challenge!", 
+                                 command=start_challenge, font=('Arial', 12, 'bold'))
+        start_button.pack(side=tk.LEFT, padx=5)
+        tk.Button(button_frame, text="🏳️ Close", command=close, font=('Arial', 12)).pack(side=tk.LEFT, padx=5)
+        challenge_window.protocol("WM_DELETE_WINDOW", close)
+
+        show_tasks()
+        show_bests()
+
+    def finish_speed_challenge(self):
+        """Score a finished speed challenge, record it and post it to the leaderboard"""
+        challenge = self.challenge
+        elapsed = challenge.elapsed()
+        personal_best = not challenge.runs or elapsed < challenge.runs[0]["time"]
+        place = challenge.record()
+        challenge.stop()
+
+        xp = 100 if elapsed < SpeedChallenge.PAR_SECONDS else 25
+        if personal_best:
+            xp += 50
+        leveled_up = self.game_manager.award("game", xp)
+        if personal_best:
+            self.game_manager.add_notification(f"⚡ New personal best: {elapsed:.2f}s! (+{xp} XP)")
+        elif place is not None:
+            self.game_manager.add_notification(f"⚡ Speed Challenge done in {elapsed:.2f}s, #{place} on your table (+{xp} XP)")
+        else:
+            self.game_manager.add_notification(f"⚡ Speed Challenge done in {elapsed:.2f}s (+{xp} XP)", "info")
+        if leveled_up:
+            self.game_manager.add_notification(f"🎉 LEVEL UP! Now Level {self.game_manager.stats.level}!")
+        self.update_profile()
 
-        tk.Label(challenge_window, text=challenge_text, 
-                font=('Arial', 10), justify=tk.LEFT).pack(pady=10, padx=20)
+    def disk_scheduling_view(self):
+        """Disk-scheduling comparison: arm paths for one batch and totals for a long run"""
+        disk = self.kernel.disk
+        if disk is None:
+            messagebox.showerror("💿 Disk Scheduling", "The disk simulator needs NumPy (pip install numpy)")
+            return
 
-        def start_challenge():
-            self.challenge_start_time = datetime.now()
-            challenge_window.destroy()
-            self.game_manager.add_notification("⚡ Speed Challenge started! Go fast!")
+        view = tk.Toplevel(self.root)
+        view.title("💿 Disk Scheduling")
+        view.geometry("780x680")
+
+        tk.Label(view, text="💿 Disk Arm Scheduling", font=('Arial', 16, 'bold')).pack(pady=10)
+
+        # Settings
+        settings_frame = ttk.LabelFrame(view, text="⚙️ Setup", padding=10)
+        settings_frame.pack(fill=tk.X, padx=10, pady=5)
+
+        algorithm_var = tk.StringVar(value=disk.algorithm)
+        requests_var = tk.IntVar(value=1_000_000)
+        depth_var = tk.IntVar(value=disk.queue_depth)
+
+        ttk.Label(settings_frame, text="File system uses:").grid(row=0, column=0, sticky='w')
+        algorithm_box = ttk.Combobox(settings_frame, textvariable=algorithm_var, state="readonly",
+                                     values=Disk.ALGORITHMS, width=8)
+        algorithm_box.grid(row=0, column=1, sticky='w', padx=5)
+        ttk.Label(settings_frame, text="Requests:").grid(row=0, column=2, sticky='w')
+        ttk.Spinbox(settings_frame, from_=1000, to=10_000_000, increment=100_000, width=10,
+                    textvariable=requests_var).grid(row=0, column=3, sticky='w', padx=5)
+        ttk.Label(settings_frame, text="Queue depth:").grid(row=0, column=4, sticky='w')
+        ttk.Spinbox(settings_frame, from_=1, to=4096, width=6, textvariable=depth_var).grid(row=0, column=5, sticky='w', padx=5)
+
+        path_canvas = tk.Canvas(view, height=380, bg='#1a1a2e')
+        path_canvas.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+
+        results_var = tk.StringVar(value="Press Compare to race the schedulers")
+        tk.Label(view, textvariable=results_var, font=('Courier', 10), justify=tk.LEFT).pack(pady=5)
+
+        def draw_paths(batch, head):
+            """One lane per algorithm: the arm's path across the cylinders"""
+            path_canvas.delete("all")
+            width = max(path_canvas.winfo_width(), 600)
+            height = max(path_canvas.winfo_height(), 300)
+            lane = height / len(Disk.ALGORITHMS)
+            left, right = 90, width - 20
+            scale = (right - left) / (disk.cylinders - 1)
+
+            for row, name in enumerate(Disk.ALGORITHMS):
+                path = Disk.seek_path(batch, head, name, disk.cylinders, disk.direction).tolist()
+                seek = sum(abs(b - a) for a, b in zip(path, path[1:]))
+                top = row * lane + 8
+                step = (lane - 16) / max(len(path) - 1, 1)
+                coords = [c for i, cylinder in enumerate(path) for c in (left + cylinder * scale, top + i * step)]
+                path_canvas.create_text(5, top + lane / 2 - 8, text=f"{name}\n{seek:,}", fill='white', anchor='w')
+                path_canvas.create_line(left, top + lane - 10, right, top + lane - 10, fill='#757575')
+                path_canvas.create_line(*coords, fill='#00ff7f', width=2)
+                for cylinder in batch:
+                    x = left + cylinder * scale
+                    path_canvas.create_oval(x - 2, top + lane - 12, x + 2, top + lane - 8, fill='#FF9800', outline='')
+
+        def compare():
+            try:
+                count = max(1000, min(requests_var.get(), 10_000_000))
+                depth = max(1, min(depth_var.get(), 4096))
+            except tk.TclError:
+                results_var.set("❌ Enter whole numbers for requests and queue depth")
+                return
+
+            # Paths for the requests the file system has queued, or a fresh sample
+            batch = disk.queue[:24] or Disk.request_stream(16, disk.cylinders).tolist()
+            draw_paths(batch, disk.head)
+
+            requests = Disk.request_stream(count, disk.cylinders)
+            start = time.perf_counter()
+            totals = Disk.compare(requests, disk.cylinders, disk.head, depth)
+            elapsed = time.perf_counter() - start
+            best = min(totals, key=totals.get)
+            lines = [f"{name:<7} {seek:>14,} cylinders  ({seek / count:6.1f}/request){'  🏆' if name == best else ''}"
+                     for name, seek in totals.items()]
+            results_var.set(f"{count:,} requests at queue depth {depth}, compared in {elapsed:.2f}s\n" + "\n".join(lines))
+
+        def on_algorithm_change(event=None):
+            disk.dispatch()  # Finish the batch under the old algorithm
+            disk.algorithm = algorithm_var.get()
+            self.game_manager.add_notification(f"💿 Disk scheduler: {disk.algorithm}")
+
+        algorithm_box.bind("<<ComboboxSelected>>", on_algorithm_change)
+        ttk.Button(settings_frame, text="▶️ Compare", command=compare).grid(row=0, column=6, padx=10)
+
+    def page_replacement_lab(self):
+        """Page-replacement lab: fault-versus-frames curves for every algorithm"""
+        if np is None:
+            messagebox.showerror("🧪 Page Lab", "The page-replacement lab needs NumPy (pip install numpy)")
+            return
+
+        lab_window = tk.Toplevel(self.root)
+        lab_window.title("🧪 Page Replacement Lab")
+        lab_window.geometry("760x600")
+
+        tk.Label(lab_window, text="🧪 Page Replacement Showdown",
+                font=('Arial', 16, 'bold')).pack(pady=10)
+
+        # Lab settings
+        settings_frame = ttk.LabelFrame(lab_window, text="⚙️ Reference String", padding=10)
+        settings_frame.pack(fill=tk.X, padx=10, pady=5)
+
+        kind_var = tk.StringVar(value="locality")
+        length_var = tk.IntVar(value=5000)
+        frames_var = tk.IntVar(value=12)
+
+        ttk.Label(settings_frame, text="Pattern:").grid(row=0, column=0, sticky='w')
+        ttk.Combobox(settings_frame, textvariable=kind_var, state="readonly",
+                     values=PageReplacementLab.REFERENCE_KINDS, width=10).grid(row=0, column=1, sticky='w', padx=5)
+        ttk.Label(settings_frame, text="References:").grid(row=0, column=2, sticky='w')
+        ttk.Spinbox(settings_frame, from_=12, to=100000, increment=1000, width=8,
+                    textvariable=length_var).grid(row=0, column=3, sticky='w', padx=5)
+        ttk.Label(settings_frame, text="Max frames:").grid(row=0, column=4, sticky='w')
+        ttk.Spinbox(settings_frame, from_=2, to=32, width=5, textvariable=frames_var).grid(row=0, column=5, sticky='w', padx=5)
+
+        plot_canvas = tk.Canvas(lab_window, height=380, bg='#1a1a2e')
+        plot_canvas.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+
+        anomaly_var = tk.StringVar(value="Pick a pattern and press Run")
+        tk.Label(lab_window, textvariable=anomaly_var, font=('Courier', 10), justify=tk.LEFT).pack(pady=5)
+
+        colors = {
+            "FIFO": '#FF9800', "LRU": '#2196F3', "Clock": '#4CAF50', "Second-Chance": '#8BC34A',
+            "LFU": '#9C27B0', "Working-Set": '#00BCD4', "OPT": '#FFFFFF',
+        }
+
+        def draw(curves):
+            plot_canvas.delete("all")
+            width = max(plot_canvas.winfo_width(), 600)
+            height = max(plot_canvas.winfo_height(), 300)
+            left, right, top, bottom = 60, width - 130, 20, height - 40
+            max_frames = len(next(iter(curves.values())))
+            peak = max(max(curve) for curve in curves.values()) or 1
+
+            def point(frames, faults):
+                x = left + (frames - 1) * (right - left) / max(max_frames - 1, 1)
+                return x, bottom - faults * (bottom - top) / peak
+
+            plot_canvas.create_line(left, bottom, right, bottom, fill='white')
+            plot_canvas.create_line(left, bottom, left, top, fill='white')
+            plot_canvas.create_text(left - 5, top, text=str(peak), fill='white', anchor='e')
+            plot_canvas.create_text(left - 5, bottom, text="0", fill='white', anchor='e')
+            plot_canvas.create_text((left + right) / 2, bottom + 25, text="Frames", fill='white')
+            for frames in range(1, max_frames + 1):
+                x, _ = point(frames, 0)
+                plot_canvas.create_text(x, bottom + 10, text=str(frames), fill='white', font=('Arial', 8))
+
+            for row, (name, curve) in enumerate(curves.items()):
+                color = colors[name]
+                coords = [c for frames, faults in enumerate(curve, start=1) for c in point(frames, faults)]
+                if len(coords) >= 4:
+                    plot_canvas.create_line(*coords, fill=color, width=2)
+                for frames in PageReplacementLab.belady_anomalies(curve):
+                    x, y = point(frames + 1, curve[frames])
+                    plot_canvas.create_oval(x - 6, y - 6, x + 6, y + 6, outline='#F44336', width=2)
+                plot_canvas.create_line(right + 15, top + row * 20, right + 35, top + row * 20, fill=color, width=2)
+                plot_canvas.create_text(right + 40, top + row * 20, text=name, fill=color, anchor='w')
+
+        def run():
+            kind = kind_var.get()
+            try:
+                length = max(12, min(length_var.get(), 100000))
+                max_frames = max(2, min(frames_var.get(), 32))
+            except tk.TclError:
+                anomaly_var.set("❌ Enter whole numbers for references and frames")
+                return
+
+            curves = self.run_page_lab(kind, length, max_frames)
+            draw(curves)
+
+            anomalies = [f"⚠️ {name}: {frames} → {frames + 1} frames, {curve[frames - 1]} → {curve[frames]} faults"
+                         for name, curve in curves.items()
+                         for frames in PageReplacementLab.belady_anomalies(curve)]
+            best = min((name for name in curves if name != "OPT"), key=lambda name: sum(curves[name]))
+            summary = f"🏆 Closest to OPT: {best}"
+            if anomalies:
+                summary += "\n🔴 Belady's anomaly (circled):\n" + "\n".join(anomalies[:4])
+            anomaly_var.set(summary)
+
+        ttk.Button(settings_frame, text="▶️ Run", command=run).grid(row=0, column=6, padx=10)
+
+    def play_producer_consumer(self):
+        """Producer-consumer mini-game on the simulated scheduler"""
+        game_window = tk.Toplevel(self.root)
+        game_window.title("🏭 Producer-Consumer")
+        game_window.geometry("520x460")
+
+        tk.Label(game_window, text="🏭 Bounded Buffer Challenge",
+                font=('Arial', 16, 'bold')).pack(pady=10)
+        tk.Label(game_window, text="Keep items flowing for 300 ticks without deadlocking!\n"
+                                   "+10 points per item consumed, +250 for a deadlock-free run",
+                font=('Arial', 10)).pack()
+
+        # Game settings
+        settings_frame = ttk.LabelFrame(game_window, text="⚙️ Setup", padding=10)
+        settings_frame.pack(fill=tk.X, padx=10, pady=5)
+
+        buffer_var = tk.IntVar(value=5)
+        producers_var = tk.IntVar(value=2)
+        consumers_var = tk.IntVar(value=2)
+        strategy_var = tk.StringVar(value=ProducerConsumerGame.STRATEGIES[0])
+
+        for row, (label, var) in enumerate([("Buffer slots:", buffer_var),
+                                            ("Producers:", producers_var),
+                                            ("Consumers:", consumers_var)]):
+            ttk.Label(settings_frame, text=label).grid(row=row, column=0, sticky='w')
+            ttk.Spinbox(settings_frame, from_=1, to=10, width=5, textvariable=var).grid(row=row, column=1, sticky='w')
+
+        ttk.Label(settings_frame, text="Strategy:").grid(row=3, column=0, sticky='w')
+        ttk.Combobox(settings_frame, textvariable=strategy_var, state="readonly",
+                     values=ProducerConsumerGame.STRATEGIES, width=12).grid(row=3, column=1, sticky='w')
+
+        # Buffer view
+        buffer_canvas = tk.Canvas(game_window, height=60, bg='#1a1a2e')
+        buffer_canvas.pack(fill=tk.X, padx=10, pady=5)
+
+        status_var = tk.StringVar(value="Press Start to spawn the processes")
+        tk.Label(game_window, textvariable=status_var, font=('Courier', 10), justify=tk.LEFT).pack(pady=5)
+
+        state = {"game": None}
+        round_ticks = 300
+
+        def draw():
+            game = state["game"]
+            buffer_canvas.delete("all")
+            width = max(buffer_canvas.winfo_width(), 400)
+            slot_width = (width - 20) / game.buffer_size
+            for i in range(game.buffer_size):
+                x = 10 + i * slot_width
+                color = '#00ff7f' if i < len(game.buffer) else '#757575'
+                buffer_canvas.create_rectangle(x + 2, 10, x + slot_width - 2, 50, fill=color, outline='white')
+            status_var.set(f"Tick: {game.elapsed}/{round_ticks}   Produced: {game.produced}   "
+                           f"Consumed: {game.consumed}\nMutex contentions: {game.mutex.contentions}")
+
+        def advance():
+            game = state["game"]
+            if game is None or not game_window.winfo_exists():
+                return
+            game.step(3)
+            draw()
+            if game.running and game.elapsed < round_ticks:
+                game_window.after(100, advance)
+            else:
+                finish()
+
+        def finish():
+            result = state["game"].stop()
+            state["game"] = None
+            xp = result["score"] // 10
+            leveled_up = self.game_manager.award("game", xp)
+
+            message = f"🏭 Producer-Consumer: {result['consumed']} items, score {result['score']} (+{xp} XP)"
+            if result["deadlocked"]:
+                message = f"💀 Deadlock after {result['ticks']} ticks! Score {result['score']} (+{xp} XP)"
+            if leveled_up:
+                message += f" 🎉 LEVEL UP! Now Level {self.game_manager.stats.level}!"
 
-        tk.Button(challenge_window, text="🚀 Start Challenge!", 
-                 command=start_challenge, font=('Arial', 12, 'bold')).pack(pady=20)
+            self.game_manager.add_notification(message)
+            status_var.set(message)
+            start_button.config(state=tk.NORMAL)
 
-    def memory_game(self):
-        """Memory game placeholder"""
-        messagebox.showinfo("🎯 Memory Game", 
-                           "🎯 Memory Game (+50 XP earned!)\n\n" +
-                           "Coming Soon: Memory challenges!\n" +
-                           "Test your memory with system administration scenarios.")
+        def start():
+            game = ProducerConsumerGame(self.kernel, buffer_var.get(), producers_var.get(),
+                                        consumers_var.get(), strategy_var.get())
+            game.start()
+            state["game"] = game
+            start_button.config(state=tk.DISABLED)
+            advance()
+
+        def on_close():
+            if state["game"] is not None:
+                state["game"].stop()
+            game_window.destroy()
+
+        start_button = tk.Button(game_window, text="🚀 Start", command=start, font=('Arial', 12, 'bold'))
+        start_button.pack(pady=10)
+        game_window.protocol("WM_DELETE_WINDOW", on_close)
 
     def show_game_help(self):
         """Show game help"""
@@ -2357,6 +7436,7 @@ Become the ultimate System Administrator by learning OS concepts through gaming!
 
         # Calculate session time
         session_time = datetime.now() - self.game_timer_start
+        breakdown = self.game_manager.activity.breakdown()
 
         detailed_stats = f"""📊 DETAILED GAME STATISTICS
 
@@ -2369,13 +7449,13 @@ Login Streak: {self.game_manager.stats.login_streak} days
 
 🏆 Achievements:
 ═══════════════════
-Unlocked: {self.game_manager.stats.achievements_unlocked}/20
-Completion: {(self.game_manager.stats.achievements_unlocked/20)*100:.1f}%
+Unlocked: {self.game_manager.stats.achievements_unlocked}/{len(self.game_manager.achievements)}
+Completion: {(self.game_manager.stats.achievements_unlocked/len(self.game_manager.achievements))*100:.1f}%
 
 🎯 Mission Progress:
 ═══════════════════
 Total Completed: {self.game_manager.stats.missions_completed}
-Active Missions: {len([m for m in self.game_manager.active_missions if not m.completed])}/3
+Active Missions: {len([m for m in self.game_manager.active_missions if not m.completed])}/{GameManager.DAILY_MISSIONS}
 
 📁 File System Activity:
 ═══════════════════
@@ -2392,20 +7472,14 @@ Processes Killed: {self.game_manager.stats.processes_killed}
 💻 Terminal Usage:
 ═══════════════════
 Commands Executed: {self.game_manager.stats.commands_executed}
-Terminal XP Earned: {self.game_manager.stats.commands_executed * 5:,}
+Terminal XP Earned: {breakdown.get('command', {}).get('xp', 0):,} (this session)
 
 🎮 Gaming Activity:
 ═══════════════════
 Mini-Games Played: {self.game_manager.stats.games_played}
-Gaming XP Earned: {self.game_manager.stats.games_played * 50:,}
+Gaming XP Earned: {breakdown.get('game', {}).get('xp', 0):,} (this session)
 
-📈 Progress Breakdown:
-═══════════════════
-File XP: {self.game_manager.stats.files_created * 10:,}
-Folder XP: {self.game_manager.stats.directories_created * 25:,}
-Process XP: {self.game_manager.stats.processes_created * 30:,}
-Terminal XP: {self.game_manager.stats.commands_executed * 5:,}
-Gaming XP: {self.game_manager.stats.games_played * 50:,}
+{self.activity_report(breakdown)}
 
 Next Level Progress:
 Level {self.game_manager.stats.level} → {self.game_manager.stats.level + 1}
@@ -2416,6 +7490,30 @@ XP Needed: {int(self.game_manager.get_level_progress()['needed_xp'] - self.game_
 
         ttk.Button(stats_window, text="Close", command=stats_window.destroy).pack(pady=5)
 
+    def activity_report(self, breakdown: Dict) -> str:
+        """XP breakdown, hour-of-day histogram and XP trend from the activity log"""
+        activity = self.game_manager.activity
+        total = sum(entry["xp"] for entry in breakdown.values()) or 1
+        lines = ["📈 XP Breakdown (this session):", "═══════════════════"]
+        for action, entry in sorted(breakdown.items(), key=lambda item: -item[1]["xp"]):
+            lines.append(f"{ActivityLog.LABELS[action]:<24} {entry['xp']:>8,} XP "
+                         f"{entry['xp'] / total * 100:5.1f}%  ({entry['events']:,} events)")
+        if not breakdown:
+            lines.append("No activity yet - go earn some XP!")
+
+        hourly = activity.hourly()
+        peak = max(hourly) or 1
+        lines += ["", "🕐 Activity by Hour:", "═══════════════════"]
+        for hour in range(24):
+            if hourly[hour]:
+                lines.append(f"{hour:02d}:00 {'█' * max(1, hourly[hour] * 20 // peak):<20} {hourly[hour]:,}")
+
+        trend = activity.trend()
+        top = max(trend) or 1
+        spark = "".join("▁▂▃▄▅▆▇█"[value * 7 // top] for value in trend)
+        lines += ["", "📉 XP Trend (last 12 hours):", "═══════════════════", f"{spark}  {sum(trend):,} XP"]
+        return "\n".join(lines)
+
     def show_about(self):
         """Show about dialog"""
         about_text = f"""🎮 PyOS GameOS - Gamified Operating System Simulator
@@ -2443,7 +7541,7 @@ Version 1.0 Gaming Edition
 🏆 Your Progress:
 • Current Level: {self.game_manager.stats.level}
 • Total XP: {self.game_manager.stats.total_xp:,}
-• Achievements: {self.game_manager.stats.achievements_unlocked}/20
+• Achievements: {self.game_manager.stats.achievements_unlocked}/{len(self.game_manager.achievements)}
 • Playtime: {str(datetime.now() - self.game_timer_start).split('.')[0]}
 
 Built with Python & Tkinter
@@ -2473,11 +7571,357 @@ Built with Python & Tkinter
             import traceback
             traceback.print_exc()
         finally:
-            # Save game progress (in real app)
-            print("\n💾 Game progress saved")
+            self.jobs.shutdown()
+            self.save_game.close()
+            self.profiles.close()
+            self.leaderboard.close()
+            if self.leaderboard_server is not None:
+                self.leaderboard_server.stop()
+            if self.save_game.error:
+                print(f"\n❌ Could not save game progress: {self.save_game.error}")
+            else:
+                print(f"\n💾 Game progress saved to {self.save_game.directory}")
             print("👋 Thanks for playing PyOS GameOS!")
 
+def benchmark_producer_consumer(ticks: int = 200000):
+    """Headless benchmark of the producer-consumer game on the virtual clock"""
+    print(f"🏭 Producer-consumer benchmark ({ticks:,} ticks per strategy)")
+    for strategy in ProducerConsumerGame.STRATEGIES:
+        kernel = GameKernel()
+        game = ProducerConsumerGame(kernel, strategy=strategy, seed=42)
+        start = time.perf_counter()
+        result = game.run(ticks)
+        elapsed = time.perf_counter() - start
+        print(f"  {strategy:<11} consumed={result['consumed']:<7} throughput={result['throughput']:.4f}/tick "
+              f"deadlocked={result['deadlocked']!s:<5} score={result['score']:<7} "
+              f"{result['ticks'] / elapsed:,.0f} ticks/s")
+
+def _allocation_trace(ops: int, arena: int, seed: int = 7) -> List[tuple]:
+    """Synthetic alloc/free trace that keeps roughly 70% of the arena live"""
+    rng = random.Random(seed)
+    trace, live, live_size, next_id = [], [], 0, 0
+    for _ in range(ops):
+        if live and (live_size > arena * 0.7 or rng.random() < 0.45):
+            block_id, size = live.pop(rng.randrange(len(live)))
+            live_size -= size
+            trace.append(("free", block_id, size))
+        else:
+            size = min(int(rng.expovariate(1 / 48)) + 1, arena // 8)
+            live.append((next_id, size))
+            live_size += size
+            trace.append(("alloc", next_id, size))
+            next_id += 1
+    return trace
+
+def benchmark_allocators(ops: int = 200000):
+    """Compare allocation latency and fragmentation of every engine on one trace"""
+    arena = 8192
+    trace = _allocation_trace(ops, arena)
+    print(f"💾 Allocator benchmark ({ops:,} operations, {arena} KB arena)")
+    print(f"  {'engine':<11} {'ns/op':>7} {'failed':>7} {'internal':>9} {'external':>9}")
+
+    engines = [(policy, lambda p=policy: ContiguousAllocator(arena, p)) for policy in ContiguousAllocator.POLICIES]
+    engines.append(("buddy", lambda: BuddyAllocator(arena)))
+    for name, make in engines:
+        allocator = make()
+        addresses = {}
+        internal = external = samples = 0
+        start = time.perf_counter()
+        for i, (op, block_id, size) in enumerate(trace):
+            if op == "alloc":
+                address = allocator.allocate(size, block_id)
+                if address is not None:
+                    addresses[block_id] = address
+            elif block_id in addresses:
+                allocator.free(addresses.pop(block_id))
+            if i % 64 == 0:
+                internal += allocator.internal_fragmentation()
+                external += allocator.fragmentation()
+                samples += 1
+        elapsed = time.perf_counter() - start
+        print(f"  {name:<11} {elapsed / len(trace) * 1e9:>7,.0f} {allocator.failed_allocations:>7,} "
+              f"{internal / samples:>8.1%} {external / samples:>9.1%}")
+
+    # Fixed-size kernel objects: slab cache versus rounding each object up to a 1 KB block
+    objects = ops // 4
+    for name, use_slab in (("slab", True), ("raw 1 KB", False)):
+        backing = ContiguousAllocator(arena)
+        cache = SlabCache("inode", 256, backing)
+        rng = random.Random(11)
+        live = []
+        start = time.perf_counter()
+        for _ in range(objects):
+            if live and rng.random() < 0.45:
+                handle = live.pop(rng.randrange(len(live)))
+                if use_slab:
+                    cache.free(handle)
+                else:
+                    backing.free(handle)
+            else:
+                handle = cache.alloc() if use_slab else backing.allocate(1)
+                if handle is not None:
+                    live.append(handle)
+        elapsed = time.perf_counter() - start
+        wasted = 1 - len(live) * 256 / (backing.used * 1024) if backing.used else 0.0
+        print(f"  {name:<11} {elapsed / objects * 1e9:>7,.0f} {'':>7} {wasted:>8.1%} {backing.fragmentation():>9.1%}"
+              f"  ({len(live):,} inode objects)")
+
+def benchmark_disk(requests: int = 1_000_000):
+    """Seek distance and evaluation speed of every disk scheduler on one stream"""
+    cylinders = 1024
+    stream = Disk.request_stream(requests, cylinders, seed=3)
+    print(f"💿 Disk scheduling benchmark ({requests:,} requests, {cylinders} cylinders)")
+    print(f"  {'depth':>6} " + " ".join(f"{name:>12}" for name in Disk.ALGORITHMS) + f" {'seconds':>8}")
+    for depth in (8, 64, 512):
+        start = time.perf_counter()
+        totals = Disk.compare(stream, cylinders, depth=depth)
+        elapsed = time.perf_counter() - start
+        print(f"  {depth:>6} " + " ".join(f"{seek:>12,}" for seek in totals.values()) + f" {elapsed:>8.2f}")
+
+def benchmark_save(files: int = 20000, tail: int = SaveGame.SNAPSHOT_EVERY - 1):
+    """Save and load a large profile: a snapshot of `files` files plus a log tail of `tail` records"""
+    print(f"💾 Save/load benchmark ({files:,} files in the snapshot, {tail:,} records in the log)")
+    with tempfile.TemporaryDirectory() as directory:
+        kernel = GameKernel()
+        save_game = SaveGame(kernel, directory)
+        save_game.attach()
+        filesystem = kernel.filesystem
+        per_directory = 250
+        for i in range(files):
+            if i % per_directory == 0:
+                filesystem.mkdir(f"/home/player/d{i // per_directory}", game_action=False)
+            filesystem.create_file(f"/home/player/d{i // per_directory}/f{i}.txt", f"file {i}\n" * 8, game_action=False)
+        start = time.perf_counter()
+        save_game.save(snapshot=True)
+        handoff = time.perf_counter() - start
+        save_game.sync()
+        print(f"  snapshot   {time.perf_counter() - start:.3f}s on the writer ({handoff * 1000:.1f} ms on the caller), "
+              f"{os.path.getsize(save_game.snapshot_path) / 1024:,.0f} KB")
+
+        for i in range(tail):
+            filesystem.create_file(f"/tmp/t{i % 500}.txt", f"tail {i}", game_action=False)
+        start = time.perf_counter()
+        save_game.save()
+        handoff = time.perf_counter() - start
+        save_game.sync()
+        print(f"  log tail   {time.perf_counter() - start:.3f}s on the writer ({handoff * 1000:.1f} ms on the caller), "
+              f"{os.path.getsize(save_game.log_path) / 1024:,.0f} KB")
+
+        start = time.perf_counter()
+        state, records = SaveGame(GameKernel(), directory).read()
+        parse = time.perf_counter() - start
+        loaded = SaveGame(GameKernel(), directory)
+        start = time.perf_counter()
+        loaded.restore()
+        elapsed = time.perf_counter() - start
+        restored = sum(1 for _, node in loaded.kernel.filesystem.walk() if node["type"] == "file")
+        print(f"  load       {elapsed:.3f}s ({parse:.3f}s parsing {len(state['files']):,} entries and "
+              f"{len(records):,} log records), {restored:,} files restored")
+
+def benchmark_profiles(profiles: int = 1_000_000, lookups: int = 2000):
+    """Leaderboard queries against a profile store of `profiles` players"""
+    print(f"🥇 Profile store benchmark ({profiles:,} profiles)")
+    with tempfile.TemporaryDirectory() as directory:
+        store = ProfileStore(os.path.join(directory, "profiles.db"))
+        start = time.perf_counter()
+        store.seed(profiles)
+        elapsed = time.perf_counter() - start
+        print(f"  insert     {elapsed:.1f}s ({profiles / elapsed:,.0f} profiles/s in batches of {ProfileStore.BATCH})")
+
+        rng = random.Random(7)
+        names = [row[0] for row in store.db.execute("SELECT name FROM profiles WHERE id IN (%s)" % ",".join(
+            str(rng.randint(1, profiles)) for _ in range(lookups)))]
+        start = time.perf_counter()
+        for name in names:
+            store.rank(name)
+        print(f"  rank       {(time.perf_counter() - start) / len(names) * 1e3:.3f} ms per lookup")
+
+        for by in ProfileStore.SORT_KEYS:
+            start = time.perf_counter()
+            page = store.top(10, by)
+            first = time.perf_counter() - start
+            for _ in range(100):
+                page = store.top(10, by, (page[-1][by], page[-1]["id"]))
+            print(f"  top by {by:<12} {first * 1e3:.3f} ms first page, "
+                  f"{(time.perf_counter() - start - first) / 100 * 1e3:.3f} ms per next page")
+
+        start = time.perf_counter()
+        for name in names[:200]:
+            store.around(name, 15)
+        print(f"  around     {(time.perf_counter() - start) / 200 * 1e3:.3f} ms per page")
+        store.close()
+
+def benchmark_leaderboard(clients: int = 2000, requests: int = 20, players: int = 100_000):
+    """Load test: `clients` concurrent connections against a local LeaderboardServer"""
+    try:
+        import resource
+        soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+        if soft < clients * 2 + 64:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (min(hard, clients * 2 + 64), hard))
+    except (ImportError, ValueError, OSError):
+        pass  # Keep the platform limit
+
+    print(f"🌐 Leaderboard load test ({clients:,} clients x {requests} requests, {players:,} players)")
+    server = LeaderboardServer()
+    rng = random.Random(11)
+    server.load((f"player{i}", 1, int(rng.paretovariate(1.2) * 100), 0) for i in range(players))
+    port = server.start()
+    latencies = []
+
+    async def client(number: int):
+        client_rng = random.Random(number)
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        try:
+            for _ in range(requests):
+                roll = client_rng.random()
+                name = f"player{client_rng.randrange(players)}"
+                if roll < 0.3:
+                    request = {"op": "submit", "scores": [[name, 2, client_rng.randint(0, 10000), 1]]}
+                elif roll < 0.8:
+                    request = {"op": "rank", "name": name}
+                else:
+                    request = {"op": "top", "n": 10}
+                start = time.perf_counter()
+                writer.write(json.dumps(request).encode() + b"\n")
+                await writer.drain()
+                response = json.loads(await reader.readline())
+                latencies.append(time.perf_counter() - start)
+                if "error" in response:
+                    raise RuntimeError(response["error"])
+        finally:
+            writer.close()
+
+    async def run_clients():
+        return await asyncio.gather(*(client(number) for number in range(clients)), return_exceptions=True)
+
+    start = time.perf_counter()
+    results = asyncio.run(run_clients())
+    elapsed = time.perf_counter() - start
+    server.stop()
+
+    failures = [result for result in results if isinstance(result, Exception)]
+    latencies.sort()
+    print(f"  {len(latencies):,} requests in {elapsed:.2f}s ({len(latencies) / elapsed:,.0f} req/s), "
+          f"{len(failures)} failed clients")
+    if latencies:
+        print(f"  latency p50={latencies[len(latencies) // 2] * 1e3:.2f} ms "
+              f"p99={latencies[int(len(latencies) * 0.99)] * 1e3:.2f} ms")
+    print(f"  {server.batches:,} submission batches applied for {server.requests:,} requests")
+
+def benchmark_activity(events: int = 5_000_000):
+    """Record and aggregate a large activity log"""
+    print(f"📈 Activity log benchmark ({events:,} events)")
+    activity = ActivityLog()
+    rng = random.Random(3)
+    now = time.time()
+    start = time.perf_counter()
+    for i in range(events):
+        activity.record(rng.choice(ActivityLog.ACTIONS), rng.randint(0, 50), rng.randrange(1000),
+                        now - (events - i) * 0.5)
+    elapsed = time.perf_counter() - start
+    print(f"  record     {elapsed / events * 1e6:.2f} us per event, "
+          f"{sum(column.itemsize * len(column) for column in (activity.times, activity.actions, activity.xp, activity.subjects)) / 2**20:.0f} MB")
+    for name, aggregate in (("breakdown", activity.breakdown), ("hourly", activity.hourly), ("trend", activity.trend)):
+        start = time.perf_counter()
+        aggregate()
+        print(f"  {name:<10} {(time.perf_counter() - start) * 1e3:.1f} ms")
+
+def benchmark_challenge(commands: int = 200_000):
+    """Cost of the terminal command path's game bookkeeping with and without a speed challenge running"""
+    print(f"⚡ Speed challenge benchmark ({commands:,} commands)")
+    kernel = GameKernel()
+    game_manager = kernel.game_manager
+    challenge = SpeedChallenge(kernel, tempfile.mkdtemp())
+    timings = {"idle": [], "running": []}
+    for _ in range(5):
+        for label in timings:
+            if label == "running":
+                challenge.start()
+            start = time.perf_counter()
+            for _ in range(commands // 5):
+                game_manager.award("command", 5)
+                game_manager.bump("commands_executed")
+            timings[label].append((time.perf_counter() - start) / (commands // 5))
+            challenge.stop()
+    for label, samples in timings.items():
+        print(f"  {label:<8} {min(samples) * 1e6:.2f} us per command (best of {len(samples)})")
+
+def benchmark_treeview(sizes=(100, 1000, 10000), changed: float = 0.01):
+    """Process view refresh time against row count: rebuilding every row versus TreeviewSync"""
+    print("🌳 Treeview refresh benchmark")
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        print(f"  needs a display: {e}")
+        return
+    root.withdraw()
+    columns = ("PID", "Name", "State", "Memory", "CPU Time", "Command")
+    rng = random.Random(5)
+    for size in sizes:
+        processes = [{"pid": pid, "name": f"proc{pid}", "state": "ready", "memory": rng.randint(100, 500),
+                      "cpu_time": 0, "command": f"/usr/bin/proc{pid}"} for pid in range(size)]
+        rows = GameOSGUI.process_rows_for(processes)
+
+        tree = ttk.Treeview(root, columns=columns, show="headings")
+        start = time.perf_counter()
+        for _ in range(3):
+            tree.delete(*tree.get_children())
+            for _, values in rows:
+                tree.insert("", tk.END, values=values)
+        rebuild = (time.perf_counter() - start) / 3
+
+        sync = TreeviewSync(ttk.Treeview(root, columns=columns, show="headings"))
+        sync.update(rows)
+        start = time.perf_counter()
+        for _ in range(3):
+            sync.update(GameOSGUI.process_rows_for(processes))
+        steady = (time.perf_counter() - start) / 3
+        for proc in rng.sample(processes, max(1, int(size * changed))):
+            proc["cpu_time"] += 1
+        start = time.perf_counter()
+        touched = sync.update(GameOSGUI.process_rows_for(processes))
+        partial = time.perf_counter() - start
+        print(f"  {size:>6} rows: rebuild {rebuild * 1e3:8.1f} ms | diff, unchanged {steady * 1e3:6.1f} ms"
+              f" | diff, {touched} changed {partial * 1e3:6.1f} ms")
+    root.destroy()
+
+def benchmark_listing(files: int = 100_000, page: int = 60):
+    """Listing a huge directory: the full ls() against paged ls_page() calls"""
+    print(f"📂 Directory listing benchmark ({files:,} files)")
+    filesystem = GameFileSystem(GameManager())
+    filesystem.mkdir("/big", game_action=False)
+    rng = random.Random(11)
+    for i in range(files):
+        filesystem.create_file(f"/big/file{rng.randrange(10**9):09d}_{i}.txt", "x" * rng.randrange(100),
+                               game_action=False)
+    for label, call in (("ls (all entries)", lambda: filesystem.ls("/big")),
+                        ("ls_page, first (sorts)", lambda: filesystem.ls_page("/big", 0, page, "size")),
+                        ("ls_page, next page", lambda: filesystem.ls_page("/big", files // 2, page, "size")),
+                        ("ls_page, filtered", lambda: filesystem.ls_page("/big", 0, page, "name", False, "_77"))):
+        start = time.perf_counter()
+        call()
+        print(f"  {label:<24} {(time.perf_counter() - start) * 1e3:8.2f} ms")
+
+BENCHMARKS = {
+    "sync": benchmark_producer_consumer,
+    "alloc": benchmark_allocators,
+    "disk": benchmark_disk,
+    "save": benchmark_save,
+    "profiles": benchmark_profiles,
+    "leaderboard": benchmark_leaderboard,
+    "activity": benchmark_activity,
+    "challenge": benchmark_challenge,
+    "treeview": benchmark_treeview,
+    "listing": benchmark_listing,
+}
+
 if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--bench":
+        names = sys.argv[2:] or list(BENCHMARKS)
+        for bench_name in names:
+            BENCHMARKS[bench_name]()
+        sys.exit(0)
+
     try:
         print("🎮 Initializing PyOS GameOS...")
         app = GameOSGUI()